@@ -14,11 +14,23 @@ from aoc_manager.modules.solutions.server import solutions_server
 from aoc_manager.modules.solutions.ui import solutions_ui
 from aoc_manager.modules.solver.server import solver_server
 from aoc_manager.modules.solver.ui import solver_ui
+from aoc_manager.tables.log import partition_logs
+from aoc_manager.tools.import_solver import solver_index
+from aoc_manager.tools.log_retention import LogRetention, start_log_vacuum
 
 
 # Set module-level variables
 setlocale(LC_ALL, '')
 
+# Migrate aoc.log to per-run partitions once, before anything reads or expires it
+partition_logs()
+
+# Keep aoc.log bounded to recent runs without truncating it on every run
+start_log_vacuum(LogRetention())
+
+# Import every solver once up front; later lookups only re-import edited solvers
+solver_index.start_scan()
+
 # Define main app UI and its navbar panels
 app_ui: Tag = ui.page_fluid(
   ui.navset_bar(
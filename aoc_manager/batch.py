@@ -0,0 +1,128 @@
+import sys
+import traceback
+
+from argparse import ArgumentParser, Namespace
+from concurrent.futures import as_completed, Future, ProcessPoolExecutor
+from multiprocessing import get_context
+from os import cpu_count, getcwd
+
+from aoc_manager.tables.solution import \
+  table as tab_can_solution
+from aoc_manager.tools.import_solver import discover_solvers, import_solver
+from aoc_manager.tools.problem_solver import ProblemSolver
+from aoc_manager.tools.run_result import RunResult
+from aoc_manager.tools.solver_runner import execute_solver, get_run_result
+
+
+def run_day(year: int, day: int, test: bool, selection: str,
+            force: bool = False) -> RunResult:
+  """Runs one solver inside a worker process
+
+  Args:
+    year (int): the year of the solver
+    day (int): the day of the solver
+    test (bool): whether to run on the test inputs
+    selection (str): the parts to run, either 'a', 'b' or 'both'
+    force (bool): whether to run parts that have a cached answer
+
+  Returns:
+    result (RunResult): the solution rows and phase errors, without the solver's state
+  """
+  solver_class: type[ProblemSolver] | None = import_solver(year, day)
+  if solver_class is None:
+    return RunResult.failed(year, day, test, 'p', f'Error: no solver found for {year} day {day}.')
+
+  try:
+    solver: ProblemSolver = solver_class(year=str(year), test=test, debug=False)
+    solver.force = force
+  except Exception:
+    return RunResult.failed(year, day, test, 'p', traceback.format_exc())
+
+  errors: dict[str, str] = execute_solver(solver, selection)
+  return get_run_result(solver, selection, errors)
+
+
+def parse_args(args: list[str]) -> Namespace:
+  """Parses the batch runner's command line arguments
+
+  Args:
+    args (list[str]): the raw command line arguments
+
+  Returns:
+    namespace (Namespace): the parsed arguments
+  """
+  parser: ArgumentParser = ArgumentParser(
+    prog='batch',
+    description='Runs every discovered solver headlessly and saves the solutions.'
+  )
+  parser.add_argument('--years', type=int, nargs='*', help='Years to run (default: all)')
+  parser.add_argument('--days', type=int, nargs='*', help='Days to run (default: all)')
+  parser.add_argument('--mode', choices=['test', 'full', 'both'], default='both',
+                      help='Which inputs to run against')
+  parser.add_argument('--parts', choices=['a', 'b', 'both'], default='both',
+                      help='Which parts to run')
+  parser.add_argument('--force', action='store_true',
+                      help='Re-run parts whose solver source and input are unchanged')
+  parser.add_argument('--workers', type=int, default=cpu_count(),
+                      help='Number of worker processes (default: CPU count)')
+  return parser.parse_args(args)
+
+
+def main(args: list[str] | None = None) -> int:
+  namespace: Namespace = parse_args(sys.argv[1:] if args is None else args)
+
+  # Solver modules are imported relative to the working directory, like the app
+  if getcwd() not in sys.path:
+    sys.path.insert(0, getcwd())
+
+  jobs: list[tuple[int, int, bool]] = [
+    (year, day, test)
+    for year, day in discover_solvers()
+    if (not namespace.years or year in namespace.years)
+    and (not namespace.days or day in namespace.days)
+    for test in {'test': [True], 'full': [False], 'both': [True, False]}[namespace.mode]
+  ]
+  if not jobs:
+    print('No solvers found.')
+    return 0
+
+  rows: list[dict] = []
+  failures: int = 0
+
+  # Spawned workers avoid forking the parent's Delta Lake runtime threads
+  with ProcessPoolExecutor(max_workers=namespace.workers, mp_context=get_context('spawn')) as pool:
+    futures: dict[Future, tuple[int, int, bool]] = {
+      pool.submit(run_day, year, day, test, namespace.parts, namespace.force): (year, day, test)
+      for year, day, test in jobs
+    }
+    for future in as_completed(futures):
+      year, day, test = futures[future]
+      label: str = f'{year} day {day:>2} ({"test" if test else "full"})'
+      try:
+        result: RunResult = future.result()
+      except Exception as e:
+        result: RunResult = RunResult.failed(year, day, test, 'p', repr(e))
+
+      rows.extend(result.rows)
+      summary: list[str] = [
+        f'{row["part"].upper()}={row["answer"]} ({row["processing_time"]:.4f}s)'
+        for row in result.rows
+      ] + [
+        f'{part.upper()}={getattr(result, f"answer_{part}")} (cached)'
+        for part in result.cached_parts
+      ]
+      print(f'{label}: {" ".join(summary) or "no answers"}')
+      for phase, error in result.errors.items():
+        failures += 1
+        print(f'{label}: error in {phase}\n{error}', file=sys.stderr)
+
+  # One bulk append keeps the whole sweep to a single Delta commit
+  if rows:
+    tab_can_solution.append(rows)
+
+  print(f'Saved {len(rows)} solutions with {failures} failures.')
+  return 1 if failures else 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -1,8 +1,14 @@
+from os import path
 from shiny import run_app
 
 
 def main() -> None:
-  run_app('aoc_manager.app:app', reload=True)
+  # Only app code restarts the server; solvers are reloaded in place by the solver index
+  run_app(
+    'aoc_manager.app:app',
+    reload=True,
+    reload_dirs=[path.dirname(path.abspath(__file__))]
+  )
 
 
 if __name__ == '__main__':
@@ -1,21 +1,39 @@
+import polars as pl
+
+from asyncio import to_thread
 from os import getcwd, makedirs, path
 from shiny import (
   Inputs,
   module,
   Outputs,
   reactive,
+  render,
   Session,
   ui
 )
-from typing import Any
+from shiny.reactive import Value
+from typing import Any, Optional
 
 from aoc_manager.tables.input import \
   table as tab_aoc_input
+from aoc_manager.tables.example_case import \
+  table as tab_aoc_example_case
+from aoc_manager.tools.delete import delete_rows
 from aoc_manager.tools.solver_template import solver_template
+from aoc_manager.tools.example_cases import \
+  CaseResult, \
+  default_case_id, \
+  ExampleCase, \
+  get_example_cases, \
+  run_example_cases
 
 
 @module.server
 def inputs_server(input: Inputs, output: Outputs, session: Session) -> None:
+  # Define reactive values scoped to this session
+  cases_version: Value = Value(0)
+  case_results: Value = Value([])
+
   @reactive.effect
   @reactive.event(input.btn_create_new_solver)
   def btn_create_new_solver() -> None:
@@ -102,3 +120,170 @@ def inputs_server(input: Inputs, output: Outputs, session: Session) -> None:
       duration=3,
       type='message'
     )
+
+  @reactive.calc
+  def example_cases() -> list[ExampleCase]:
+    """Retrieves the day's example cases, refreshed whenever a case is saved or deleted"""
+    cases_version.get()
+    return get_example_cases(input.num_input_year(), input.num_input_day())
+
+  @reactive.effect
+  @reactive.event(input.btn_save_case)
+  def btn_save_case() -> None:
+    case_id: str = input.txt_case_id().strip()
+    if not case_id or not input.txt_case_input():
+      ui.notification_show(
+        'Error: a case needs a name and an input.',
+        duration=3,
+        type='error'
+      )
+      return
+
+    tab_aoc_example_case.upsert({
+      'year': input.num_input_year(),
+      'day': input.num_input_day(),
+      'part': input.sel_case_part(),
+      'case_id': case_id,
+      'input': input.txt_case_input(),
+      'expected': input.txt_case_expected().strip()
+    })
+    cases_version.set(cases_version.get() + 1)
+    ui.notification_show(
+      'Example case was saved successfully!',
+      duration=2,
+      type='message'
+    )
+
+  @reactive.effect
+  @reactive.event(input.btn_delete_case)
+  def btn_delete_case() -> None:
+    case_id: str = input.txt_case_id().strip()
+    if not case_id:
+      ui.notification_show(
+        'Error: enter the name of the case to delete.',
+        duration=3,
+        type='error'
+      )
+      return
+
+    deleted: bool = delete_rows(tab_aoc_example_case, {
+      'year': int(input.num_input_year()),
+      'day': int(input.num_input_day()),
+      'part': input.sel_case_part(),
+      'case_id': case_id
+    })
+    if not deleted:
+      # The default example is built from the day's inputs unless a saved case replaces it
+      if case_id == default_case_id:
+        message: str = 'Warning: the example case comes from the saved inputs; ' \
+          'clear its expected answer to remove it.'
+      else:
+        message: str = f'Warning: no saved case named {case_id} was found for this part.'
+      ui.notification_show(message, duration=3, type='warning')
+      return
+
+    cases_version.set(cases_version.get() + 1)
+    ui.notification_show(
+      'Example case was deleted.',
+      duration=2,
+      type='message'
+    )
+
+  @reactive.effect
+  def _() -> None:
+    """Loads the selected case into the editor"""
+    rows: Optional[tuple[int, ...]] = tbl_example_cases.cell_selection()['rows']
+    if not rows:
+      return
+    with reactive.isolate():
+      case: ExampleCase = example_cases()[rows[0]]
+    ui.update_select('sel_case_part', selected=case.part)
+    ui.update_text('txt_case_id', value=case.case_id)
+    ui.update_text('txt_case_expected', value=case.expected)
+    ui.update_text_area('txt_case_input', value=case.input_text)
+
+  @reactive.extended_task
+  async def run_cases_task(year: int, day: int, cases: list[ExampleCase]) -> list[CaseResult]:
+    """Runs the cases on a process pool without blocking the event loop"""
+    return await to_thread(run_example_cases, year, day, cases)
+
+  @reactive.effect
+  @reactive.event(input.btn_run_cases)
+  def btn_run_cases() -> None:
+    cases: list[ExampleCase] = example_cases()
+    if not cases:
+      ui.notification_show(
+        'No example cases found for this day.',
+        duration=3,
+        type='warning'
+      )
+      return
+    ui.update_action_button('btn_run_cases', disabled=True)
+    run_cases_task.invoke(input.num_input_year(), input.num_input_day(), cases)
+
+  @reactive.effect
+  def _() -> None:
+    """Publishes the results of a finished run of the cases"""
+    status: str = run_cases_task.status()
+    if status == 'error':
+      ui.update_action_button('btn_run_cases', disabled=False)
+      ui.notification_show(
+        f'Error while running the cases: {run_cases_task.error.get()!r}',
+        duration=5,
+        type='error'
+      )
+      return
+    if status != 'success':
+      return
+    results: list[CaseResult] = run_cases_task.value.get()
+    case_results.set(results)
+    ui.update_action_button('btn_run_cases', disabled=False)
+    failed: int = sum(not result.passed for result in results)
+    ui.notification_show(
+      f'{len(results) - failed} of {len(results)} cases passed.',
+      duration=3,
+      type='message' if not failed else 'warning'
+    )
+
+  @render.data_frame
+  def tbl_example_cases() -> render.DataTable:
+    cases: list[ExampleCase] = example_cases()
+    df: pl.DataFrame = pl.DataFrame(
+      data=[{
+        'Part': case.part.upper(),
+        'Case': case.case_id,
+        'Expected': case.expected,
+        'Input': case.input_text.splitlines()[0] if case.input_text else ''
+      } for case in cases],
+      schema=['Part', 'Case', 'Expected', 'Input']
+    )
+    return render.DataTable(
+      data=df,
+      width='100%',
+      height='250px',
+      summary=False,
+      selection_mode='row'
+    )
+
+  @render.data_frame
+  def tbl_case_results() -> render.DataTable:
+    """Renders the pass/fail matrix of the cases, one row per case and one column per part"""
+    results: list[CaseResult] = case_results.get()
+    matrix: dict[str, dict[str, str]] = {}
+    for result in results:
+      if result.passed:
+        cell: str = f'Pass ({result.processing_time:.4f}s)'
+      elif result.error:
+        cell: str = f'Error: {result.error.strip().splitlines()[-1]}'
+      else:
+        cell: str = f'Fail: got {result.answer}, expected {result.expected}'
+      matrix.setdefault(result.case_id, {'Case': result.case_id})[f'Part {result.part.upper()}'] = cell
+    df: pl.DataFrame = pl.DataFrame(
+      data=[{'Part A': '', 'Part B': '', **row} for row in matrix.values()],
+      schema=['Case', 'Part A', 'Part B']
+    )
+    return render.DataTable(
+      data=df,
+      width='100%',
+      summary=False
+    )
@@ -69,5 +69,50 @@ def inputs_ui() -> Tag:
         id='txt_test_b_solution',
         label='Part B Expected Solution'
       ),
+    ),
+    ui.card(
+      ui.card_header('Example Cases'),
+      ui.layout_columns(
+        ui.input_select(
+          id='sel_case_part',
+          label='Part',
+          choices={'a': 'A', 'b': 'B'},
+          selected='a'
+        ),
+        ui.input_text(
+          id='txt_case_id',
+          label='Case Name'
+        ),
+        ui.input_text(
+          id='txt_case_expected',
+          label='Expected Solution'
+        )
+      ),
+      ui.input_text_area(
+        id='txt_case_input',
+        label='Case Input',
+        width='50%',
+        height='200px'
+      ),
+      ui.layout_columns(
+        ui.input_action_button(
+          id='btn_save_case',
+          label='Save Case',
+          class_='btn btn-primary'
+        ),
+        ui.input_action_button(
+          id='btn_delete_case',
+          label='Delete Case',
+          class_='btn btn-warning'
+        ),
+        ui.input_action_button(
+          id='btn_run_cases',
+          label='Run All Cases',
+          class_='btn btn-success'
+        )
+      ),
+      ui.output_data_frame('tbl_example_cases'),
+      ui.card_header('Results'),
+      ui.output_data_frame('tbl_case_results')
     )
   )
\ No newline at end of file
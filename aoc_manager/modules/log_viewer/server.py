@@ -0,0 +1,100 @@
+import polars as pl
+
+from shiny import (
+  Inputs,
+  module,
+  Outputs,
+  reactive,
+  render,
+  Session,
+  ui
+)
+from shiny.reactive import Value
+from typing import Callable
+
+from aoc_manager.tables.log import scan_run_logs
+
+
+log_columns: list[str] = ['data', 'label']
+
+
+@module.server
+def log_viewer_server(input: Inputs, output: Outputs, session: Session,
+                      run_id: Callable[[], str], context: str) -> None:
+  """Serves one page of a run's debug logs at a time
+
+  The run, phase, label and search filters and the page window are pushed into
+  a lazy scan of the log table, so only the visible page is ever materialised.
+
+  Args:
+    run_id (Callable[[], str]): reactive getter of the run whose logs are shown
+    context (str): the phase whose logs are shown, e.g. 'Part A'
+  """
+  page: Value = Value(0)
+
+  @reactive.calc
+  @reactive.event(input.btn_fetch_logs, ignore_none=False)
+  def logs_query() -> pl.LazyFrame:
+    """Builds the filtered scan of the logs, refreshed whenever Fetch Logs is clicked"""
+    current_run_id: str = run_id()
+    if not current_run_id:
+      return pl.LazyFrame(schema={column: pl.String for column in log_columns})
+
+    predicate: pl.Expr = pl.col('context') == context
+    label: str = input.txt_label().strip()
+    if label:
+      predicate &= pl.col('label') == label
+    search: str = input.txt_search()
+    if search:
+      predicate &= pl.col('data').str.contains(search, literal=True)
+    return scan_run_logs(current_run_id) \
+      .filter(predicate) \
+      .select(log_columns)
+
+  @reactive.calc
+  def log_count() -> int:
+    return logs_query().select(pl.len()).collect().item()
+
+  @reactive.calc
+  def page_size() -> int:
+    return max(input.num_page_size() or 100, 1)
+
+  @reactive.calc
+  def page_count() -> int:
+    return max(-(-log_count() // page_size()), 1)
+
+  @reactive.effect
+  def _() -> None:
+    """Returns to the first page whenever the matching logs change"""
+    logs_query()
+    page_size()
+    page.set(0)
+
+  @reactive.effect
+  def _() -> None:
+    ui.update_action_button('btn_fetch_logs', disabled=not run_id())
+    ui.update_action_button('btn_previous_page', disabled=page.get() == 0)
+    ui.update_action_button('btn_next_page', disabled=page.get() >= page_count() - 1)
+
+  @reactive.effect
+  @reactive.event(input.btn_previous_page)
+  def btn_previous_page() -> None:
+    page.set(max(page.get() - 1, 0))
+
+  @reactive.effect
+  @reactive.event(input.btn_next_page)
+  def btn_next_page() -> None:
+    page.set(min(page.get() + 1, page_count() - 1))
+
+  @render.text
+  def txt_page() -> str:
+    return f'Page {page.get() + 1:,} of {page_count():,} ({log_count():,} lines)'
+
+  @render.data_frame
+  def tbl_logs() -> render.DataTable:
+    return render.DataTable(
+      data=logs_query().slice(page.get() * page_size(), page_size()).collect(),
+      width='100%',
+      height='300px',
+      summary=False
+    )
@@ -0,0 +1,51 @@
+from shiny import module, ui
+from shiny.ui import Tag
+
+
+@module.ui
+def log_viewer_ui() -> Tag:
+  return ui.TagList(
+    ui.card_header('Debug Logs'),
+    ui.layout_columns(
+      ui.input_text(
+        id='txt_search',
+        label='Search',
+        placeholder='Text in the log line; applied on fetch'
+      ),
+      ui.input_text(
+        id='txt_label',
+        label='Label',
+        placeholder='Exact label; applied on fetch'
+      ),
+      ui.input_numeric(
+        id='num_page_size',
+        label='Rows per Page',
+        update_on='blur',
+        value=100,
+        min=10,
+        max=10_000,
+        step=10
+      )
+    ),
+    ui.output_data_frame('tbl_logs'),
+    ui.card_footer(
+      ui.layout_columns(
+        ui.input_action_button(
+          id='btn_fetch_logs',
+          label='Fetch Logs',
+          class_='btn btn-primary'
+        ),
+        ui.input_action_button(
+          id='btn_previous_page',
+          label='Previous',
+          class_='btn btn-secondary'
+        ),
+        ui.output_text('txt_page'),
+        ui.input_action_button(
+          id='btn_next_page',
+          label='Next',
+          class_='btn btn-secondary'
+        )
+      )
+    )
+  )
@@ -1,7 +1,10 @@
 import polars as pl
 import traceback
 
-from datetime import datetime
+from asyncio import get_running_loop
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from functools import partial
 from pyperclip import copy as copy_to_clipboard
 from shiny import (
   Inputs,
@@ -14,44 +17,157 @@ from shiny import (
 )
 from shiny.reactive import Value
 from shiny.ui import Tag
-from typing import Optional
+from typing import Any, Iterator, Optional
 
+from aoc_manager.modules.log_viewer.server import log_viewer_server
+from aoc_manager.tables.benchmark import \
+  table as tab_aoc_benchmark
 from aoc_manager.tables.guess import \
   table as tab_std_guess
-from aoc_manager.tables.log import \
-  table as tab_std_log
+from aoc_manager.tables.profile import \
+  table as tab_aoc_profile
+from aoc_manager.tables.profile_stack import \
+  table as tab_aoc_profile_stack
 from aoc_manager.tables.solution import \
   table as tab_can_solution
-from aoc_manager.tools.import_solver import import_solver
+from aoc_manager.tools.executor import \
+  ExecutionLimits, \
+  phase_names, \
+  run_benchmark_isolated, \
+  run_isolated
+from aoc_manager.tools.import_solver import solver_index
+from aoc_manager.tools.log import LogSettings
+from aoc_manager.tools.phase_metrics import PhaseMetrics
 from aoc_manager.tools.problem_solver import ProblemSolver
+from aoc_manager.tools.profiler import FunctionStats, get_profile_rows, PhaseProfile
+from aoc_manager.tools.run_registry import run_registry, RunState
+from aoc_manager.tools.run_result import RunResult
 
 
-# Define reactive values for the solver page
-solution_data: Value = Value({})
-debug_logs_pre: Value = Value([])
-debug_logs_a: Value = Value([])
-debug_logs_b: Value = Value([])
-error_message_pre: Value = Value('')
-error_message_a: Value = Value('')
-error_message_b: Value = Value('')
+# Worker threads that wait on solver child processes so runs never block the event loop
+run_pool: ThreadPoolExecutor = ThreadPoolExecutor(
+  max_workers=8,
+  thread_name_prefix='solver-run'
+)
+
+
+def execute_run(run_id: str, **kwargs: Any) -> str:
+  """Runs a solver in a child process and publishes its progress to the run registry
+
+  This runs on a worker thread, so it saves the solution rows itself and never
+  touches session state. The run is always finished in the registry, with the
+  traceback as a failed result if running or saving raised.
+
+  Args:
+    run_id (str): the id of the registered run
+    kwargs (Any): the arguments of run_isolated
+
+  Returns:
+    run_id (str): the id of the finished run
+  """
+  result: Optional[RunResult] = None
+  try:
+    result = run_isolated(
+      on_update=lambda phase, result: run_registry.start_phase(run_id, phase, result),
+      cancel=run_registry.get_cancel_event(run_id),
+      **kwargs
+    )
+    if result.rows:
+      tab_can_solution.append(list(result.rows))
+    if result.profiles:
+      function_rows, stack_rows = get_profile_rows(result.run_id, result.profiles)
+      tab_aoc_profile.append(function_rows)
+      tab_aoc_profile_stack.append(stack_rows)
+  except Exception:
+    error: str = traceback.format_exc()
+    # Keep the answers of a run whose results could not be saved
+    result = RunResult.failed(kwargs['year'], kwargs['day'], kwargs['test'], 'p', error) \
+      if result is None else replace(result, errors={**result.errors, 'p': error})
+  finally:
+    # Always finish the run so the sessions polling it stop waiting
+    run_registry.finish(run_id, result if result is not None else RunResult.failed(
+      kwargs['year'], kwargs['day'], kwargs['test'], 'p', 'Error: the run was interrupted.'
+    ))
+  return run_id
+
+
+def execute_benchmark(**kwargs: Any) -> list[dict[str, Any]]:
+  """Benchmarks a solver in a child process and saves its statistics
+
+  Like execute_run, this runs on a worker thread and never touches session state.
+
+  Args:
+    kwargs (Any): the arguments of run_benchmark_isolated
+
+  Returns:
+    rows (list[dict[str, Any]]): the saved aoc.benchmark rows
+  """
+  rows: list[dict[str, Any]] = run_benchmark_isolated(**kwargs)
+  tab_aoc_benchmark.append(rows)
+  return rows
+
+
+def format_metrics(metrics: Optional[PhaseMetrics]) -> Tag:
+  """Formats the CPU, GC and memory metrics of a phase
+
+  Args:
+    metrics (Optional[PhaseMetrics]): the metrics of the phase, if it has run
+
+  Returns:
+    tag (Tag): a line summarizing the metrics
+  """
+  if metrics is None:
+    return ui.p('')
+  summary: str = f'CPU time: {round(metrics.cpu_time, 5)}s' \
+    f' | GC: {metrics.gc_collections} collections in {round(metrics.gc_time, 5)}s'
+  if metrics.peak_memory_bytes:
+    summary += f' | Peak memory: {metrics.peak_memory_bytes / 1024 ** 2:,.2f} MiB'
+  return ui.p(summary)
 
 
 @module.server
 def solver_server(input: Inputs, output: Outputs, session: Session) -> None:
+  # Define reactive values scoped to this session
+  solution_data: Value = Value(RunResult())
+  error_message_pre: Value = Value('')
+  error_message_a: Value = Value('')
+  error_message_b: Value = Value('')
+  benchmark_data: Value = Value([])
+  run_state: Value = Value(None)
+  test_solution_data: Value = Value(RunResult())
+  test_run_state: Value = Value(None)
+
+  # Page through each phase's debug logs of the displayed run
+  for log_viewer_id, context in [
+    ('logs_pre', 'Pre-Processor'),
+    ('logs_a', 'Part A'),
+    ('logs_b', 'Part B')
+  ]:
+    log_viewer_server(
+      log_viewer_id,
+      run_id=lambda: solution_data.get().run_id,
+      context=context
+    )
+
   @reactive.effect
   def _() -> None:
     """Generic reactive effects for site use"""
     year: int = input.num_year()
     day: int = input.num_day()
-    data: dict = solution_data.get()
-    solution_a_exists: bool = data.get('answer_a', None) is not None
-    solution_b_exists: bool = data.get('answer_a', None) is not None
-    is_test: bool = data.get('test', False)
-    solver: Optional[ProblemSolver] = import_solver(year, day)
-    ui.update_action_button('btn_run', disabled=solver is None)
-    ui.update_action_button('btn_fetch_debug_logs_pre', disabled=data == {})
-    ui.update_action_button('btn_fetch_debug_logs_a', disabled=not solution_a_exists)
-    ui.update_action_button('btn_fetch_debug_logs_b', disabled=not solution_b_exists)
+    result: RunResult = solution_data.get()
+    solution_a_exists: bool = result.answer_a is not None
+    solution_b_exists: bool = result.answer_b is not None
+    is_test: bool = result.test
+    solver: Optional[type[ProblemSolver]] = solver_index.get_solver(year, day)
+    running: bool = any(
+      state is not None and not state.finished
+      for state in [run_state.get(), test_run_state.get()]
+    )
+    ui.update_action_button('btn_run', disabled=solver is None or running)
+    ui.update_action_button(
+      'btn_benchmark',
+      disabled=solver is None or benchmark_task.status() == 'running'
+    )
     ui.update_action_button('btn_a_too_low', disabled=not solution_a_exists or is_test)
     ui.update_action_button('btn_a_correct', disabled=not solution_a_exists or is_test)
     ui.update_action_button('btn_a_too_high', disabled=not solution_a_exists or is_test)
@@ -68,142 +184,263 @@ def solver_server(input: Inputs, output: Outputs, session: Session) -> None:
     """
     return f'Advent of Code {input.num_year()}: Day {input.num_day()}'
 
+  async def run_in_pool(run_id: str, limits: ExecutionLimits, **kwargs: Any) -> str:
+    """Runs the solver on the worker pool without blocking the event loop"""
+    return await get_running_loop().run_in_executor(
+      run_pool,
+      partial(execute_run, run_id=run_id, limits=limits, **kwargs)
+    )
+
+  @reactive.extended_task
+  async def run_task(run_id: str, limits: ExecutionLimits, **kwargs: Any) -> str:
+    return await run_in_pool(run_id, limits, **kwargs)
+
+  @reactive.extended_task
+  async def test_run_task(run_id: str, limits: ExecutionLimits, **kwargs: Any) -> str:
+    """Runs the test inputs alongside the full inputs in Test + Full mode"""
+    return await run_in_pool(run_id, limits, **kwargs)
+
   @reactive.effect
   @reactive.event(input.btn_run)
   def btn_run() -> None:
     year: int = input.num_year()
     day: int = input.num_day()
-    debug: bool = input.chk_debug()
-    mask_answers: bool = input.chk_mask_answers()
-    test: bool = input.chk_test()
+    test_and_full: bool = input.chk_test_and_full()
+    # In Test + Full mode the displayed run is the full one
+    test: bool = input.chk_test() and not test_and_full
     selection: str = input.sel_day_part()
-    solution_data.set({})
+    solution_data.set(RunResult())
+    test_solution_data.set(RunResult())
+    test_run_state.set(None)
     error_message_pre.set('')
     error_message_a.set('')
     error_message_b.set('')
-    tab_std_log.truncate()
-
-    try:
-      solver: ProblemSolver = import_solver(year, day)(
-        year=str(year),
-        debug=debug,
-        mask_answers=mask_answers,
-        test=test
-      )
-    except FileNotFoundError:
-      error_message_pre.set(traceback.format_exc())
+
+    run_kwargs: dict[str, Any] = {
+      'limits': get_execution_limits(),
+      'year': year,
+      'day': day,
+      'selection': selection,
+      'debug': input.chk_debug(),
+      'mask_answers': input.chk_mask_answers(),
+      'trace_memory': input.chk_trace_memory(),
+      'profile_mode': input.sel_profile_mode() or None,
+      'force': input.chk_force_run(),
+      'log_settings': get_log_settings()
+    }
+    run_id: str = run_registry.create(year, day, test, selection)
+    run_state.set(run_registry.get(run_id))
+    run_task.invoke(run_id=run_id, test=test, **run_kwargs)
+
+    if test_and_full:
+      test_run_id: str = run_registry.create(year, day, True, selection)
+      test_run_state.set(run_registry.get(test_run_id))
+      test_run_task.invoke(run_id=test_run_id, test=True, **run_kwargs)
+
+  @reactive.effect
+  def poll_run_state() -> None:
+    """Follows this session's run in the registry, updating only on new versions"""
+    current: Optional[RunState] = run_state.get()
+    if current is None or current.finished:
+      return
+    reactive.invalidate_later(0.25)
+    latest: Optional[RunState] = run_registry.get(current.run_id)
+    if latest is None or latest.version == current.version:
+      return
+    run_state.set(latest)
+    if latest.result is not None:
+      solution_data.set(latest.result)
+    if latest.finished:
+      handle_run_result(latest.result)
+
+  @reactive.effect
+  def poll_test_run_state() -> None:
+    """Follows this session's Test + Full test run in the registry"""
+    current: Optional[RunState] = test_run_state.get()
+    if current is None or current.finished:
+      return
+    reactive.invalidate_later(0.25)
+    latest: Optional[RunState] = run_registry.get(current.run_id)
+    if latest is None or latest.version == current.version:
+      return
+    test_run_state.set(latest)
+    if latest.result is not None:
+      test_solution_data.set(latest.result)
+    if latest.finished:
+      handle_test_result(latest.result)
+
+  def handle_test_result(result: RunResult) -> None:
+    """Reports the test run of Test + Full mode, aborting the full run on a mismatch if asked to
+
+    Args:
+      result (RunResult): the test run's final results
+    """
+    mismatched: list[str] = result.get_mismatched_parts()
+    if not mismatched:
+      ui.notification_show('Test answers match!', duration=2, type='message')
+      return
+
+    message: str = 'Test mismatch in ' \
+      + ' and '.join(f'Part {part.upper()}' for part in mismatched)
+    with reactive.isolate():
+      abort: bool = input.chk_abort_on_mismatch()
+      full_run: Optional[RunState] = run_state.get()
+    if abort and full_run is not None and not full_run.finished:
+      run_registry.cancel(full_run.run_id)
+      message += ': aborted the full run.'
+    ui.notification_show(message, duration=5, type='error')
+
+  def handle_run_result(result: RunResult) -> None:
+    """Displays the errors of a finished run
+
+    Args:
+      result (RunResult): the run's final results
+    """
+    error_messages: dict[str, Value] = {
+      'p': error_message_pre,
+      'a': error_message_a,
+      'b': error_message_b
+    }
+    if result.cached_parts:
       ui.notification_show(
-        'Error during solver import: Please read error message for traceback.',
+        f'Loaded cached {" and ".join(f"Part {part.upper()}" for part in result.cached_parts)}:'
+        ' the solver and input are unchanged.',
         duration=3,
-        type='error'
+        type='message'
       )
-      return
-
-    try:
-      solver.preprocess_inputs()
-    except Exception:
-      error_message_pre.set(traceback.format_exc())
+    for phase, error in result.errors.items():
+      error_messages[phase].set(error)
       ui.notification_show(
-        'Error during pre-processing: Please read error message for traceback.',
+        f'Error during {phase_names[phase]}: Please read error message for traceback.',
         duration=3,
         type='error'
       )
-    else:
-      if selection in ['a', 'both']:
-        try:
-          solver.run_a()
-        except Exception:
-          error_message_a.set(traceback.format_exc())
-          ui.notification_show(
-            'Error during A: Please read error message for traceback.',
-            duration=3,
-            type='error'
-          )
-        else:
-          tab_can_solution.append({
-            '_execution_ts': datetime.now(),
-            'id': solver.run_id_a,
-            'year': year,
-            'day': day,
-            'part': 'a',
-            'test_ind': test,
-            'answer': str(solver.answer_a),
-            'processing_time': solver.a_processing_time
-          })
-      if selection in ['b', 'both']:
-        try:
-          solver.run_b()
-        except Exception:
-          error_message_b.set(traceback.format_exc())
-          ui.notification_show(
-            'Error during B: Please read error message for traceback.',
-            duration=3,
-            type='error'
-          )
-        else:
-          tab_can_solution.append({
-            '_execution_ts': datetime.now(),
-            'id': solver.run_id_b,
-            'year': year,
-            'day': day,
-            'part': 'b',
-            'test_ind': test,
-            'answer': str(solver.answer_b),
-            'processing_time': solver.b_processing_time
-          })
-        solution_data.set(solver.__dict__)
 
-  @reactive.effect
-  @reactive.event(input.btn_fetch_debug_logs_pre)
-  def btn_fetch_debug_logs_pre() -> None:
-    limit: int = input.num_max_logs_pre()
-    df: pl.DataFrame = tab_std_log.get(
-      filter_conditions={
-        'year': input.num_year(),
-        'day': input.num_day(),
-        'context': 'Pre-Processor'
-      },
-      select=['data', 'label', 'context'],
-      limit=limit
+  @render.ui
+  def txt_dropped_logs() -> Tag:
+    result: RunResult = solution_data.get()
+    dropped: list[str] = [
+      f'{phase_names[phase]}: {count:,}'
+      for phase, count in result.dropped_logs.items()
+    ]
+    if not dropped:
+      return ui.p('')
+    return ui.p(f'Dropped log lines beyond the limit: {", ".join(dropped)}')
+
+  @render.ui
+  def txt_test_validation() -> Tag:
+    state: Optional[RunState] = test_run_state.get()
+    if state is None:
+      return ui.p('')
+    if not state.finished:
+      return ui.h5('Test run: ' + ', '.join(
+        f'{phase_names[phase]} {status}' for phase, status in state.statuses.items()
+      ))
+
+    result: RunResult = test_solution_data.get()
+    mismatched: list[str] = result.get_mismatched_parts()
+    validations: list[str] = []
+    for part in ['a', 'b']:
+      if part not in state.statuses:
+        continue
+      answer: str = 'XXXXX' if result.mask_answers else str(getattr(result, f'answer_{part}'))
+      expected: str = getattr(result, f'expected_{part}')
+      if 'p' in result.errors or part in result.errors:
+        validation: str = 'error'
+      elif not expected:
+        validation: str = f'{answer} (no expected answer)'
+      elif part in mismatched:
+        validation: str = f'{answer} is wrong, expected {"XXXXX" if result.mask_answers else expected}'
+      else:
+        validation: str = f'{answer} is correct'
+      validations.append(f'Part {part.upper()}: {validation}')
+    return ui.h5(f'Test run: {" | ".join(validations)}')
+
+  @render.ui
+  def txt_run_status() -> Tag:
+    state: Optional[RunState] = run_state.get()
+    if state is None:
+      return ui.p('')
+    return ui.p(' | '.join(
+      f'{phase_names[phase]}: {status}' for phase, status in state.statuses.items()
+    ))
+
+  def get_log_settings() -> LogSettings:
+    """Builds the debug log settings from the sidebar inputs
+
+    Returns:
+      log_settings (LogSettings): the per-phase limit, mode and label filter
+    """
+    labels: frozenset[str] = frozenset(
+      label.strip() for label in input.txt_log_labels().split(',') if label.strip()
+    )
+    return LogSettings(
+      limit=max(input.num_log_limit() or 1, 1),
+      mode=input.sel_log_mode(),
+      labels=labels or None
     )
-    debug_logs_pre.set(df.to_dicts())
 
-  @reactive.effect
-  @reactive.event(input.btn_fetch_debug_logs_a)
-  def btn_fetch_debug_logs_a() -> None:
-    limit: int = input.num_max_logs_a()
-    df: pl.DataFrame = tab_std_log.get(
-      filter_conditions={
-        'year': input.num_year(),
-        'day': input.num_day(),
-        'context': 'Part A'
-      },
-      select=['data', 'label', 'context'],
-      limit=limit
+  def get_execution_limits() -> ExecutionLimits:
+    """Builds the child-process limits from the sidebar inputs
+
+    Returns:
+      limits (ExecutionLimits): the limits, with zero meaning unrestricted
+    """
+    memory_limit_mb: int = input.num_memory_limit() or 0
+    cpu_limit: int = input.num_cpu_limit() or 0
+    return ExecutionLimits(
+      timeout=input.num_timeout() or None,
+      cpu_time=cpu_limit or None,
+      memory_bytes=memory_limit_mb * 1024 ** 2 or None
+    )
+
+  @reactive.extended_task
+  async def benchmark_task(limits: ExecutionLimits, **kwargs: Any) -> list[dict[str, Any]]:
+    """Benchmarks the solver on the worker pool without blocking the event loop"""
+    return await get_running_loop().run_in_executor(
+      run_pool,
+      partial(execute_benchmark, limits=limits, **kwargs)
     )
-    debug_logs_a.set(df.to_dicts())
 
   @reactive.effect
-  @reactive.event(input.btn_fetch_debug_logs_b)
-  def btn_fetch_debug_logs_b() -> None:
-    limit: int = input.num_max_logs_b()
-    df: pl.DataFrame = tab_std_log.get(
-      filter_conditions={
-        'year': input.num_year(),
-        'day': input.num_day(),
-        'context': 'Part B'
-      },
-      select=['data', 'label', 'context'],
-      limit=limit
+  @reactive.event(input.btn_benchmark)
+  def btn_benchmark() -> None:
+    error_message_pre.set('')
+    benchmark_task.invoke(
+      limits=get_execution_limits(),
+      year=input.num_year(),
+      day=input.num_day(),
+      test=input.chk_test(),
+      selection=input.sel_day_part(),
+      runs=input.num_benchmark_runs(),
+      warmups=input.num_benchmark_warmups()
     )
-    debug_logs_b.set(df.to_dicts())
+
+  @reactive.effect
+  def show_benchmark() -> None:
+    """Displays the statistics of a finished benchmark, or its error"""
+    status: str = benchmark_task.status()
+    if status == 'success':
+      benchmark_data.set(benchmark_task.value.get())
+    elif status == 'error':
+      error: BaseException = benchmark_task.error.get()
+      # The child's failures arrive as a RuntimeError holding its traceback
+      error_message_pre.set(
+        str(error) if isinstance(error, RuntimeError)
+        else ''.join(traceback.format_exception(error))
+      )
+      ui.notification_show(
+        'Error during benchmark: Please read error message for traceback.',
+        duration=3,
+        type='error'
+      )
 
   @reactive.effect
   @reactive.event(input.btn_copy_a)
   def btn_copy_a() -> None:
-    data: dict = solution_data.get()
+    result: RunResult = solution_data.get()
 
-    if not data.get('answer_a'):
+    if not result.answer_a:
       ui.notification_show(
         'Error: No answer generated.',
         type='error',
@@ -211,7 +448,7 @@ def solver_server(input: Inputs, output: Outputs, session: Session) -> None:
       )
       return
 
-    copy_to_clipboard(data.get('answer_a'))
+    copy_to_clipboard(result.answer_a)
     ui.notification_show(
       'Part A answer was copied to clipboard!',
       type='message',
@@ -221,13 +458,13 @@ def solver_server(input: Inputs, output: Outputs, session: Session) -> None:
   @reactive.effect
   @reactive.event(input.btn_a_too_low)
   def btn_a_too_low() -> None:
-    data: dict = solution_data.get()
+    result: RunResult = solution_data.get()
     tab_std_guess.upsert({
       'year': input.num_year(),
       'day': input.num_day(),
       'part': 'A',
-      'solution_id': data['run_id_a'],
-      'guess': str(data['answer_a']),
+      'solution_id': result.run_id_a,
+      'guess': str(result.answer_a),
       'comparison': 'l'
     })
     ui.notification_show(
@@ -239,13 +476,13 @@ def solver_server(input: Inputs, output: Outputs, session: Session) -> None:
   @reactive.effect
   @reactive.event(input.btn_a_correct)
   def btn_a_correct() -> None:
-    data: dict = solution_data.get()
+    result: RunResult = solution_data.get()
     tab_std_guess.upsert({
       'year': input.num_year(),
       'day': input.num_day(),
       'part': 'A',
-      'solution_id': data['run_id_a'],
-      'guess': str(data['answer_a']),
+      'solution_id': result.run_id_a,
+      'guess': str(result.answer_a),
       'comparison': 'c'
     })
     ui.notification_show(
@@ -257,13 +494,13 @@ def solver_server(input: Inputs, output: Outputs, session: Session) -> None:
   @reactive.effect
   @reactive.event(input.btn_a_too_high)
   def btn_a_too_high() -> None:
-    data: dict = solution_data.get()
+    result: RunResult = solution_data.get()
     tab_std_guess.upsert({
       'year': input.num_year(),
       'day': input.num_day(),
       'part': 'A',
-      'solution_id': data['run_id_a'],
-      'guess': str(data['answer_a']),
+      'solution_id': result.run_id_a,
+      'guess': str(result.answer_a),
       'comparison': 'h'
     })
     ui.notification_show(
@@ -276,13 +513,13 @@ def solver_server(input: Inputs, output: Outputs, session: Session) -> None:
   @reactive.effect
   @reactive.event(input.btn_b_too_low)
   def btn_b_too_low() -> None:
-    data: dict = solution_data.get()
+    result: RunResult = solution_data.get()
     tab_std_guess.upsert({
       'year': input.num_year(),
       'day': input.num_day(),
       'part': 'B',
-      'solution_id': data['run_id_b'],
-      'guess': str(data['answer_b']),
+      'solution_id': result.run_id_b,
+      'guess': str(result.answer_b),
       'comparison': 'l'
     })
     ui.notification_show(
@@ -294,13 +531,13 @@ def solver_server(input: Inputs, output: Outputs, session: Session) -> None:
   @reactive.effect
   @reactive.event(input.btn_b_correct)
   def btn_b_correct() -> None:
-    data: dict = solution_data.get()
+    result: RunResult = solution_data.get()
     tab_std_guess.upsert({
       'year': input.num_year(),
       'day': input.num_day(),
       'part': 'B',
-      'solution_id': data['run_id_b'],
-      'guess': str(data['answer_b']),
+      'solution_id': result.run_id_b,
+      'guess': str(result.answer_b),
       'comparison': 'c'
     })
     ui.notification_show(
@@ -312,13 +549,13 @@ def solver_server(input: Inputs, output: Outputs, session: Session) -> None:
   @reactive.effect
   @reactive.event(input.btn_b_too_high)
   def btn_b_too_high() -> None:
-    data: dict = solution_data.get()
+    result: RunResult = solution_data.get()
     tab_std_guess.upsert({
       'year': input.num_year(),
       'day': input.num_day(),
       'part': 'B',
-      'solution_id': data['run_id_b'],
-      'guess': str(data['answer_b']),
+      'solution_id': result.run_id_b,
+      'guess': str(result.answer_b),
       'comparison': 'h'
     })
     ui.notification_show(
@@ -330,9 +567,9 @@ def solver_server(input: Inputs, output: Outputs, session: Session) -> None:
   @reactive.effect
   @reactive.event(input.btn_copy_b)
   def btn_copy_b() -> None:
-    data: dict = solution_data.get()
+    result: RunResult = solution_data.get()
 
-    if not data.get('answer_b'):
+    if not result.answer_b:
       ui.notification_show(
         'Error: No answer generated.',
         type='error',
@@ -340,7 +577,7 @@ def solver_server(input: Inputs, output: Outputs, session: Session) -> None:
       )
       return
 
-    copy_to_clipboard(data.get('answer_b'))
+    copy_to_clipboard(result.answer_b)
     ui.notification_show(
       'Part B answer was copied to clipboard!',
       type='message',
@@ -348,65 +585,88 @@ def solver_server(input: Inputs, output: Outputs, session: Session) -> None:
     )
 
   @render.data_frame
-  def tbl_debug_pre() -> render.DataTable:
-    data: dict = debug_logs_pre.get()
+  def tbl_benchmark() -> render.DataTable:
+    data: list[dict] = benchmark_data.get()
+    phase_names: dict[str, str] = {'p': 'Pre-Processor', 'a': 'Part A', 'b': 'Part B'}
     df: pl.DataFrame = pl.DataFrame(
-      data=data,
-      schema=['data', 'label', 'context']
+      data=[{
+        'Phase': phase_names[row['phase']],
+        'Runs': row['runs'],
+        'Min (s)': round(row['min_time'], 6),
+        'Median (s)': round(row['median_time'], 6),
+        'P95 (s)': round(row['p95_time'], 6),
+        'Std Dev (s)': round(row['stddev_time'], 6)
+      } for row in data],
+      schema=['Phase', 'Runs', 'Min (s)', 'Median (s)', 'P95 (s)', 'Std Dev (s)']
     )
     return render.DataTable(
       data=df,
       width='100%',
-      height='300px',
-      filters=True,
       summary=False
     )
 
   @render.data_frame
-  def tbl_debug_a() -> render.DataTable:
-    data: dict = debug_logs_a.get()
+  def tbl_profile() -> render.DataTable:
+    profile: Optional[PhaseProfile] = solution_data.get().profiles.get(
+      input.sel_profile_phase()
+    )
+    functions: list[FunctionStats] = profile.get_top_functions(input.num_profile_top() or 25) \
+      if profile is not None else []
     df: pl.DataFrame = pl.DataFrame(
-      data=data,
-      schema=['data', 'label', 'context']
+      data=[{
+        'Function': stats.function,
+        'Calls': stats.calls,
+        'Self (s)': round(stats.self_time, 6),
+        'Cumulative (s)': round(stats.cumulative_time, 6)
+      } for stats in functions],
+      schema=['Function', 'Calls', 'Self (s)', 'Cumulative (s)']
     )
     return render.DataTable(
       data=df,
       width='100%',
-      height='300px',
-      filters=True,
       summary=False
     )
 
-  @render.data_frame
-  def tbl_debug_b() -> render.DataTable:
-    data: dict = debug_logs_b.get()
-    df: pl.DataFrame = pl.DataFrame(
-      data=data,
-      schema=['data', 'label', 'context']
+  @render.ui
+  def ui_profile_stacks() -> Tag:
+    profile: Optional[PhaseProfile] = solution_data.get().profiles.get(
+      input.sel_profile_phase()
     )
-    return render.DataTable(
-      data=df,
-      width='100%',
-      height='300px',
-      filters=True,
-      summary=False
+    if profile is not None and profile.mode != 'sampling':
+      return ui.p(
+        'Collapsed stacks are only recorded in Sampling mode, since cProfile '
+        'only knows the direct callers of each function.',
+        class_='text-muted mb-0'
+      )
+    return ui.download_button(
+      id='btn_download_stacks',
+      label='Download Collapsed Stacks',
+      class_='btn btn-secondary'
     )
 
+  @render.download(filename=lambda: f'profile_{input.sel_profile_phase()}.folded')
+  def btn_download_stacks() -> Iterator[str]:
+    profile: Optional[PhaseProfile] = solution_data.get().profiles.get(
+      input.sel_profile_phase()
+    )
+    if profile is not None:
+      yield profile.get_collapsed_stacks()
+
   @render.ui
   def txt_a_output() -> Tag:
-    data: dict = solution_data.get()
-    a_output: str = data.get('answer_a', '')
-    mask_answer: bool = data.get('mask_answers', False)
+    result: RunResult = solution_data.get()
+    a_output: Any = result.answer_a
+    mask_answer: bool = result.mask_answers
     if a_output:
       return ui.h2(f'Answer: {"XXXXX" if mask_answer else a_output}')
     return ui.h2('')
 
   @render.ui
   def txt_a_validation() -> Tag:
-    data: dict = solution_data.get()
-    a_output: int = int(data.get('answer_a', 0))
-    validation: int = int(data.get('expected_a', 0))
-    if not data.get('test', False) or not a_output:
+    result: RunResult = solution_data.get()
+    a_output: int = int(result.answer_a or 0)
+    validation: int = int(result.expected_a or 0)
+    if not result.test or not a_output:
       return ui.h4('')
     validation_str: str = ''
     if validation:
@@ -420,44 +680,56 @@ def solver_server(input: Inputs, output: Outputs, session: Session) -> None:
 
   @render.ui
   def txt_preprocessing_time() -> Tag:
-    data: dict = solution_data.get()
-    preprocessing_time: float = data.get('preprocessing_time')
+    result: RunResult = solution_data.get()
+    preprocessing_time: float = result.preprocessing_time
     if preprocessing_time is not None:
-      return ui.h5(f'Preprocessing time: {round(preprocessing_time, 5)}s')
+      return ui.TagList(
+        ui.h5(
+          f'Preprocessing time: {round(preprocessing_time, 5)}s'
+          + (
+            f' (restored from snapshot in {round(result.snapshot_restore_time, 5)}s)'
+            if result.snapshot_restored else ''
+          )
+        ),
+        format_metrics(result.preprocessing_metrics)
+      )
     return ui.h5('')
 
   @render.ui
   def txt_total_processing_time() -> Tag:
-    data: dict = solution_data.get()
-    total_time: float = data.get('total_processing_time')
+    result: RunResult = solution_data.get()
+    total_time: float = result.total_processing_time
     if total_time is not None:
       return ui.h4(f'Total processing time: {round(total_time, 5)}s')
     return ui.h4('')
   
   @render.ui
   def txt_a_processing_time() -> Tag:
-    data: dict = solution_data.get()
-    a_time: float = data.get('a_processing_time')
+    result: RunResult = solution_data.get()
+    a_time: float = result.a_processing_time
     if a_time is not None:
-      return ui.h4(f'Processing time: {round(a_time, 5)}s')
+      return ui.TagList(
+        ui.h4(f'Processing time: {round(a_time, 5)}s'),
+        format_metrics(result.a_metrics)
+      )
     return ui.h4('')
 
   @render.ui
   def txt_b_output() -> Tag:
-    data: dict = solution_data.get()
-    b_output: str = data.get('answer_b', '')
-    mask_answer: bool = data.get('mask_answers', False)
+    result: RunResult = solution_data.get()
+    b_output: Any = result.answer_b
+    mask_answer: bool = result.mask_answers
     if b_output:
       return ui.h2(f'Answer: {"XXXXX" if mask_answer else b_output}')
     return ui.h2('')
 
   @render.ui
   def txt_b_validation() -> Tag:
-    data: dict = solution_data.get()
-    b_output: int = int(data.get('answer_b') or 0)
-    validation: int = int(data.get('expected_b') or 0)
+    result: RunResult = solution_data.get()
+    b_output: int = int(result.answer_b or 0)
+    validation: int = int(result.expected_b or 0)
     validation_str: str = ''
-    if not data.get('test', False) or not b_output:
+    if not result.test or not b_output:
       return ui.h4('')
     if validation:
       if b_output < validation:
@@ -470,10 +742,13 @@ def solver_server(input: Inputs, output: Outputs, session: Session) -> None:
 
   @render.ui
   def txt_b_processing_time() -> Tag:
-    data: dict = solution_data.get()
-    a_time: float = data.get('b_processing_time')
-    if a_time is not None:
-      return ui.h4(f'Processing time: {round(a_time, 5)}s')
+    result: RunResult = solution_data.get()
+    b_time: float = result.b_processing_time
+    if b_time is not None:
+      return ui.TagList(
+        ui.h4(f'Processing time: {round(b_time, 5)}s'),
+        format_metrics(result.b_metrics)
+      )
     return ui.h4('')
 
   @render.code
@@ -2,6 +2,8 @@ from datetime import datetime
 from shiny import module, ui
 from shiny.ui import Tag
 
+from aoc_manager.modules.log_viewer.ui import log_viewer_ui
+
 
 @module.ui
 def solver_ui() -> Tag:
@@ -34,20 +36,112 @@ def solver_ui() -> Tag:
         label='Test',
         value=True
       ),
+      ui.input_checkbox(
+        id='chk_test_and_full',
+        label='Test + Full',
+        value=False
+      ),
+      ui.panel_conditional(
+        'input.chk_test_and_full',
+        ui.input_checkbox(
+          id='chk_abort_on_mismatch',
+          label='Abort Full Run on Test Mismatch',
+          value=True
+        )
+      ),
       ui.input_checkbox(
         id='chk_debug',
         label='Debug',
         value=False
       ),
+      ui.panel_conditional(
+        'input.chk_debug',
+        ui.input_numeric(
+          id='num_log_limit',
+          label='Log Lines per Phase',
+          value=10_000,
+          min=1,
+          step=1_000
+        ),
+        ui.input_select(
+          id='sel_log_mode',
+          label='Log Limit Mode',
+          choices={'head': 'Keep First', 'ring': 'Keep Last', 'sample': 'Sample'},
+          selected='head'
+        ),
+        ui.input_text(
+          id='txt_log_labels',
+          label='Log Labels',
+          placeholder='Comma-separated; empty keeps all'
+        )
+      ),
       ui.input_checkbox(
         id='chk_mask_answers',
         label='Mask Answers',
         value=False
       ),
+      ui.input_checkbox(
+        id='chk_trace_memory',
+        label='Trace Memory',
+        value=False
+      ),
+      ui.input_checkbox(
+        id='chk_force_run',
+        label='Force Re-run',
+        value=False
+      ),
+      ui.input_select(
+        id='sel_profile_mode',
+        label='Profile',
+        choices={'': 'Off', 'sampling': 'Sampling', 'cprofile': 'cProfile'},
+        selected=''
+      ),
+      ui.input_numeric(
+        id='num_timeout',
+        label='Timeout (s)',
+        value=600,
+        min=0,
+        step=1
+      ),
+      ui.input_numeric(
+        id='num_cpu_limit',
+        label='CPU Limit (s, 0 = none)',
+        value=0,
+        min=0,
+        step=1
+      ),
+      ui.input_numeric(
+        id='num_memory_limit',
+        label='Memory Limit (MiB, 0 = none)',
+        value=0,
+        min=0,
+        step=256
+      ),
       ui.input_action_button(
         id='btn_run',
         label='Run',
         class_='btn btn-success'
+      ),
+      ui.input_numeric(
+        id='num_benchmark_runs',
+        label='Benchmark Runs',
+        value=10,
+        min=1,
+        max=1_000,
+        step=1
+      ),
+      ui.input_numeric(
+        id='num_benchmark_warmups',
+        label='Benchmark Warmups',
+        value=2,
+        min=0,
+        max=100,
+        step=1
+      ),
+      ui.input_action_button(
+        id='btn_benchmark',
+        label='Benchmark',
+        class_='btn btn-info'
       )
     ),
     ui.layout_column_wrap(
@@ -55,29 +149,14 @@ def solver_ui() -> Tag:
         ui.card_header(ui.output_text('txt_day_information')),
         ui.card(
           ui.card_header('Pre-Processor'),
+          ui.output_ui('txt_run_status'),
+          ui.output_ui('txt_dropped_logs'),
+          ui.output_ui('txt_test_validation'),
           ui.output_ui('txt_total_processing_time'),
           ui.output_ui('txt_preprocessing_time'),
           ui.panel_conditional(
             'input.chk_debug',
-            ui.card_header('Debug Logs'),
-            ui.input_numeric(
-              id='num_max_logs_pre',
-              label='Limit',
-              update_on='blur',
-              width='20%',
-              value=1000,
-              min=1,
-              max=1_000_000,
-              step=1
-            ),
-            ui.output_data_frame('tbl_debug_pre'),
-            ui.card_footer(
-              ui.input_action_button(
-                id='btn_fetch_debug_logs_pre',
-                label='Fetch Logs',
-                class_='btn btn-primary'
-              )
-            )
+            log_viewer_ui('logs_pre')
           ),
             ui.output_code('txt_error_message_pre'),
         ),
@@ -88,7 +167,7 @@ def solver_ui() -> Tag:
             ui.output_ui('txt_a_validation'),
             ui.output_ui('txt_a_processing_time'),
             ui.panel_conditional(
-              'input.chk_test == false',
+              'input.chk_test == false || input.chk_test_and_full',
               ui.layout_columns(
                 ui.input_action_button(
                   id='btn_a_too_low',
@@ -115,25 +194,7 @@ def solver_ui() -> Tag:
             ui.output_code('txt_error_message_a'),
             ui.panel_conditional(
               'input.chk_debug',
-              ui.card_header('Debug Logs'),
-              ui.input_numeric(
-                id='num_max_logs_a',
-                label='Limit',
-                update_on='blur',
-                width='20%',
-                value=1000,
-                min=1,
-                max=1_000_000,
-                step=1
-              ),
-              ui.output_data_frame('tbl_debug_a'),
-              ui.card_footer(
-                ui.input_action_button(
-                  id='btn_fetch_debug_logs_a',
-                  label='Fetch Logs',
-                  class_='btn btn-primary'
-                )
-              )
+              log_viewer_ui('logs_a')
             ),
           ),
           ui.card(
@@ -142,7 +203,7 @@ def solver_ui() -> Tag:
             ui.output_ui('txt_b_validation'),
             ui.output_ui('txt_b_processing_time'),
             ui.panel_conditional(
-              'input.chk_test == false',
+              'input.chk_test == false || input.chk_test_and_full',
               ui.layout_columns(
                 ui.input_action_button(
                   id='btn_b_too_low',
@@ -169,28 +230,37 @@ def solver_ui() -> Tag:
             ui.output_code('txt_error_message_b'),
             ui.panel_conditional(
               'input.chk_debug',
-              ui.card_header('Debug Logs'),
-              ui.input_numeric(
-                id='num_max_logs_b',
-                label='Limit',
-                width='20%',
-                update_on='blur',
-                value=1000,
-                min=1,
-                max=1_000_000,
-                step=1
-              ),
-              ui.output_data_frame('tbl_debug_b'),
-              ui.card_footer(
-                ui.input_action_button(
-                  id='btn_fetch_debug_logs_b',
-                  label='Fetch Logs',
-                  class_='btn btn-primary'
-                )
-              )
+              log_viewer_ui('logs_b')
             )
           )
+        ),
+        ui.card(
+          ui.card_header('Benchmark'),
+          ui.output_data_frame('tbl_benchmark')
+        ),
+        ui.card(
+          ui.card_header('Profile'),
+          ui.layout_columns(
+            ui.input_select(
+              id='sel_profile_phase',
+              label='Phase',
+              choices={'p': 'Pre-Processor', 'a': 'Part A', 'b': 'Part B'},
+              selected='a'
+            ),
+            ui.input_numeric(
+              id='num_profile_top',
+              label='Top Functions',
+              value=25,
+              min=1,
+              max=1_000,
+              step=5
+            )
+          ),
+          ui.output_data_frame('tbl_profile'),
+          ui.card_footer(
+            ui.output_ui('ui_profile_stacks')
+          )
         )
       )
     )
-  )
\ No newline at end of file
+  )
@@ -0,0 +1,28 @@
+from deltalake import Field, Schema
+from polta.table import Table, TableQuality
+
+from aoc_manager.tools.metastore import metastore
+
+
+table: Table = Table(
+  domain='aoc',
+  quality=TableQuality.STANDARD,
+  name='benchmark',
+  raw_schema=Schema([
+    Field('_execution_ts', 'timestamp'),
+    Field('benchmark_id', 'string'),
+    Field('year', 'integer'),
+    Field('day', 'integer'),
+    Field('phase', 'string'),
+    Field('test_ind', 'boolean'),
+    Field('runs', 'integer'),
+    Field('warmups', 'integer'),
+    Field('min_time', 'float'),
+    Field('median_time', 'float'),
+    Field('p95_time', 'float'),
+    Field('stddev_time', 'float'),
+    Field('mean_time', 'float')
+  ]),
+  primary_keys=['benchmark_id', 'phase'],
+  metastore=metastore
+)
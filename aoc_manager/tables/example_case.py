@@ -0,0 +1,21 @@
+from deltalake import Field, Schema
+from polta.table import Table, TableQuality
+
+from aoc_manager.tools.metastore import metastore
+
+
+table: Table = Table(
+  domain='aoc',
+  quality=TableQuality.STANDARD,
+  name='example_case',
+  raw_schema=Schema([
+    Field('year', 'integer'),
+    Field('day', 'integer'),
+    Field('part', 'string'),
+    Field('case_id', 'string'),
+    Field('input', 'string'),
+    Field('expected', 'string')
+  ]),
+  primary_keys=['year', 'day', 'part', 'case_id'],
+  metastore=metastore
+)
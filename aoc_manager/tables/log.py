@@ -1,7 +1,10 @@
+import polars as pl
+
 from deltalake import Field, Schema
 from polta.table import Table, TableQuality
 
 from aoc_manager.tools.metastore import metastore
+from aoc_manager.tools.migrations import partition_table
 
 
 table: Table = Table(
@@ -9,12 +12,43 @@ table: Table = Table(
   quality=TableQuality.STANDARD,
   name='log',
   raw_schema=Schema([
+    Field('_logged_ts', 'timestamp'),
+    Field('run_id', 'string'),
     Field('year', 'integer'),
     Field('day', 'integer'),
     Field('context', 'string'),
     Field('data', 'string'),
     Field('label', 'string')
   ]),
-  primary_keys=['year', 'day'],
+  primary_keys=['run_id', 'year', 'day'],
+  partition_keys=['run_id'],
   metastore=metastore
 )
+
+
+def partition_logs() -> bool:
+  """Moves logs saved before the table was partitioned into per-run partitions
+
+  Each run's logs live in their own partition, so reading or expiring a run only
+  touches its files. Rows from before runs had ids cannot be viewed, so they are
+  left behind. Runs once at app startup, never in solver processes.
+
+  Returns:
+    migrated (bool): whether the table was rewritten
+  """
+  return partition_table(table, keep=pl.col('run_id').is_not_null())
+
+
+def scan_run_logs(run_id: str) -> pl.LazyFrame:
+  """Lazily scans the logs of one run, reading only that run's partition
+
+  Table.get() reads the whole table eagerly, so the scan starts from the table's
+  Delta table and leaves filtering and paging to the caller's query.
+
+  Args:
+    run_id (str): the id of the run whose logs to scan
+
+  Returns:
+    logs (pl.LazyFrame): the run's log rows
+  """
+  return pl.scan_delta(table.get_as_delta_table()).filter(pl.col('run_id') == run_id)
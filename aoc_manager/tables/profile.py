@@ -0,0 +1,24 @@
+from deltalake import Field, Schema
+from polta.table import Table, TableQuality
+
+from aoc_manager.tools.metastore import metastore
+
+
+table: Table = Table(
+  domain='aoc',
+  quality=TableQuality.STANDARD,
+  name='profile',
+  raw_schema=Schema([
+    Field('_profiled_ts', 'timestamp'),
+    Field('run_id', 'string'),
+    Field('phase', 'string'),
+    Field('mode', 'string'),
+    Field('rank', 'integer'),
+    Field('function', 'string'),
+    Field('calls', 'long'),
+    Field('self_time', 'float'),
+    Field('cumulative_time', 'float')
+  ]),
+  primary_keys=['run_id', 'phase', 'rank'],
+  metastore=metastore
+)
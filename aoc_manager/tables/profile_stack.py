@@ -0,0 +1,20 @@
+from deltalake import Field, Schema
+from polta.table import Table, TableQuality
+
+from aoc_manager.tools.metastore import metastore
+
+
+table: Table = Table(
+  domain='aoc',
+  quality=TableQuality.STANDARD,
+  name='profile_stack',
+  raw_schema=Schema([
+    Field('_profiled_ts', 'timestamp'),
+    Field('run_id', 'string'),
+    Field('phase', 'string'),
+    Field('stack', 'string'),
+    Field('weight', 'long')
+  ]),
+  primary_keys=['run_id', 'phase', 'stack'],
+  metastore=metastore
+)
@@ -2,6 +2,7 @@ from deltalake import Field, Schema
 from polta.table import Table, TableQuality
 
 from aoc_manager.tools.metastore import metastore
+from aoc_manager.tools.migrations import add_missing_columns
 
 
 table: Table = Table(
@@ -16,8 +17,17 @@ table: Table = Table(
     Field('part', 'string'),
     Field('test_ind', 'boolean'),
     Field('answer', 'string'),
-    Field('processing_time', 'float')
+    Field('processing_time', 'float'),
+    Field('preprocessing_time', 'float'),
+    Field('cpu_time', 'float'),
+    Field('peak_memory_bytes', 'long'),
+    Field('gc_collections', 'integer'),
+    Field('gc_time', 'float'),
+    Field('fingerprint', 'string')
   ]),
   metastore=metastore,
   primary_keys=['year', 'day', 'part', 'test_ind']
 )
+
+# Installs from before the metrics and fingerprint columns gain them in place
+add_missing_columns(table)
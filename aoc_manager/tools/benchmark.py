@@ -0,0 +1,116 @@
+import gc
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from statistics import fmean, median, quantiles, stdev
+from typing import Any
+from uuid import uuid4
+
+from aoc_manager.tools.problem_solver import ProblemSolver
+
+
+@dataclass
+class PhaseStatistics:
+  """Summary statistics of the wall times of one benchmarked phase"""
+  phase: str
+  samples: list[float]
+
+  min_time: float = field(init=False)
+  median_time: float = field(init=False)
+  p95_time: float = field(init=False)
+  stddev_time: float = field(init=False)
+  mean_time: float = field(init=False)
+
+  def __post_init__(self) -> None:
+    self.min_time: float = min(self.samples)
+    self.median_time: float = median(self.samples)
+    self.p95_time: float = quantiles(self.samples, n=20, method='inclusive')[18] \
+      if len(self.samples) > 1 else self.samples[0]
+    self.stddev_time: float = stdev(self.samples) if len(self.samples) > 1 else 0.00
+    self.mean_time: float = fmean(self.samples)
+
+
+@dataclass
+class Benchmark:
+  """Repeatedly runs a solver to produce stable timing statistics"""
+  solver_class: type[ProblemSolver]
+  year: int
+  day: int
+  test: bool
+  selection: str = field(default_factory=lambda: 'both')
+  runs: int = field(default_factory=lambda: 10)
+  warmups: int = field(default_factory=lambda: 2)
+
+  benchmark_id: str = field(init=False)
+  statistics: list[PhaseStatistics] = field(init=False)
+
+  def __post_init__(self) -> None:
+    if self.runs < 1:
+      raise ValueError('Error: a benchmark needs at least one run.')
+    self.benchmark_id: str = str(uuid4())
+    self.statistics: list[PhaseStatistics] = []
+
+  def run(self) -> list[PhaseStatistics]:
+    """Runs the warmups and timed runs, re-instantiating the solver each time
+
+    Each instantiation reuses the parsed inputs from the input cache, so only the
+    first warmup pays for parsing. Pre-processing snapshots are neither restored
+    nor saved, so every run times the real _preprocess().
+
+    Returns:
+      statistics (list[PhaseStatistics]): the statistics of each phase that ran
+    """
+    samples: dict[str, list[float]] = {'p': [], 'a': [], 'b': []}
+
+    for iteration in range(self.warmups + self.runs):
+      solver: ProblemSolver = self.solver_class(
+        year=str(self.year),
+        test=self.test,
+        debug=False,
+        mask_answers=True
+      )
+      solver.use_snapshots = False
+      gc.collect()
+      solver.preprocess_inputs()
+      if self.selection in ['a', 'both']:
+        solver.run_a()
+      if self.selection in ['b', 'both']:
+        solver.run_b()
+
+      if iteration < self.warmups:
+        continue
+      samples['p'].append(solver.preprocessing_time)
+      if self.selection in ['a', 'both']:
+        samples['a'].append(solver.a_processing_time)
+      if self.selection in ['b', 'both']:
+        samples['b'].append(solver.b_processing_time)
+
+    self.statistics: list[PhaseStatistics] = [
+      PhaseStatistics(phase=phase, samples=phase_samples)
+      for phase, phase_samples in samples.items()
+      if phase_samples
+    ]
+    return self.statistics
+
+  def get_rows(self) -> list[dict[str, Any]]:
+    """Builds the aoc.benchmark rows of a completed benchmark
+
+    Returns:
+      rows (list[dict[str, Any]]): one row per benchmarked phase
+    """
+    execution_ts: datetime = datetime.now()
+    return [{
+      '_execution_ts': execution_ts,
+      'benchmark_id': self.benchmark_id,
+      'year': self.year,
+      'day': self.day,
+      'phase': stats.phase,
+      'test_ind': self.test,
+      'runs': self.runs,
+      'warmups': self.warmups,
+      'min_time': stats.min_time,
+      'median_time': stats.median_time,
+      'p95_time': stats.p95_time,
+      'stddev_time': stats.stddev_time,
+      'mean_time': stats.mean_time
+    } for stats in self.statistics]
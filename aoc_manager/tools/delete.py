@@ -0,0 +1,51 @@
+from polta.table import Table
+from typing import Any
+
+
+def delete_rows(table: Table, conditions: dict[str, Any]) -> bool:
+  """Deletes the rows of a table that match every condition
+
+  Each condition matches a column against a value, or against any value of a list.
+  Conditions on partition columns alone drop whole files without rewriting any.
+
+  Args:
+    table (Table): the Polta table to delete from
+    conditions (dict[str, Any]): the value or list of values of each column
+
+  Returns:
+    deleted (bool): whether any row matched and was deleted
+  """
+  if any(isinstance(value, list) and not value for value in conditions.values()):
+    return False
+  metrics: dict[str, Any] = table.get_as_delta_table().delete(build_predicate(conditions))
+  # Dropping whole partition files reports no deleted rows, only removed files
+  return metrics['num_removed_files'] > 0
+
+
+def build_predicate(conditions: dict[str, Any]) -> str:
+  """Builds a Delta predicate that matches every condition, quoting each value
+
+  Args:
+    conditions (dict[str, Any]): the value or list of values of each column
+
+  Returns:
+    predicate (str): the SQL predicate, e.g. "day = 1 AND part IN ('a', 'b')"
+  """
+  clauses: list[str] = []
+  for column, value in conditions.items():
+    if isinstance(value, list):
+      clauses.append(f'{column} IN ({", ".join(_quote(item) for item in value)})')
+    else:
+      clauses.append(f'{column} = {_quote(value)}')
+  return ' AND '.join(clauses)
+
+
+def _quote(value: Any) -> str:
+  """Formats a value as a SQL literal"""
+  if isinstance(value, bool):
+    return str(value).lower()
+  if isinstance(value, (int, float)):
+    return str(value)
+  if isinstance(value, str):
+    return "'" + value.replace("'", "''") + "'"
+  raise TypeError(f'Error: cannot build a predicate on a value of type {type(value).__name__}.')
@@ -0,0 +1,225 @@
+import traceback
+
+from dataclasses import dataclass, field
+from multiprocessing import get_context
+from multiprocessing.connection import Connection, wait
+from multiprocessing.context import SpawnContext, SpawnProcess
+from os import cpu_count
+from time import monotonic
+from typing import Any, Optional
+
+from aoc_manager.tables.input import \
+  table as tab_aoc_input
+from aoc_manager.tables.example_case import \
+  table as tab_aoc_example_case
+from aoc_manager.tools.executor import apply_limits, describe_exit, ExecutionLimits
+from aoc_manager.tools.import_solver import import_solver
+from aoc_manager.tools.problem_solver import override_inputs, ProblemSolver
+from aoc_manager.tools.solver_runner import execute_solver
+
+
+# The example saved on the Inputs page runs as a case with this id
+default_case_id: str = 'example'
+
+
+@dataclass
+class ExampleCase:
+  """One example input of a part with its expected answer"""
+  case_id: str
+  part: str
+  input_text: str
+  expected: str = field(default_factory=lambda: '')
+
+
+@dataclass
+class CaseResult:
+  """Outcome of running a solver on one example case"""
+  case_id: str
+  part: str
+  expected: str
+  answer: Optional[str] = field(default_factory=lambda: None)
+  preprocessing_time: float = field(default_factory=lambda: 0.00)
+  processing_time: float = field(default_factory=lambda: 0.00)
+  error: str = field(default_factory=lambda: '')
+
+  @property
+  def passed(self) -> bool:
+    """Whether the case ran and matched its expected answer"""
+    return not self.error and self.answer is not None \
+      and self.answer.strip() == self.expected.strip()
+
+
+def get_example_cases(year: int, day: int) -> list[ExampleCase]:
+  """Retrieves a day's example cases, including the example saved with its inputs
+
+  Args:
+    year (int): the year of the puzzle
+    day (int): the day of the puzzle
+
+  Returns:
+    cases (list[ExampleCase]): every case of the day, ordered by part and case id
+  """
+  cases: list[ExampleCase] = [
+    ExampleCase(
+      case_id=row['case_id'],
+      part=row['part'],
+      input_text=row['input'],
+      expected=row['expected'] or ''
+    )
+    for row in tab_aoc_example_case.get(
+      filter_conditions={'year': year, 'day': day}
+    ).to_dicts()
+  ]
+
+  inputs: list[dict[str, Any]] = tab_aoc_input.get(
+    filter_conditions={'year': year, 'day': day}
+  ).to_dicts()
+  if inputs:
+    row: dict[str, Any] = inputs[0]
+    for part in ['a', 'b']:
+      input_text: str = row[f'input_test_{part}'] or row['input_test_a']
+      if input_text and row[f'expected_{part}'] and not any(
+        case.part == part and case.case_id == default_case_id for case in cases
+      ):
+        cases.append(ExampleCase(default_case_id, part, input_text, row[f'expected_{part}']))
+
+  return sorted(cases, key=lambda case: (case.part, case.case_id))
+
+
+def run_example_case(year: int, day: int, case: ExampleCase) -> CaseResult:
+  """Runs a solver's pre-processor and one part on an example case
+
+  Cached answers and pre-processing snapshots are never used, since the cases
+  are small and would only crowd out the snapshots of full inputs, and their
+  answers are not saved to aoc.solution.
+
+  Args:
+    year (int): the year of the solver
+    day (int): the day of the solver
+    case (ExampleCase): the case to run
+
+  Returns:
+    result (CaseResult): the case's answer, timings and any error
+  """
+  result: CaseResult = CaseResult(case_id=case.case_id, part=case.part, expected=case.expected)
+  solver_class: type[ProblemSolver] | None = import_solver(year, day)
+  if solver_class is None:
+    result.error = f'Error: no solver found for {year} day {day}.'
+    return result
+
+  try:
+    with override_inputs(case.input_text, case.expected, case.input_text, case.expected):
+      solver: ProblemSolver = solver_class(year=str(year), test=True, debug=False)
+  except Exception:
+    result.error = traceback.format_exc()
+    return result
+  solver.force = True
+  solver.use_snapshots = False
+
+  errors: dict[str, str] = execute_solver(solver, case.part)
+  result.error = errors.get('p') or errors.get(case.part) or ''
+  result.preprocessing_time = solver.preprocessing_time
+  result.processing_time = getattr(solver, f'{case.part}_processing_time')
+  if not result.error:
+    result.answer = str(getattr(solver, f'answer_{case.part}'))
+  return result
+
+
+def run_example_cases(year: int, day: int, cases: list[ExampleCase],
+                      workers: Optional[int] = None,
+                      limits: Optional[ExecutionLimits] = None) -> list[CaseResult]:
+  """Runs every example case of a day in parallel, each in its own child process
+
+  Each case runs under the same limits as an isolated run: the CPU-time and
+  address-space limits are enforced inside its process, and a case that
+  exceeds the wall-clock timeout is killed without holding up the others.
+
+  Args:
+    year (int): the year of the solver
+    day (int): the day of the solver
+    cases (list[ExampleCase]): the cases to run
+    workers (Optional[int]): the number of cases run at once, defaulting to one per
+      case up to the CPU count
+    limits (Optional[ExecutionLimits]): the limits of each case, defaulting to ExecutionLimits()
+
+  Returns:
+    results (list[CaseResult]): the result of each case, in the order of the cases
+  """
+  if not cases:
+    return []
+
+  limits = limits or ExecutionLimits()
+  max_workers: int = workers or min(len(cases), cpu_count() or 1)
+  # Spawned children avoid forking the parent's Delta Lake runtime threads
+  context: SpawnContext = get_context('spawn')
+  pending: list[int] = list(range(len(cases)))
+  running: dict[int, tuple[SpawnProcess, Connection, Optional[float]]] = {}
+  results: dict[int, CaseResult] = {}
+  try:
+    while pending or running:
+      while pending and len(running) < max_workers:
+        i: int = pending.pop(0)
+        receiver, sender = context.Pipe(duplex=False)
+        process: SpawnProcess = context.Process(
+          target=_run_case_child,
+          args=(sender, year, day, cases[i], limits),
+          name=f'case-{year}-{day}-{i}'
+        )
+        process.start()
+        sender.close()
+        deadline: Optional[float] = monotonic() + limits.timeout \
+          if limits.timeout is not None else None
+        running[i] = (process, receiver, deadline)
+
+      deadlines: list[float] = [
+        deadline for _, _, deadline in running.values() if deadline is not None
+      ]
+      ready: list[Any] = wait(
+        [receiver for _, receiver, _ in running.values()],
+        timeout=max(min(deadlines) - monotonic(), 0.0) if deadlines else None
+      )
+      for i, (process, receiver, deadline) in list(running.items()):
+        if receiver in ready:
+          try:
+            results[i] = receiver.recv()
+          except EOFError:
+            process.join()
+            results[i] = _failed_case(
+              cases[i], f'Error: the case process {describe_exit(process.exitcode, limits)}.'
+            )
+        elif deadline is not None and monotonic() >= deadline:
+          results[i] = _failed_case(
+            cases[i], f'Error: the case exceeded the {limits.timeout}s timeout.'
+          )
+        else:
+          continue
+        _stop_case(process, receiver)
+        del running[i]
+  finally:
+    for process, receiver, _ in running.values():
+      _stop_case(process, receiver)
+  return [results[i] for i in range(len(cases))]
+
+
+def _run_case_child(sender: Connection, year: int, day: int, case: ExampleCase,
+                    limits: ExecutionLimits) -> None:
+  """Entry point of a case's child process, which sends back the case's result"""
+  apply_limits(limits)
+  try:
+    result: CaseResult = run_example_case(year, day, case)
+  except Exception:
+    result: CaseResult = _failed_case(case, traceback.format_exc())
+  sender.send(result)
+
+
+def _failed_case(case: ExampleCase, error: str) -> CaseResult:
+  """Builds the result of a case that produced no answer"""
+  return CaseResult(case_id=case.case_id, part=case.part, expected=case.expected, error=error)
+
+
+def _stop_case(process: SpawnProcess, receiver: Connection) -> None:
+  """Kills a case's process if it is still running and releases its pipe"""
+  if process.is_alive():
+    process.kill()
+  process.join()
+  receiver.close()
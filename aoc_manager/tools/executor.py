@@ -0,0 +1,332 @@
+import traceback
+
+from dataclasses import dataclass, field, replace
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from multiprocessing.context import SpawnContext, SpawnProcess
+from signal import Signals
+from threading import Event
+from time import monotonic
+from typing import Any, Callable, Optional
+
+try:
+  import resource
+except ImportError:
+  # Resource limits are only available on Unix; timeouts still apply elsewhere
+  resource = None
+
+from aoc_manager.tools.benchmark import Benchmark
+from aoc_manager.tools.import_solver import import_solver
+from aoc_manager.tools.log import LogSettings
+from aoc_manager.tools.problem_solver import ProblemSolver
+from aoc_manager.tools.run_result import phase_steps, RunResult
+from aoc_manager.tools.solver_runner import execute_solver, get_run_result
+
+
+phase_names: dict[str, str] = {
+  'p': 'pre-processing',
+  'a': 'Part A',
+  'b': 'Part B',
+  'ab': 'Parts A and B'
+}
+# How often a waiting run checks whether it has been cancelled
+cancel_poll_interval: float = 0.1
+
+
+@dataclass
+class ExecutionLimits:
+  """Resource limits applied to a solver running in a child process
+
+  A limit of None leaves that resource unrestricted.
+  """
+  timeout: Optional[float] = field(default_factory=lambda: 600.0)
+  cpu_time: Optional[int] = field(default_factory=lambda: None)
+  memory_bytes: Optional[int] = field(default_factory=lambda: None)
+
+
+def run_isolated(year: int, day: int, test: bool, selection: str,
+                 debug: bool = False, mask_answers: bool = False,
+                 trace_memory: bool = False,
+                 profile_mode: Optional[str] = None,
+                 force: bool = False,
+                 log_settings: Optional[LogSettings] = None,
+                 limits: Optional[ExecutionLimits] = None,
+                 on_update: Optional[Callable[[str, RunResult], None]] = None,
+                 cancel: Optional[Event] = None) -> RunResult:
+  """Runs a solver in a child process so a runaway solver cannot take down the caller
+
+  The child is killed once the wall-clock timeout elapses or the cancel event
+  is set. CPU-time and address-space limits are enforced by the operating system
+  inside the child. A run that is cancelled, times out or crashes keeps the
+  answers, timings and solution rows of the phases that finished before it.
+
+  Args:
+    year (int): the year of the solver
+    day (int): the day of the solver
+    test (bool): whether to run on the test inputs
+    selection (str): the parts to run, either 'a', 'b' or 'both'
+    debug (bool): whether to save debug logs
+    mask_answers (bool): whether to mask the answers in the UI
+    trace_memory (bool): whether to trace peak memory per phase
+    profile_mode (Optional[str]): 'cprofile' or 'sampling' to profile each phase
+    force (bool): whether to run parts that have a cached answer
+    log_settings (Optional[LogSettings]): the debug log limits, defaulting to LogSettings()
+    limits (Optional[ExecutionLimits]): the limits to apply, defaulting to ExecutionLimits()
+    on_update (Optional[Callable[[str, RunResult], None]]): called in the caller's
+      process with each phase as it starts and the solver's results so far
+    cancel (Optional[Event]): when set, stops the run and kills the child
+
+  Returns:
+    result (RunResult): the solver's answers, timings, solution rows and phase errors
+  """
+  limits = limits or ExecutionLimits()
+  # Spawn rather than fork so the child does not inherit the app's threads
+  context: SpawnContext = get_context('spawn')
+  receiver, sender = context.Pipe(duplex=False)
+  process: SpawnProcess = context.Process(
+    target=_run_child,
+    args=(
+      sender, year, day, test, selection, debug, mask_answers, trace_memory,
+      profile_mode, force, log_settings or LogSettings(), limits
+    ),
+    name=f'solver-{year}-{day}'
+  )
+  process.start()
+  sender.close()
+
+  phase: str = 'p'
+  partial: Optional[RunResult] = None
+  deadline: Optional[float] = monotonic() + limits.timeout \
+    if limits.timeout is not None else None
+  try:
+    while True:
+      if cancel is not None and cancel.is_set():
+        return _with_error(
+          partial, year, day, test, phase,
+          f'Error: the run was cancelled during {phase_names[phase]}.'
+        )
+      wait: Optional[float] = max(deadline - monotonic(), 0.0) \
+        if deadline is not None else None
+      if cancel is not None:
+        wait = cancel_poll_interval if wait is None else min(wait, cancel_poll_interval)
+      if not receiver.poll(wait):
+        if deadline is not None and monotonic() >= deadline:
+          return _with_error(
+            partial, year, day, test, phase,
+            f'Error: {phase_names[phase]} exceeded the {limits.timeout}s timeout.'
+          )
+        continue
+      message: tuple[str, Any] = receiver.recv()
+      if message[0] == 'phase':
+        phase, partial = message[1], message[2]
+        if on_update is not None:
+          on_update(phase, partial)
+      else:
+        return message[1]
+  except EOFError:
+    process.join()
+    return _with_error(
+      partial, year, day, test, phase,
+      f'Error: the solver process {describe_exit(process.exitcode, limits)} '
+      f'during {phase_names[phase]}.'
+    )
+  finally:
+    if process.is_alive():
+      process.kill()
+    process.join()
+    receiver.close()
+
+
+def run_benchmark_isolated(year: int, day: int, test: bool, selection: str,
+                           runs: int, warmups: int,
+                           limits: Optional[ExecutionLimits] = None) -> list[dict[str, Any]]:
+  """Benchmarks a solver in a child process under the same limits as a run
+
+  The wall-clock timeout covers the whole benchmark, warmups included, while the
+  CPU-time and address-space limits are enforced inside the child as for a run.
+
+  Args:
+    year (int): the year of the solver
+    day (int): the day of the solver
+    test (bool): whether to benchmark on the test inputs
+    selection (str): the parts to benchmark, either 'a', 'b' or 'both'
+    runs (int): the number of timed runs
+    warmups (int): the number of untimed warmup runs
+    limits (Optional[ExecutionLimits]): the limits to apply, defaulting to ExecutionLimits()
+
+  Returns:
+    rows (list[dict[str, Any]]): the aoc.benchmark rows of each benchmarked phase
+
+  Raises:
+    RuntimeError: if the benchmark fails, times out or its process dies
+  """
+  limits = limits or ExecutionLimits()
+  context: SpawnContext = get_context('spawn')
+  receiver, sender = context.Pipe(duplex=False)
+  process: SpawnProcess = context.Process(
+    target=_benchmark_child,
+    args=(sender, year, day, test, selection, runs, warmups, limits),
+    name=f'benchmark-{year}-{day}'
+  )
+  process.start()
+  sender.close()
+
+  try:
+    if not receiver.poll(limits.timeout):
+      raise RuntimeError(f'Error: the benchmark exceeded the {limits.timeout}s timeout.')
+    status, payload = receiver.recv()
+  except EOFError:
+    process.join()
+    raise RuntimeError(
+      f'Error: the benchmark process {describe_exit(process.exitcode, limits)}.'
+    )
+  finally:
+    if process.is_alive():
+      process.kill()
+    process.join()
+    receiver.close()
+
+  if status == 'error':
+    raise RuntimeError(payload)
+  return payload
+
+
+def describe_exit(exitcode: Optional[int], limits: ExecutionLimits) -> str:
+  """Describes how a child process that sent no result ended
+
+  Exceeding the CPU-time limit sends SIGXCPU, then SIGKILL at the hard limit.
+  Exceeding the address-space limit usually surfaces as a MemoryError, but native
+  code that cannot allocate may crash instead.
+
+  Args:
+    exitcode (Optional[int]): the process's exit code, negated for a signal
+    limits (ExecutionLimits): the limits the process ran under
+
+  Returns:
+    description (str): how the process ended, to follow 'the process'
+  """
+  if exitcode is None or exitcode >= 0:
+    return f'exited with code {exitcode} without reporting a result'
+  signal: Signals = Signals(-exitcode)
+  description: str = f'was killed by {signal.name}'
+  if signal.name in ['SIGXCPU', 'SIGKILL'] and limits.cpu_time is not None:
+    description += f', likely after exceeding its {limits.cpu_time}s CPU-time limit'
+  elif signal.name in ['SIGSEGV', 'SIGABRT', 'SIGBUS'] and limits.memory_bytes is not None:
+    description += f', possibly after exceeding its {limits.memory_bytes:,} byte memory limit'
+  return description
+
+
+def _with_error(partial: Optional[RunResult], year: int, day: int, test: bool,
+                phase: str, error: str) -> RunResult:
+  """Attaches a phase's error to the latest partial result sent by the child
+
+  Solution rows of the failed phase are dropped, and a failed pre-processor
+  drops every row, so only phases that finished are saved. A failure while both
+  parts run in parallel is reported against each part.
+
+  Args:
+    partial (Optional[RunResult]): the result sent with the latest phase, if any
+    year (int): the year of the solver
+    day (int): the day of the solver
+    test (bool): whether the run used the test inputs
+    phase (str): the phase that failed
+    error (str): the error message
+
+  Returns:
+    result (RunResult): the partial result with the error attached
+  """
+  steps: tuple[str, ...] = phase_steps[phase]
+  if partial is None:
+    return replace(
+      RunResult.failed(year, day, test, phase, error),
+      errors={step: error for step in steps}
+    )
+  return replace(
+    partial,
+    rows=tuple(row for row in partial.rows if 'p' not in steps and row['part'] not in steps),
+    errors={**partial.errors, **{step: error for step in steps}}
+  )
+
+
+def _run_child(sender: Connection, year: int, day: int, test: bool, selection: str,
+               debug: bool, mask_answers: bool, trace_memory: bool,
+               profile_mode: Optional[str], force: bool, log_settings: LogSettings, limits: ExecutionLimits) -> None:
+  """Entry point of the child process, which reports back through the pipe"""
+  apply_limits(limits)
+
+  try:
+    solver: ProblemSolver = import_solver(year, day)(
+      year=str(year),
+      debug=debug,
+      mask_answers=mask_answers,
+      test=test
+    )
+    solver.trace_memory = trace_memory
+    solver.profile_mode = profile_mode
+    solver.force = force
+    solver.set_log_settings(log_settings)
+  except Exception:
+    sender.send(('result', RunResult.failed(year, day, test, 'p', traceback.format_exc())))
+    return
+
+  phase: str = 'p'
+
+  def on_phase(next_phase: str, errors: dict[str, str]) -> None:
+    nonlocal phase
+    phase = next_phase
+    _send(sender, ('phase', phase, get_run_result(solver, selection, errors)))
+
+  try:
+    errors: dict[str, str] = execute_solver(solver, selection, on_phase=on_phase)
+    result: RunResult = get_run_result(solver, selection, errors)
+  except Exception:
+    # Failures outside a phase's own handling, such as reading the answer cache
+    result: RunResult = RunResult.failed(year, day, test, phase, traceback.format_exc())
+  # Release the solver's inputs and state before the result is pickled
+  del solver
+  _send(sender, ('result', result))
+
+
+def _benchmark_child(sender: Connection, year: int, day: int, test: bool, selection: str,
+                     runs: int, warmups: int, limits: ExecutionLimits) -> None:
+  """Entry point of a benchmark's child process, which sends back its rows or traceback"""
+  apply_limits(limits)
+
+  try:
+    benchmark: Benchmark = Benchmark(
+      solver_class=import_solver(year, day),
+      year=year,
+      day=day,
+      test=test,
+      selection=selection,
+      runs=runs,
+      warmups=warmups
+    )
+    benchmark.run()
+    sender.send(('result', benchmark.get_rows()))
+  except Exception:
+    sender.send(('error', traceback.format_exc()))
+
+
+def _send(sender: Connection, message: tuple) -> None:
+  """Sends a message to the parent, falling back to string answers if they cannot be pickled"""
+  try:
+    sender.send(message)
+  except Exception:
+    result: RunResult = message[-1]
+    sender.send((*message[:-1], replace(
+      result,
+      answer_a=str(result.answer_a),
+      answer_b=str(result.answer_b)
+    )))
+
+
+def apply_limits(limits: ExecutionLimits) -> None:
+  """Applies the CPU-time and address-space limits to the current process"""
+  if resource is None:
+    return
+  if limits.cpu_time is not None:
+    resource.setrlimit(resource.RLIMIT_CPU, (limits.cpu_time, limits.cpu_time + 1))
+  if limits.memory_bytes is not None:
+    resource.setrlimit(resource.RLIMIT_AS, (limits.memory_bytes, limits.memory_bytes))
+
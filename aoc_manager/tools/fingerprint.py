@@ -0,0 +1,64 @@
+from hashlib import blake2b
+from inspect import getsource, getsourcefile
+from typing import Optional
+
+
+def hash_solver_source(solver_class: type) -> str:
+  """Hashes the source of the module that defines a solver
+
+  The file is read on every call, so edits made while the app is running are
+  picked up. Only the solver's own module is hashed, not the helpers it imports.
+
+  Args:
+    solver_class (type): the solver class, as resolved by import_solver
+
+  Returns:
+    source_hash (str): the hex digest of the module source, or '' if it cannot be read
+  """
+  try:
+    source_file: Optional[str] = getsourcefile(solver_class)
+    if source_file is None:
+      return ''
+    with open(source_file, 'rb') as f:
+      return blake2b(f.read(), digest_size=16).hexdigest()
+  except (OSError, TypeError):
+    return ''
+
+
+def hash_preprocess_source(solver_class: type) -> str:
+  """Hashes the source of the methods that build a solver's pre-processed state
+
+  Only __init__ and _preprocess are hashed, so edits to the solve methods keep
+  the pre-processing snapshot valid.
+
+  Args:
+    solver_class (type): the solver class, as resolved by import_solver
+
+  Returns:
+    source_hash (str): the hex digest of the methods' source, or '' if it cannot be read
+  """
+  try:
+    source: str = getsource(solver_class.__init__) + getsource(solver_class._preprocess)
+  except (OSError, TypeError):
+    return ''
+  key: str = f'{solver_class.__module__}.{solver_class.__qualname__}|{source}'
+  return blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def get_fingerprint(source_hash: str, input_hash: str, part: str, test: bool) -> str:
+  """Builds the fingerprint identifying one part's answer
+
+  Two runs with the same fingerprint ran the same solver source on the same
+  input, so the second can reuse the first's answer.
+
+  Args:
+    source_hash (str): the hash of the solver module source
+    input_hash (str): the hash of the part's raw input text
+    part (str): the part of the solution, either 'a' or 'b'
+    test (bool): whether the input is the test input
+
+  Returns:
+    fingerprint (str): the hex digest identifying the answer
+  """
+  key: str = '|'.join([source_hash, input_hash, part, str(test)])
+  return blake2b(key.encode(), digest_size=16).hexdigest()
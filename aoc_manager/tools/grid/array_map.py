@@ -0,0 +1,234 @@
+from dataclasses import dataclass, field
+from typing import Any
+
+from aoc_manager.tools.grid.cursor import GridCursor
+from aoc_manager.tools.grid.regions import label_cells, RegionLabels
+
+
+@dataclass
+class ArrayGridMap:
+  """Grid of single-byte cells stored row-major in one contiguous bytearray
+
+  Memory scales with one byte per cell rather than one dict entry per cell, and
+  whole-grid operations such as find_all, count and mask run at C speed on the
+  buffer. Cells hold single ASCII characters.
+  """
+  data: bytearray
+  max_x: int
+  max_y: int
+  start_at_x: int = field(default_factory=lambda: 0)
+  start_at_y: int = field(default_factory=lambda: 0)
+
+  cursor: GridCursor = field(init=False)
+
+  def __post_init__(self) -> None:
+    if len(self.data) != self.max_x * self.max_y:
+      raise ValueError('Error: the grid data does not match its dimensions.')
+    self.cursor: GridCursor = GridCursor(
+      x=self.start_at_x,
+      y=self.start_at_y,
+      max_x=self.max_x,
+      max_y=self.max_y
+    )
+
+  @classmethod
+  def from_text(cls, text: str, start_at_x: int = 0, start_at_y: int = 0) -> 'ArrayGridMap':
+    """Builds a grid from input text with one row per line
+
+    Args:
+      text (str): the input text, with rows of equal width
+      start_at_x (int): the starting x of the cursor
+      start_at_y (int): the starting y of the cursor
+
+    Returns:
+      grid_map (ArrayGridMap): the grid
+    """
+    raw: bytes = text.replace('\r', '').strip('\n').encode()
+    rows: list[bytes] = raw.split(b'\n') if raw else []
+    max_x: int = len(rows[0]) if rows else 0
+    if any(len(row) != max_x for row in rows):
+      raise ValueError('Error: every grid row must have the same width.')
+    return cls(
+      data=bytearray(b''.join(rows)),
+      max_x=max_x,
+      max_y=len(rows),
+      start_at_x=start_at_x,
+      start_at_y=start_at_y
+    )
+
+  @classmethod
+  def from_rows(cls, input: list[list[str]], start_at_x: int = 0,
+                start_at_y: int = 0) -> 'ArrayGridMap':
+    """Builds a grid from rows of characters, the input of GridMap
+
+    Args:
+      input (list[list[str]]): the rows of the grid
+      start_at_x (int): the starting x of the cursor
+      start_at_y (int): the starting y of the cursor
+
+    Returns:
+      grid_map (ArrayGridMap): the grid
+    """
+    if any(len(row) != len(input[0]) for row in input):
+      raise ValueError('Error: every grid row must have the same width.')
+    return cls(
+      data=bytearray(''.join(''.join(row) for row in input).encode()),
+      max_x=len(input[0]),
+      max_y=len(input),
+      start_at_x=start_at_x,
+      start_at_y=start_at_y
+    )
+
+  def index(self, x: int, y: int) -> int:
+    """Converts a coordinate into its position in the buffer"""
+    return y * self.max_x + x
+
+  def coordinate(self, index: int) -> tuple[int, int]:
+    """Converts a position in the buffer into its coordinate"""
+    y, x = divmod(index, self.max_x)
+    return (x, y)
+
+  def contains(self, x: int, y: int) -> bool:
+    return 0 <= x < self.max_x and 0 <= y < self.max_y
+
+  def get_value(self, x: int, y: int) -> str | None:
+    if not self.contains(x, y):
+      return None
+    return chr(self.data[self.index(x, y)])
+
+  def set_value(self, x: int, y: int, value: str) -> None:
+    if not self.contains(x, y):
+      # Out-of-bounds x would otherwise silently write to a neighbouring row
+      raise IndexError(f'Error: ({x}, {y}) is outside the grid.')
+    self.data[self.index(x, y)] = ord(value)
+
+  def get(self) -> str:
+    """Renders the grid with one line per row"""
+    text: str = self.data.decode()
+    return ''.join(
+      f'{text[start:start + self.max_x]}\n'
+      for start in range(0, len(text), self.max_x)
+    )
+
+  def get_window(self, radius_x: int, radius_y: int | None = None) -> str:
+    """Renders the part of the grid around the cursor, clipped to the grid's bounds
+
+    Args:
+      radius_x (int): the number of columns to render on each side of the cursor
+      radius_y (int | None): the number of rows to render above and below the
+        cursor, or None to use radius_x
+
+    Returns:
+      window (str): the window with one line per row
+    """
+    if radius_y is None:
+      radius_y = radius_x
+    start_x: int = max(self.cursor.x - radius_x, 0)
+    end_x: int = min(self.cursor.x + radius_x + 1, self.max_x)
+    start_y: int = max(self.cursor.y - radius_y, 0)
+    end_y: int = min(self.cursor.y + radius_y + 1, self.max_y)
+    return ''.join(
+      f'{self.data[self.index(start_x, y):self.index(end_x, y)].decode()}\n'
+      for y in range(start_y, end_y)
+    )
+
+  def label_regions(self, ignore: str = '') -> RegionLabels:
+    """Labels the orthogonally connected regions of equal symbols
+
+    Args:
+      ignore (str): the symbols of the cells that belong to no region
+
+    Returns:
+      region_labels (RegionLabels): the label of each cell and each region's
+        area, perimeter, sides and bounding box
+    """
+    return label_cells(self.data, self.max_x, ignore)
+
+  def get_at_cursor(self) -> str | None:
+    return self.get_value(self.cursor.x, self.cursor.y)
+
+  def set_at_cursor(self, value: str) -> None:
+    self.set_value(self.cursor.x, self.cursor.y, value)
+
+  def cursor_equals(self, value: str) -> bool:
+    return self.cursor.is_in_map() and self.get_at_cursor() == value
+
+  def find_all(self, symbol: str) -> list[tuple[int, int]]:
+    """Finds every coordinate holding a symbol, in row-major order
+
+    Args:
+      symbol (str): the symbol to find
+
+    Returns:
+      coordinates (list[tuple[int, int]]): the coordinates of the symbol
+    """
+    value: int = ord(symbol)
+    coordinates: list[tuple[int, int]] = []
+    index: int = self.data.find(value)
+    while index != -1:
+      coordinates.append(self.coordinate(index))
+      index = self.data.find(value, index + 1)
+    return coordinates
+
+  def cast_ray(self, x: int, y: int, dx: int, dy: int, symbol: str) -> tuple[int, bool]:
+    """Counts the steps from a cell towards a symbol or the edge of the grid
+
+    The cells along the ray are sliced out of the buffer with one stride and
+    searched at C speed, rather than stepped through one at a time.
+
+    Args:
+      x (int): the x of the starting cell
+      y (int): the y of the starting cell
+      dx (int): the step along x
+      dy (int): the step along y
+      symbol (str): the symbol that ends the ray
+
+    Returns:
+      ray (tuple[int, bool]): the number of steps taken before the symbol or the
+        edge, and whether the ray ended on the symbol
+    """
+    if not self.contains(x, y) or (dx, dy) == (0, 0):
+      return 0, False
+    # A ray that does not move along an axis is only bounded by the other one
+    unbounded: int = len(self.data)
+    steps_x: int = (self.max_x - 1 - x) // dx if dx > 0 else x // -dx if dx < 0 else unbounded
+    steps_y: int = (self.max_y - 1 - y) // dy if dy > 0 else y // -dy if dy < 0 else unbounded
+    length: int = min(steps_x, steps_y)
+    if length == 0:
+      return 0, False
+    stride: int = dy * self.max_x + dx
+    start: int = self.index(x + dx, y + dy)
+    stop: int | None = start + length * stride
+    if stop < 0:
+      stop = None
+    found: int = self.data[start:stop:stride].find(ord(symbol))
+    if found == -1:
+      return length, False
+    return found, True
+
+  def count(self, symbol: str) -> int:
+    return self.data.count(ord(symbol))
+
+  def mask(self, symbols: str) -> bytearray:
+    """Builds a row-major mask of the cells holding any of the given symbols
+
+    Args:
+      symbols (str): the symbols to mask
+
+    Returns:
+      mask (bytearray): 1 for each cell holding one of the symbols, otherwise 0
+    """
+    table: bytearray = bytearray(256)
+    for symbol in symbols:
+      table[ord(symbol)] = 1
+    return bytearray(self.data.translate(table))
+
+  def to_numpy(self) -> Any:
+    """Views the grid as a (max_y, max_x) uint8 numpy array that shares its buffer
+
+    Returns:
+      array (numpy.ndarray): a writable view of the grid
+    """
+    # numpy is optional, so it is only imported when a view is requested
+    import numpy as np
+    return np.frombuffer(self.data, dtype=np.uint8).reshape(self.max_y, self.max_x)
@@ -1,12 +1,38 @@
 from dataclasses import dataclass, field
+from typing import Protocol
 
 
-@dataclass
+directions: dict[str, tuple[int, int]] = {
+  'up': (0, -1),
+  'right': (1, 0),
+  'down': (0, 1),
+  'left': (-1, 0),
+  'up_right': (1, -1),
+  'down_right': (1, 1),
+  'down_left': (-1, 1),
+  'up_left': (-1, -1)
+}
+
+
+class RayCastable(Protocol):
+  """A grid storage that can measure how far a ray travels across it"""
+
+  def cast_ray(self, x: int, y: int, dx: int, dy: int, symbol: str) -> tuple[int, bool]: ...
+
+
+@dataclass(slots=True)
 class GridCursor:
+  """Position and heading on a grid of max_x columns and max_y rows
+
+  The heading is a (heading_x, heading_y) step with y growing downwards, and
+  starts facing up. Slots keep each cursor small and its attributes fast to read.
+  """
   x: int
   y: int
   max_x: int
   max_y: int
+  heading_x: int = field(default_factory=lambda: 0)
+  heading_y: int = field(default_factory=lambda: -1)
   outside_bound_x: bool = field(init=False)
   outside_bound_y: bool = field(init=False)
 
@@ -18,13 +44,13 @@ class GridCursor:
     return (self.x, self.y)
 
   def is_in_map(self) -> bool:
-    return not self.is_outside_bound_x() and not self.is_outside_bound_y()
+    return 0 <= self.x < self.max_x and 0 <= self.y < self.max_y
   
   def is_outside_bound_x(self) -> bool:
-    return self.x < 0 or self.x >= self.max_x
+    return not 0 <= self.x < self.max_x
 
   def is_outside_bound_y(self) -> bool:
-    return self.y < 0 or self.y >= self.max_y
+    return not 0 <= self.y < self.max_y
 
   def move_left(self) -> None:
     self.x -= 1
@@ -41,6 +67,68 @@ class GridCursor:
   def move_down(self) -> None:
     self.y += 1
     self.outside_bound_y = self.is_outside_bound_y()
+
+  def move_up_left(self) -> None:
+    self.move_by(-1, -1)
+
+  def move_up_right(self) -> None:
+    self.move_by(1, -1)
+
+  def move_down_left(self) -> None:
+    self.move_by(-1, 1)
+
+  def move_down_right(self) -> None:
+    self.move_by(1, 1)
+
+  def move_by(self, dx: int, dy: int, steps: int = 1) -> None:
+    """Moves the cursor by a step any number of times in one update
+
+    Args:
+      dx (int): the step along x
+      dy (int): the step along y
+      steps (int): the number of steps to take
+    """
+    self.x += dx * steps
+    self.y += dy * steps
+    self.outside_bound_x = not 0 <= self.x < self.max_x
+    self.outside_bound_y = not 0 <= self.y < self.max_y
+
+  def move(self, steps: int = 1) -> None:
+    """Moves the cursor along its heading"""
+    self.move_by(self.heading_x, self.heading_y, steps)
+
+  def face(self, direction: str) -> None:
+    """Sets the heading to one of the named directions, e.g. 'up' or 'down_left'"""
+    self.heading_x, self.heading_y = directions[direction]
+
+  def turn_right(self) -> None:
+    self.heading_x, self.heading_y = -self.heading_y, self.heading_x
+
+  def turn_left(self) -> None:
+    self.heading_x, self.heading_y = self.heading_y, -self.heading_x
+
+  def turn_around(self) -> None:
+    self.heading_x, self.heading_y = -self.heading_x, -self.heading_y
+
+  def get_heading(self) -> tuple[int, int]:
+    return (self.heading_x, self.heading_y)
+
+  def peek(self, steps: int = 1) -> tuple[int, int]:
+    """Retrieves the coordinate steps ahead along the heading without moving"""
+    return (self.x + self.heading_x * steps, self.y + self.heading_y * steps)
+
+  def ray_cast(self, grid_map: RayCastable, symbol: str) -> tuple[int, bool]:
+    """Measures how far the cursor can travel along its heading in one call
+
+    Args:
+      grid_map (RayCastable): the grid the cursor is on, e.g. a GridMap or ArrayGridMap
+      symbol (str): the symbol that blocks the cursor
+
+    Returns:
+      ray (tuple[int, bool]): the number of steps before the cursor reaches the
+        symbol or the edge, and whether it reached the symbol
+    """
+    return grid_map.cast_ray(self.x, self.y, self.heading_x, self.heading_y, symbol)
   
   def jump_to(self, x: int, y: int) -> None:
     self.x = x
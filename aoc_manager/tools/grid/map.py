@@ -1,18 +1,28 @@
 from dataclasses import dataclass, field
 
 from aoc_manager.tools.grid.cursor import GridCursor
+from aoc_manager.tools.grid.regions import label_cells, RegionLabels
 
 
 @dataclass
 class GridMap:
+  """Grid of cells keyed by their (x, y) coordinate
+
+  With incremental set, get caches each rendered row and only re-renders the
+  rows changed through set_value or set_at_cursor since the last render. Writes
+  made to grid directly bypass the cache, so call mark_dirty after them.
+  """
   input: list[list[str]]
   start_at_x: int = field(default_factory=lambda: 0)
   start_at_y: int = field(default_factory=lambda: 0)
   grid: dict[tuple[int, int], str] = field(default_factory=lambda: {})
+  incremental: bool = field(default_factory=lambda: False)
 
   max_x: int = field(init=False)
   max_y: int = field(init=False)
   cursor: GridCursor = field(init=False)
+  rendered_rows: list[str] = field(init=False)
+  dirty_rows: set[int] = field(init=False)
 
   def __post_init__(self) -> None:
     self.max_x: int = len(self.input[0])
@@ -29,15 +39,110 @@ class GridMap:
       max_x=self.max_x,
       max_y=self.max_y
     )
+    self.rendered_rows: list[str] = []
+    self.dirty_rows: set[int] = set()
+
+  def index(self, x: int, y: int) -> int:
+    """Converts a coordinate into its flat row-major index"""
+    return y * self.max_x + x
+
+  def coordinate(self, index: int) -> tuple[int, int]:
+    """Converts a flat row-major index into its coordinate"""
+    y, x = divmod(index, self.max_x)
+    return (x, y)
 
   def get(self) -> str:
-    full_map: str = ''
-    for coordinate, sign in self.grid.items():
-      full_map += sign
-      if coordinate[0] == self.max_x - 1:
-        full_map += '\n'
-    return full_map
+    """Renders the grid with one line per row, in time linear in the cell count"""
+    if not self.incremental:
+      return ''.join(f'{self.render_row(y)}\n' for y in range(self.max_y))
+    if not self.rendered_rows:
+      self.rendered_rows = [self.render_row(y) for y in range(self.max_y)]
+    else:
+      for y in self.dirty_rows:
+        self.rendered_rows[y] = self.render_row(y)
+    self.dirty_rows.clear()
+    return ''.join(f'{row}\n' for row in self.rendered_rows)
+
+  def get_window(self, radius_x: int, radius_y: int | None = None) -> str:
+    """Renders the part of the grid around the cursor, clipped to the grid's bounds
+
+    Args:
+      radius_x (int): the number of columns to render on each side of the cursor
+      radius_y (int | None): the number of rows to render above and below the
+        cursor, or None to use radius_x
+
+    Returns:
+      window (str): the window with one line per row
+    """
+    if radius_y is None:
+      radius_y = radius_x
+    start_x: int = max(self.cursor.x - radius_x, 0)
+    end_x: int = min(self.cursor.x + radius_x + 1, self.max_x)
+    start_y: int = max(self.cursor.y - radius_y, 0)
+    end_y: int = min(self.cursor.y + radius_y + 1, self.max_y)
+    return ''.join(
+      f'{self.render_row(y, start_x, end_x)}\n'
+      for y in range(start_y, end_y)
+    )
+
+  def render_row(self, y: int, start_x: int = 0, end_x: int | None = None) -> str:
+    """Renders the cells of one row between start_x and end_x"""
+    if end_x is None:
+      end_x = self.max_x
+    grid: dict[tuple[int, int], str] = self.grid
+    return ''.join([grid[(x, y)] for x in range(start_x, end_x)])
+
+  def mark_dirty(self, y: int) -> None:
+    """Marks a row to be re-rendered by the next incremental get"""
+    self.dirty_rows.add(y)
+
+  def set_value(self, x: int, y: int, value: str) -> None:
+    self.grid[(x, y)] = value
+    self.dirty_rows.add(y)
+
+  def set_at_cursor(self, value: str) -> None:
+    self.set_value(self.cursor.x, self.cursor.y, value)
   
+  def cast_ray(self, x: int, y: int, dx: int, dy: int, symbol: str) -> tuple[int, bool]:
+    """Counts the steps from a cell towards a symbol or the edge of the grid
+
+    Args:
+      x (int): the x of the starting cell
+      y (int): the y of the starting cell
+      dx (int): the step along x
+      dy (int): the step along y
+      symbol (str): the symbol that ends the ray
+
+    Returns:
+      ray (tuple[int, bool]): the number of steps taken before the symbol or the
+        edge, and whether the ray ended on the symbol
+    """
+    if not (0 <= x < self.max_x and 0 <= y < self.max_y) or (dx, dy) == (0, 0):
+      return 0, False
+    grid: dict[tuple[int, int], str] = self.grid
+    steps: int = 0
+    x, y = x + dx, y + dy
+    while 0 <= x < self.max_x and 0 <= y < self.max_y:
+      if grid[(x, y)] == symbol:
+        return steps, True
+      steps += 1
+      x, y = x + dx, y + dy
+    return steps, False
+
+  def label_regions(self, ignore: str = '') -> RegionLabels:
+    """Labels the orthogonally connected regions of equal symbols
+
+    Args:
+      ignore (str): the symbols of the cells that belong to no region
+
+    Returns:
+      region_labels (RegionLabels): the label of each cell and each region's
+        area, perimeter, sides and bounding box
+    """
+    return label_cells(''.join(
+      self.render_row(y) for y in range(self.max_y)
+    ).encode(), self.max_x, ignore)
+
   def get_at_cursor(self) -> str | None:
     if self.cursor.is_outside_bound_x():
       return None
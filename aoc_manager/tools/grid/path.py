@@ -0,0 +1,293 @@
+from collections import deque
+from dataclasses import dataclass, field
+from heapq import heappop, heappush
+from typing import Callable, Iterable, Optional
+
+from aoc_manager.tools.grid.array_map import ArrayGridMap
+from aoc_manager.tools.grid.map import GridMap
+
+
+unreachable: int = -1
+
+
+@dataclass
+class PathResult:
+  """Distances from the start cells to every cell of a grid, by flat cell index
+
+  A cell's flat index is y * max_x + x, as given by ArrayGridMap.index.
+  Cells that were not reached have a distance of -1.
+  """
+  distances: list[int]
+  previous: list[int]
+  max_x: int
+  target: int = field(default_factory=lambda: unreachable)
+
+  def get_distance(self, index: int) -> int:
+    return self.distances[index]
+
+  def is_reachable(self, index: int) -> bool:
+    return self.distances[index] != unreachable
+
+  def get_path(self, index: Optional[int] = None) -> list[int]:
+    """Reconstructs the shortest path from a start cell to a cell
+
+    Args:
+      index (Optional[int]): the cell to reach, or None for the search's target
+
+    Returns:
+      path (list[int]): the cells from the start to the cell, or [] if unreachable
+    """
+    if index is None:
+      index = self.target
+    if index == unreachable or self.distances[index] == unreachable:
+      return []
+    path: list[int] = []
+    while index != unreachable:
+      path.append(index)
+      index = self.previous[index]
+    return path[::-1]
+
+  def get_coordinates(self, path: list[int]) -> list[tuple[int, int]]:
+    """Converts flat cell indices into (x, y) coordinates"""
+    return [(index % self.max_x, index // self.max_x) for index in path]
+
+
+def bfs(grid_map: ArrayGridMap | GridMap, start: int | Iterable[int], walls: str = '#',
+        target: Optional[int] = None) -> PathResult:
+  """Finds the fewest orthogonal steps from the start cells to every open cell
+
+  Args:
+    grid_map (ArrayGridMap | GridMap): the grid to search
+    start (int | Iterable[int]): the flat index of the start cell, or several
+      start cells searched from at once
+    walls (str): the symbols of the cells that cannot be entered
+    target (Optional[int]): a cell at which to stop searching once it is reached
+
+  Returns:
+    result (PathResult): the distances and the previous cell of each reached cell
+  """
+  max_x, is_open = _get_open_cells(grid_map, walls)
+  width: int = max_x + 1
+  distances: list[int] = [unreachable] * len(is_open)
+  previous: list[int] = [unreachable] * len(is_open)
+  padded_target: int = unreachable if target is None else _pad(target, max_x)
+  queue: deque[int] = deque()
+  for index in _as_starts(start):
+    distances[_pad(index, max_x)] = 0
+    queue.append(_pad(index, max_x))
+
+  while queue:
+    index: int = queue.popleft()
+    if index == padded_target:
+      break
+    distance: int = distances[index] + 1
+    for neighbor in (index - width, index - 1, index + 1, index + width):
+      if is_open[neighbor] and distances[neighbor] == unreachable:
+        distances[neighbor] = distance
+        previous[neighbor] = index
+        queue.append(neighbor)
+  return _build_result(distances, previous, max_x, target)
+
+
+def bfs_01(grid_map: ArrayGridMap | GridMap, start: int | Iterable[int],
+           cost: Callable[[int, int], int], walls: str = '#',
+           target: Optional[int] = None) -> PathResult:
+  """Finds the cheapest paths when every step costs either 0 or 1
+
+  Zero-cost steps go to the front of a deque and unit-cost steps to the back,
+  which keeps the deque ordered by distance without a heap.
+
+  Args:
+    grid_map (ArrayGridMap | GridMap): the grid to search
+    start (int | Iterable[int]): the flat index of the start cell or cells
+    cost (Callable[[int, int], int]): the cost, 0 or 1, of stepping from the first
+      cell to the second
+    walls (str): the symbols of the cells that cannot be entered
+    target (Optional[int]): a cell at which to stop searching once it is reached
+
+  Returns:
+    result (PathResult): the distances and the previous cell of each reached cell
+  """
+  max_x, is_open = _get_open_cells(grid_map, walls)
+  width: int = max_x + 1
+  distances: list[int] = [unreachable] * len(is_open)
+  previous: list[int] = [unreachable] * len(is_open)
+  done: bytearray = bytearray(len(is_open))
+  padded_target: int = unreachable if target is None else _pad(target, max_x)
+  queue: deque[int] = deque()
+  for index in _as_starts(start):
+    distances[_pad(index, max_x)] = 0
+    queue.append(_pad(index, max_x))
+
+  while queue:
+    index: int = queue.popleft()
+    if done[index]:
+      continue
+    done[index] = 1
+    if index == padded_target:
+      break
+    flat_index: int = _unpad(index, max_x)
+    for neighbor in (index - width, index - 1, index + 1, index + width):
+      if not is_open[neighbor] or done[neighbor]:
+        continue
+      step: int = cost(flat_index, _unpad(neighbor, max_x))
+      distance: int = distances[index] + step
+      if distances[neighbor] == unreachable or distance < distances[neighbor]:
+        distances[neighbor] = distance
+        previous[neighbor] = index
+        if step == 0:
+          queue.appendleft(neighbor)
+        else:
+          queue.append(neighbor)
+  return _build_result(distances, previous, max_x, target)
+
+
+def dijkstra(grid_map: ArrayGridMap | GridMap, start: int | Iterable[int],
+             cost: Optional[Callable[[int, int], Optional[int]]] = None, walls: str = '#',
+             target: Optional[int] = None) -> PathResult:
+  """Finds the cheapest paths with non-negative step costs
+
+  Args:
+    grid_map (ArrayGridMap | GridMap): the grid to search
+    start (int | Iterable[int]): the flat index of the start cell or cells
+    cost (Optional[Callable[[int, int], Optional[int]]]): the cost of stepping
+      from the first cell to the second, or None if the step is not allowed.
+      Every step costs 1 when no cost function is given
+    walls (str): the symbols of the cells that cannot be entered
+    target (Optional[int]): a cell at which to stop searching once it is reached
+
+  Returns:
+    result (PathResult): the distances and the previous cell of each reached cell
+  """
+  return _search(grid_map, start, cost, walls, target, None)
+
+
+def a_star(grid_map: ArrayGridMap | GridMap, start: int | Iterable[int], target: int,
+           cost: Optional[Callable[[int, int], Optional[int]]] = None,
+           walls: str = '#') -> PathResult:
+  """Finds the cheapest path to a target, guided by the Manhattan distance to it
+
+  The Manhattan distance never overestimates when every step costs at least 1,
+  so the path found is the cheapest. With cheaper steps, use dijkstra instead.
+  Only the cells explored on the way have distances.
+
+  Args:
+    grid_map (ArrayGridMap | GridMap): the grid to search
+    start (int | Iterable[int]): the flat index of the start cell or cells
+    target (int): the flat index of the cell to reach
+    cost (Optional[Callable[[int, int], Optional[int]]]): the cost of stepping
+      from the first cell to the second, or None if the step is not allowed.
+      Every step costs 1 when no cost function is given
+    walls (str): the symbols of the cells that cannot be entered
+
+  Returns:
+    result (PathResult): the distances and the previous cell of each explored cell
+  """
+  width: int = grid_map.max_x + 1
+  target_y, target_x = divmod(_pad(target, grid_map.max_x), width)
+
+  def heuristic(index: int) -> int:
+    y, x = divmod(index, width)
+    return abs(x - target_x) + abs(y - target_y)
+
+  return _search(grid_map, start, cost, walls, target, heuristic)
+
+
+def _search(grid_map: ArrayGridMap | GridMap, start: int | Iterable[int],
+            cost: Optional[Callable[[int, int], Optional[int]]], walls: str,
+            target: Optional[int], heuristic: Optional[Callable[[int], int]]) -> PathResult:
+  """Runs Dijkstra, or A* when a heuristic of padded indices is given, with a binary heap"""
+  max_x, is_open = _get_open_cells(grid_map, walls)
+  width: int = max_x + 1
+  distances: list[int] = [unreachable] * len(is_open)
+  previous: list[int] = [unreachable] * len(is_open)
+  done: bytearray = bytearray(len(is_open))
+  padded_target: int = unreachable if target is None else _pad(target, max_x)
+  heap: list[tuple[int, int]] = []
+  for index in _as_starts(start):
+    index = _pad(index, max_x)
+    distances[index] = 0
+    heappush(heap, (heuristic(index) if heuristic else 0, index))
+
+  while heap:
+    _, index = heappop(heap)
+    if done[index]:
+      continue
+    done[index] = 1
+    if index == padded_target:
+      break
+    flat_index: int = _unpad(index, max_x)
+    for neighbor in (index - width, index - 1, index + 1, index + width):
+      if not is_open[neighbor] or done[neighbor]:
+        continue
+      step: Optional[int] = 1 if cost is None else cost(flat_index, _unpad(neighbor, max_x))
+      if step is None:
+        continue
+      distance: int = distances[index] + step
+      if distances[neighbor] == unreachable or distance < distances[neighbor]:
+        distances[neighbor] = distance
+        previous[neighbor] = index
+        priority: int = distance + heuristic(neighbor) if heuristic else distance
+        heappush(heap, (priority, neighbor))
+  return _build_result(distances, previous, max_x, target)
+
+
+def _get_open_cells(grid_map: ArrayGridMap | GridMap, walls: str) -> tuple[int, bytearray]:
+  """Builds a mask of the cells that can be entered, padded with a border of walls
+
+  The mask has a row of walls above and below the grid and a column of walls
+  after each row, which also sits before the next row. Each padded cell's four
+  neighbours are then index - width, index - 1, index + 1 and index + width,
+  where width is max_x + 1, without checking the grid's bounds.
+  """
+  if isinstance(grid_map, ArrayGridMap):
+    data: bytes | bytearray = grid_map.data
+  else:
+    data: bytes | bytearray = ''.join(
+      grid_map.render_row(y) for y in range(grid_map.max_y)
+    ).encode()
+  table: bytearray = bytearray([1]) * 256
+  for symbol in walls:
+    table[ord(symbol)] = 0
+  cells: bytes | bytearray = data.translate(table)
+
+  max_x: int = grid_map.max_x
+  width: int = max_x + 1
+  is_open: bytearray = bytearray(width * (grid_map.max_y + 2))
+  for y in range(grid_map.max_y):
+    is_open[(y + 1) * width:(y + 1) * width + max_x] = cells[y * max_x:(y + 1) * max_x]
+  return max_x, is_open
+
+
+def _pad(index: int, max_x: int) -> int:
+  """Converts a flat cell index into its index in the padded mask"""
+  return index + index // max_x + max_x + 1
+
+
+def _unpad(index: int, max_x: int) -> int:
+  """Converts an index in the padded mask back into a flat cell index"""
+  return index - index // (max_x + 1) - max_x
+
+
+def _as_starts(start: int | Iterable[int]) -> Iterable[int]:
+  return [start] if isinstance(start, int) else start
+
+
+def _build_result(distances: list[int], previous: list[int], max_x: int,
+                  target: Optional[int]) -> PathResult:
+  """Drops the padding from the searched arrays"""
+  width: int = max_x + 1
+  flat_distances: list[int] = []
+  flat_previous: list[int] = []
+  for start in range(width, len(distances) - width, width):
+    flat_distances.extend(distances[start:start + max_x])
+    flat_previous.extend(previous[start:start + max_x])
+  return PathResult(
+    distances=flat_distances,
+    previous=[
+      unreachable if index == unreachable else index - index // width - max_x
+      for index in flat_previous
+    ],
+    max_x=max_x,
+    target=unreachable if target is None else target
+  )
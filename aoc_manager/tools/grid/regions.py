@@ -0,0 +1,168 @@
+from dataclasses import dataclass
+from typing import Optional
+
+
+unlabeled: int = -1
+
+
+@dataclass
+class Region:
+  """Orthogonally connected cells sharing one symbol
+
+  The perimeter counts cell edges on the region's boundary, while sides counts
+  the straight runs those edges form, which equals the number of corners.
+  """
+  label: int
+  symbol: str
+  area: int
+  perimeter: int
+  sides: int
+  bounding_box: tuple[int, int, int, int]
+
+
+@dataclass
+class RegionLabels:
+  """Region label of every cell of a grid, by flat row-major cell index
+
+  Cells holding an ignored symbol have a label of -1.
+  """
+  labels: list[int]
+  regions: list[Region]
+  max_x: int
+
+  def get_label(self, x: int, y: int) -> int:
+    return self.labels[y * self.max_x + x]
+
+  def get_region(self, x: int, y: int) -> Optional[Region]:
+    label: int = self.get_label(x, y)
+    return None if label == unlabeled else self.regions[label]
+
+
+def label_cells(cells: bytes | bytearray, max_x: int, ignore: str = '') -> RegionLabels:
+  """Labels the regions of a row-major grid of single-byte cells in one pass
+
+  The first pass gives each cell the label of its left or upper neighbour when
+  they hold the same symbol, and records with union-find which labels meet, so
+  no recursion is needed however large a region is. The labels are then resolved
+  to their roots, and a final pass over a padded copy measures every region.
+
+  Args:
+    cells (bytes | bytearray): the cells of the grid, row by row
+    max_x (int): the width of the grid
+    ignore (str): the symbols of the cells that belong to no region
+
+  Returns:
+    region_labels (RegionLabels): the label of each cell and the regions by label
+  """
+  size: int = len(cells)
+  ignored: set[int] = {ord(symbol) for symbol in ignore}
+  labels: list[int] = [unlabeled] * size
+  # parent links provisional labels that turn out to belong to the same region
+  parent: list[int] = []
+
+  def find(label: int) -> int:
+    while parent[label] != label:
+      parent[label] = parent[parent[label]]
+      label = parent[label]
+    return label
+
+  for index in range(size):
+    value: int = cells[index]
+    if value in ignored:
+      continue
+    same_left: bool = index % max_x != 0 and cells[index - 1] == value
+    same_up: bool = index >= max_x and cells[index - max_x] == value
+    if same_left:
+      label: int = labels[index - 1]
+      if same_up and labels[index - max_x] != label:
+        # The left and upper cells were labelled apart but are one region
+        root, other_root = find(label), find(labels[index - max_x])
+        if root != other_root:
+          # The smaller label stays the root, so labels follow row-major order
+          parent[max(root, other_root)] = min(root, other_root)
+    elif same_up:
+      label: int = labels[index - max_x]
+    else:
+      label: int = len(parent)
+      parent.append(label)
+    labels[index] = label
+
+  # Resolve each provisional label to its root and number the roots from 0
+  final_labels: list[int] = [unlabeled] * len(parent)
+  count: int = 0
+  for label in range(len(parent)):
+    root: int = find(label)
+    if root == label:
+      final_labels[label] = count
+      count += 1
+    else:
+      final_labels[label] = final_labels[root]
+  labels = [unlabeled if label == unlabeled else final_labels[label] for label in labels]
+
+  return RegionLabels(
+    labels=labels,
+    regions=_measure_regions(cells, labels, max_x, count),
+    max_x=max_x
+  )
+
+
+def _measure_regions(cells: bytes | bytearray, labels: list[int], max_x: int,
+                     count: int) -> list[Region]:
+  """Measures each region's area, perimeter, sides and bounding box"""
+  max_y: int = len(labels) // max_x if max_x else 0
+  # Pad the labels with a border that matches no region, so neighbours need no bounds checks
+  width: int = max_x + 2
+  padded: list[int] = [unlabeled - 1] * (width * (max_y + 2))
+  for y in range(max_y):
+    start: int = (y + 1) * width + 1
+    padded[start:start + max_x] = labels[y * max_x:(y + 1) * max_x]
+
+  symbols: list[str] = [''] * count
+  areas: list[int] = [0] * count
+  perimeters: list[int] = [0] * count
+  corners: list[int] = [0] * count
+  min_xs: list[int] = [max_x] * count
+  min_ys: list[int] = [0] * count
+  max_xs: list[int] = [0] * count
+  max_ys: list[int] = [0] * count
+  for y in range(max_y):
+    index: int = (y + 1) * width
+    for x in range(max_x):
+      index += 1
+      label: int = padded[index]
+      if label == unlabeled:
+        continue
+      up: bool = padded[index - width] == label
+      down: bool = padded[index + width] == label
+      left: bool = padded[index - 1] == label
+      right: bool = padded[index + 1] == label
+      if not areas[label]:
+        # Cells are visited row by row, so a region's first cell is on its top row
+        symbols[label] = chr(cells[y * max_x + x])
+        min_ys[label] = y
+      areas[label] += 1
+      perimeters[label] += 4 - up - down - left - right
+      # A corner is either convex (both sides open) or concave (both sides closed, diagonal open)
+      corners[label] += (
+        (up == left and (not up or padded[index - width - 1] != label))
+        + (up == right and (not up or padded[index - width + 1] != label))
+        + (down == left and (not down or padded[index + width - 1] != label))
+        + (down == right and (not down or padded[index + width + 1] != label))
+      )
+      if x < min_xs[label]:
+        min_xs[label] = x
+      if x > max_xs[label]:
+        max_xs[label] = x
+      max_ys[label] = y
+
+  return [
+    Region(
+      label=label,
+      symbol=symbols[label],
+      area=areas[label],
+      perimeter=perimeters[label],
+      sides=corners[label],
+      bounding_box=(min_xs[label], min_ys[label], max_xs[label], max_ys[label])
+    )
+    for label in range(count)
+  ]
@@ -1,4 +1,12 @@
-from importlib import import_module
+from dataclasses import dataclass, field
+from glob import glob
+from importlib import import_module, invalidate_caches, reload
+from os import getcwd, path, stat
+from re import fullmatch, Match
+from sys import modules
+from threading import Lock, Thread
+from traceback import print_exc
+from types import ModuleType
 from typing import Optional
 
 from aoc_manager.tools.problem_solver import ProblemSolver
@@ -21,3 +29,118 @@ def import_solver(year: int, day: int) -> Optional[ProblemSolver]:
     )
   except ModuleNotFoundError:
     return None
+
+
+def discover_solvers(root: Optional[str] = None) -> list[tuple[int, int]]:
+  """Finds the year and day of every solver script under solutions/
+
+  Args:
+    root (Optional[str]): the directory containing solutions/, defaulting to the cwd
+
+  Returns:
+    solvers (list[tuple[int, int]]): the sorted (year, day) of each solver script
+  """
+  pattern: str = path.join(root or getcwd(), 'solutions', 'Y*', 'solutions', 'd*.py')
+  solvers: list[tuple[int, int]] = []
+  for file_path in glob(pattern):
+    year_dir: str = path.basename(path.dirname(path.dirname(file_path)))
+    year_match: Optional[Match[str]] = fullmatch(r'Y(\d+)', year_dir)
+    day_match: Optional[Match[str]] = fullmatch(r'd(\d+)\.py', path.basename(file_path))
+    if year_match and day_match:
+      solvers.append((int(year_match.group(1)), int(day_match.group(1))))
+  return sorted(solvers)
+
+
+@dataclass
+class SolverIndex:
+  """Cache of imported solver modules that re-imports only the solvers that changed
+
+  Looking a solver up costs a single stat() of its file. A module is reloaded
+  with importlib.reload when its modification time changes, so editing a solver
+  does not require restarting the app.
+  """
+  root: Optional[str] = field(default_factory=lambda: None)
+
+  modules: dict[tuple[int, int], tuple[int, ModuleType]] = field(init=False)
+
+  def __post_init__(self) -> None:
+    self.modules: dict[tuple[int, int], tuple[int, ModuleType]] = {}
+    self._lock: Lock = Lock()
+
+  def get_path(self, year: int, day: int) -> str:
+    """Retrieves the path of a solver script
+
+    Args:
+      year (int): the year of the solver
+      day (int): the day of the solver
+
+    Returns:
+      file_path (str): the path of the solver script, which may not exist
+    """
+    return path.join(self.root or getcwd(), 'solutions', f'Y{year}', 'solutions', f'd{day}.py')
+
+  def scan(self) -> list[tuple[int, int]]:
+    """Imports every discovered solver that is not cached or has changed
+
+    A solver that fails to import is reported and skipped, so one broken script
+    does not stop the rest from being indexed.
+
+    Returns:
+      solvers (list[tuple[int, int]]): the sorted (year, day) of each solver script
+    """
+    solvers: list[tuple[int, int]] = discover_solvers(self.root)
+    for year, day in solvers:
+      try:
+        self.get_solver(year, day)
+      except Exception:
+        print_exc()
+    return solvers
+
+  def start_scan(self) -> Thread:
+    """Warms the index from a daemon thread so the first lookups are instant
+
+    Returns:
+      thread (Thread): the started scan thread
+    """
+    thread: Thread = Thread(target=self.scan, name='solver-index-scan', daemon=True)
+    thread.start()
+    return thread
+
+  def get_solver(self, year: int, day: int) -> Optional[type[ProblemSolver]]:
+    """Retrieves a solver class, importing or reloading its module only if its file changed
+
+    Args:
+      year (int): the year of the solver
+      day (int): the day of the solver
+
+    Returns:
+      solver (Optional[type[ProblemSolver]]): if applicable, the applicable ProblemSolver
+    """
+    key: tuple[int, int] = (year, day)
+    name: str = f'solutions.Y{year}.solutions.d{day}'
+    try:
+      modified_ns: int = stat(self.get_path(year, day)).st_mtime_ns
+    except OSError:
+      with self._lock:
+        self.modules.pop(key, None)
+      return None
+
+    with self._lock:
+      cached: Optional[tuple[int, ModuleType]] = self.modules.get(key)
+      if cached is None:
+        # Solvers created since startup are invisible to the import system's directory cache
+        invalidate_caches()
+        imported: bool = name in modules
+        module: ModuleType = import_module(name)
+        if imported:
+          # A module imported before it was indexed may predate the file's last edit
+          module = reload(module)
+      elif cached[0] != modified_ns:
+        module: ModuleType = reload(cached[1])
+      else:
+        module: ModuleType = cached[1]
+      self.modules[key] = (modified_ns, module)
+    return getattr(module, f'D{day}Solver', None)
+
+
+solver_index: SolverIndex = SolverIndex()
@@ -0,0 +1,172 @@
+from collections import OrderedDict
+from copy import deepcopy
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from sys import getsizeof
+from threading import Lock
+from typing import Any, Callable, Optional
+
+
+# Parsed values that cannot be mutated in place and are safe to share as-is
+immutable_types: tuple[type, ...] = (str, bytes, int, float, bool, type(None))
+
+
+@dataclass
+class InputCache:
+  """LRU cache of parsed inputs keyed by input content hash and input format
+
+  Only immutable parses are shared between consumers: NumPy arrays are cached
+  read-only, while lists, DataFrames and other mutable values are copied for
+  every consumer so one part cannot mutate another part's input.
+  """
+  max_bytes: int = field(default_factory=lambda: 512 * 1024 * 1024)
+  max_entries: int = field(default_factory=lambda: 64)
+
+  entries: OrderedDict[tuple[str, Any], tuple[Any, int]] = field(init=False)
+  current_bytes: int = field(init=False)
+  hits: int = field(init=False)
+  misses: int = field(init=False)
+
+  def __post_init__(self) -> None:
+    self.entries: OrderedDict[tuple[str, Any], tuple[Any, int]] = OrderedDict()
+    self.current_bytes: int = 0
+    self.hits: int = 0
+    self.misses: int = 0
+    self._lock: Lock = Lock()
+
+  @staticmethod
+  def hash_text(text: str) -> str:
+    """Hashes an input text for use as a cache key
+
+    Args:
+      text (str): the raw input text
+
+    Returns:
+      text_hash (str): the hex digest of the text
+    """
+    return blake2b(text.encode(), digest_size=16).hexdigest()
+
+  @staticmethod
+  def estimate_size(value: Any) -> int:
+    """Estimates the memory footprint of a parsed input in bytes
+
+    Arrays and DataFrames report their own buffer sizes; nested lists and
+    tuples are walked iteratively so deep inputs cannot hit the recursion limit.
+
+    Args:
+      value (Any): the parsed input
+
+    Returns:
+      size (int): the estimated size in bytes
+    """
+    size: int = 0
+    stack: list[Any] = [value]
+    while stack:
+      item: Any = stack.pop()
+      if hasattr(item, 'nbytes'):
+        size += int(item.nbytes)
+      elif hasattr(item, 'estimated_size'):
+        size += int(item.estimated_size())
+      elif isinstance(item, (list, tuple)):
+        size += getsizeof(item)
+        stack.extend(item)
+      else:
+        size += getsizeof(item)
+    return size
+
+  @staticmethod
+  def freeze(value: Any) -> Any:
+    """Marks a parsed NumPy array read-only so it can be shared safely
+
+    Args:
+      value (Any): the parsed input
+
+    Returns:
+      value (Any): the same parsed input, read-only if it is an array
+    """
+    if hasattr(value, 'flags') and hasattr(value, 'nbytes'):
+      value.flags.writeable = False
+    return value
+
+  @classmethod
+  def copy_for_consumer(cls, value: Any) -> Any:
+    """Hands a cached parse to a consumer without exposing the cached object
+
+    Immutable values and read-only arrays are shared, DataFrames are cloned
+    and lists are copied down to their immutable items.
+
+    Args:
+      value (Any): the cached parsed input
+
+    Returns:
+      value (Any): a parsed input the consumer is free to mutate or read
+    """
+    if isinstance(value, immutable_types):
+      return value
+    if hasattr(value, 'flags') and not value.flags.writeable:
+      return value
+    if hasattr(value, 'clone'):
+      return value.clone()
+    if isinstance(value, list):
+      return [cls.copy_for_consumer(item) for item in value]
+    if isinstance(value, tuple):
+      return tuple(cls.copy_for_consumer(item) for item in value)
+    return deepcopy(value)
+
+  def get_or_parse(self, text: str, input_format: Any,
+                   parse: Callable[[str], Any],
+                   text_hash: Optional[str] = None) -> Any:
+    """Retrieves a parsed input from the cache, parsing and storing it on a miss
+
+    Args:
+      text (str): the raw input text
+      input_format (Any): the format the text is parsed into
+      parse (Callable[[str], Any]): parses the text into the input format
+      text_hash (Optional[str]): the precomputed hash of the text, if known
+
+    Returns:
+      parsed (Any): the parsed input, owned by the caller unless immutable
+    """
+    key: tuple[str, Any] = (text_hash or self.hash_text(text), input_format)
+
+    with self._lock:
+      hit: bool = key in self.entries
+      if hit:
+        self.entries.move_to_end(key)
+        self.hits += 1
+        cached: Any = self.entries[key][0]
+      else:
+        self.misses += 1
+    if hit:
+      return self.copy_for_consumer(cached)
+
+    parsed: Any = self.freeze(parse(text))
+    size: int = self.estimate_size(parsed)
+
+    # Inputs that could never fit are handed back without evicting everything else
+    if size > self.max_bytes:
+      return parsed
+
+    with self._lock:
+      if key not in self.entries:
+        self.entries[key] = (parsed, size)
+        self.current_bytes += size
+      self._evict()
+    return self.copy_for_consumer(parsed)
+
+  def clear(self) -> None:
+    """Removes every parsed input from the cache"""
+    with self._lock:
+      self.entries.clear()
+      self.current_bytes = 0
+
+  def _evict(self) -> None:
+    """Evicts least-recently-used entries until the cache is within budget"""
+    while self.entries and (
+      self.current_bytes > self.max_bytes or len(self.entries) > self.max_entries
+    ):
+      _, (_, size) = self.entries.popitem(last=False)
+      self.current_bytes -= size
+
+
+input_cache: InputCache = InputCache()
@@ -0,0 +1,145 @@
+import polars as pl
+
+from enum import Enum
+from re import findall
+from types import ModuleType
+from typing import Any, Callable
+
+
+class InputFormat(Enum):
+  """Built-in vectorized input formats a solver can request"""
+  DIGIT_GRID = 'digit_grid'
+  CHAR_GRID = 'char_grid'
+  INTEGERS = 'integers'
+  DATAFRAME = 'dataframe'
+
+
+# Maps an input format to the parser that builds it from raw input text
+input_parsers: dict[Any, Callable[[str], Any]] = {}
+
+
+def register_input_format(input_format: Any) -> Callable:
+  """Registers a parser for an input format
+
+  Solvers can extend the registry with their own formats:
+
+    @register_input_format('points')
+    def parse_points(text: str) -> list[tuple[int, int]]:
+      ...
+
+  Args:
+    input_format (Any): the hashable key solvers pass as their input_format
+
+  Returns:
+    decorator (Callable): registers the decorated parser and returns it unchanged
+  """
+  def decorator(parser: Callable[[str], Any]) -> Callable[[str], Any]:
+    input_parsers[input_format] = parser
+    return parser
+  return decorator
+
+
+def parse_input(text: str, input_format: Any) -> Any:
+  """Parses raw input text into an input format
+
+  Registered formats take precedence; any other callable is applied per line,
+  with empty lines parsed as -1.
+
+  Args:
+    text (str): the raw input text
+    input_format (Any): the registered format or a per-line callable
+
+  Returns:
+    parsed (Any): the parsed input
+  """
+  parser: Callable[[str], Any] | None = input_parsers.get(input_format)
+  if parser is not None:
+    return parser(text)
+  if callable(input_format):
+    return list(map(lambda i: input_format(i) if i != '' else -1, _lines(text)))
+  raise NotImplementedError(f'Error: no parser is registered for {input_format}.')
+
+
+def _lines(text: str) -> list[str]:
+  """Splits raw input text into lines"""
+  return list(map(lambda l: l.replace('\n', ''), text.splitlines()))
+
+
+def _numpy() -> ModuleType:
+  """Imports numpy, which is only required by the array formats"""
+  try:
+    import numpy
+  except ModuleNotFoundError as e:
+    raise ModuleNotFoundError(
+      'Error: NumPy input formats require numpy, installed with the numpy extra.'
+    ) from e
+  return numpy
+
+
+def _byte_grid(text: str) -> Any:
+  """Views rectangular input text as a 2D uint8 array with a single buffer copy
+
+  Args:
+    text (str): the raw grid text
+
+  Returns:
+    grid (numpy.ndarray): a read-only (rows, width) view of the character codes
+  """
+  np: ModuleType = _numpy()
+  data: bytes = text.replace('\r', '').strip('\n').encode() + b'\n'
+  width: int = data.index(b'\n')
+  if len(data) % (width + 1) != 0:
+    raise ValueError('Error: every grid row must have the same width.')
+  rows: Any = np.frombuffer(data, dtype=np.uint8).reshape(-1, width + 1)
+  if not (rows[:, width] == ord('\n')).all():
+    raise ValueError('Error: every grid row must have the same width.')
+  return rows[:, :width]
+
+
+@register_input_format(str)
+def _parse_str(text: str) -> str:
+  return text
+
+
+@register_input_format(list[str])
+def _parse_lines(text: str) -> list[str]:
+  return _lines(text)
+
+
+@register_input_format(list[list[int]])
+def _parse_digit_lists(text: str) -> list[list[int]]:
+  return list(map(lambda l: [int(i) for i in l], _lines(text)))
+
+
+@register_input_format(list[list[str]])
+def _parse_char_lists(text: str) -> list[list[str]]:
+  return list(map(lambda l: [i for i in l], _lines(text)))
+
+
+@register_input_format(InputFormat.DIGIT_GRID)
+def _parse_digit_grid(text: str) -> Any:
+  return _byte_grid(text) - ord('0')
+
+
+@register_input_format(InputFormat.CHAR_GRID)
+def _parse_char_grid(text: str) -> Any:
+  return _byte_grid(text)
+
+
+@register_input_format(InputFormat.INTEGERS)
+def _parse_integers(text: str) -> Any:
+  np: ModuleType = _numpy()
+  return np.fromiter(map(int, findall(r'-?\d+', text)), dtype=np.int64)
+
+
+@register_input_format(InputFormat.DATAFRAME)
+def _parse_dataframe(text: str) -> pl.DataFrame:
+  lines: list[str] = _lines(text)
+  if not lines:
+    return pl.DataFrame()
+  tokens: pl.Series = pl.Series('line', lines, dtype=pl.String).str.extract_all(r'\S+')
+  width: int = tokens.list.len().max() or 0
+  return pl.DataFrame([
+    tokens.list.get(i, null_on_oob=True).alias(f'column_{i}')
+    for i in range(width)
+  ])
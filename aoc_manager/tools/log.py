@@ -1,5 +1,11 @@
-from dataclasses import dataclass
-from typing import Any
+from collections import deque
+from dataclasses import dataclass, field
+from queue import Empty, Queue
+from random import randrange
+from threading import Lock, Thread
+from time import monotonic
+from traceback import print_exc
+from typing import Any, Callable, Optional
 
 
 @dataclass
@@ -12,3 +18,178 @@ class Log:
   def print(self):
     """Prints the log in context"""
     print(f'[{self.level}:{self.label}] {str(self.data)}')
+
+
+@dataclass
+class LogSettings:
+  """Configures how many debug log lines a solver keeps per phase
+
+  Modes:
+    head: keeps the first `limit` lines of each phase
+    ring: keeps the last `limit` lines of each phase
+    sample: keeps a uniform random sample of `limit` lines of each phase
+  """
+  limit: int = field(default_factory=lambda: 10_000)
+  mode: str = field(default_factory=lambda: 'head')
+  labels: Optional[frozenset[str]] = field(default_factory=lambda: None)
+
+  def __post_init__(self) -> None:
+    if self.mode not in ['head', 'ring', 'sample']:
+      raise ValueError(f'Error: unknown log mode {self.mode}.')
+    if self.limit < 1:
+      raise ValueError('Error: the log limit must be at least 1.')
+
+
+@dataclass
+class LogBuffer:
+  """Bounded, per-phase buffer of formatted debug log lines
+
+  Lines are only formatted once they are accepted, so filtered lines and lines
+  beyond a head limit cost almost nothing. Accepted lines are formatted right away
+  so later mutations of the logged objects do not change them.
+  """
+  settings: LogSettings = field(default_factory=LogSettings)
+
+  records: dict[str, deque[tuple[int, str, str]]] = field(init=False)
+  seen: dict[str, int] = field(init=False)
+  dropped: dict[str, int] = field(init=False)
+
+  def __post_init__(self) -> None:
+    self.records: dict[str, deque[tuple[int, str, str]]] = {}
+    self.seen: dict[str, int] = {}
+    self.dropped: dict[str, int] = {}
+
+  @staticmethod
+  def format_line(line: Any, args: tuple) -> str:
+    """Formats a log line
+
+    Args:
+      line (Any): the line, a %-style format string if args are given, or a callable
+        that produces the line
+      args (tuple): the %-style format arguments
+
+    Returns:
+      data (str): the formatted line
+    """
+    if callable(line):
+      line = line()
+    if args:
+      return str(line) % args
+    return str(line)
+
+  def add(self, context: str, label: str, line: Any, args: tuple = ()) -> None:
+    """Adds a line to a phase's buffer, subject to the label filter and limit
+
+    Args:
+      context (str): the phase the line was logged in
+      label (str): the label of the line
+      line (Any): the line to log
+      args (tuple): the %-style format arguments of the line
+    """
+    labels: Optional[frozenset[str]] = self.settings.labels
+    if labels and label not in labels:
+      return
+
+    seen: int = self.seen.get(context, 0)
+    self.seen[context] = seen + 1
+    records: Optional[deque[tuple[int, str, str]]] = self.records.get(context)
+    if records is None:
+      records = self.records[context] = deque(
+        maxlen=self.settings.limit if self.settings.mode == 'ring' else None
+      )
+
+    if len(records) < self.settings.limit:
+      records.append((seen, label, self.format_line(line, args)))
+      return
+
+    self.dropped[context] = self.dropped.get(context, 0) + 1
+    if self.settings.mode == 'ring':
+      records.append((seen, label, self.format_line(line, args)))
+    elif self.settings.mode == 'sample':
+      # Reservoir sampling keeps every line seen so far with equal probability
+      slot: int = randrange(seen + 1)
+      if slot < self.settings.limit:
+        records[slot] = (seen, label, self.format_line(line, args))
+
+  def drain(self) -> dict[str, list[tuple[str, str]]]:
+    """Removes and returns every buffered line in logged order
+
+    Returns:
+      lines (dict[str, list[tuple[str, str]]]): the (label, data) lines of each phase
+    """
+    lines: dict[str, list[tuple[str, str]]] = {
+      context: [(label, data) for _, label, data in sorted(records)]
+      for context, records in self.records.items()
+    }
+    self.records.clear()
+    return lines
+
+
+@dataclass
+class LogSink:
+  """Writes log rows from a background thread in size- and time-bounded batches
+
+  Solvers hand their rows to put() and carry on, so Delta commits never sit on a
+  solver's critical path. Call flush() at the end of a run to wait for the writes.
+  """
+  write: Callable[[list[dict[str, Any]]], None]
+  batch_size: int = field(default_factory=lambda: 50_000)
+  flush_interval: float = field(default_factory=lambda: 1.0)
+
+  failed_batches: int = field(init=False)
+
+  def __post_init__(self) -> None:
+    self.failed_batches: int = 0
+    self._queue: Queue[Optional[list[dict[str, Any]]]] = Queue()
+    self._thread: Optional[Thread] = None
+    self._lock: Lock = Lock()
+
+  def put(self, rows: list[dict[str, Any]]) -> None:
+    """Queues log rows for writing
+
+    Args:
+      rows (list[dict[str, Any]]): the log rows to write
+    """
+    if not rows:
+      return
+    with self._lock:
+      if self._thread is None or not self._thread.is_alive():
+        self._thread = Thread(target=self._run, name='log-sink', daemon=True)
+        self._thread.start()
+    self._queue.put(rows)
+
+  def flush(self) -> None:
+    """Writes any pending batch immediately and blocks until every queued row is written"""
+    with self._lock:
+      if self._thread is None:
+        return
+    # A None marker ends the batch being collected instead of waiting out the interval
+    self._queue.put(None)
+    self._queue.join()
+
+  def _run(self) -> None:
+    """Collects queued rows into batches and writes them until the process exits"""
+    while True:
+      items: list[Optional[list[dict[str, Any]]]] = [self._queue.get()]
+      batch: list[dict[str, Any]] = list(items[0] or [])
+      deadline: float = monotonic() + self.flush_interval
+      while items[-1] is not None and len(batch) < self.batch_size:
+        remaining: float = deadline - monotonic()
+        if remaining <= 0:
+          break
+        try:
+          item: Optional[list[dict[str, Any]]] = self._queue.get(timeout=remaining)
+        except Empty:
+          break
+        items.append(item)
+        batch.extend(item or [])
+
+      try:
+        if batch:
+          self.write(batch)
+      except Exception:
+        self.failed_batches += 1
+        print_exc()
+      finally:
+        for _ in items:
+          self._queue.task_done()
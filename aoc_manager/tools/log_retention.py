@@ -0,0 +1,106 @@
+import polars as pl
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, UTC
+from threading import Thread
+from time import sleep
+from traceback import print_exc
+
+from aoc_manager.tables.log import \
+  table as tab_aoc_log
+from aoc_manager.tools.delete import delete_rows
+
+
+@dataclass
+class LogRetention:
+  """Decides which runs' debug logs are kept in aoc.log"""
+  max_runs: int = field(default_factory=lambda: 100)
+  max_age: timedelta = field(default_factory=lambda: timedelta(days=30))
+  interval: float = field(default_factory=lambda: 3_600.0)
+
+  def get_expired_run_ids(self, runs: pl.DataFrame, now: datetime) -> list[str]:
+    """Finds the runs that fall outside the retention policy
+
+    Args:
+      runs (pl.DataFrame): one row per run with its run_id and last _logged_ts in UTC
+      now (datetime): the current time, read as local time if it is naive
+
+    Returns:
+      run_ids (list[str]): the ids of the runs whose logs should be deleted
+    """
+    # _logged_ts is timezone-aware, and polars cannot compare it to a naive datetime
+    now: datetime = now.astimezone(UTC)
+    return runs \
+      .sort('_logged_ts', descending=True) \
+      .with_row_index('rank') \
+      .filter(
+        (pl.col('rank') >= self.max_runs)
+        | (pl.col('_logged_ts') < now - self.max_age)
+      ) \
+      .get_column('run_id') \
+      .to_list()
+
+
+def get_log_runs() -> pl.DataFrame:
+  """Lists the runs with logs in aoc.log and when their logs were last written
+
+  aoc.log is partitioned by run, so the runs come from the file entries of the
+  Delta log without reading any log rows.
+
+  Returns:
+    runs (pl.DataFrame): one row per run with its run_id and last _logged_ts in UTC
+  """
+  files: pl.DataFrame = pl.from_arrow(tab_aoc_log.get_as_delta_table().get_add_actions(flatten=True))
+  if files.is_empty():
+    return pl.DataFrame(schema={'run_id': pl.String, '_logged_ts': pl.Datetime('us', 'UTC')})
+  return files \
+    .group_by(pl.col('partition.run_id').alias('run_id')) \
+    .agg(
+      pl.col('modification_time').max()
+        .cast(pl.Datetime('us'))
+        .dt.replace_time_zone('UTC')
+        .alias('_logged_ts')
+    )
+
+
+def vacuum_logs(retention: LogRetention) -> int:
+  """Deletes the debug logs of every run outside the retention policy
+
+  Expired runs are dropped a whole partition at a time, so no files are rewritten
+  and concurrent appends from running solvers are never lost.
+
+  Args:
+    retention (LogRetention): the retention policy
+
+  Returns:
+    runs (int): the number of runs whose logs were deleted
+  """
+  run_ids: list[str] = retention.get_expired_run_ids(get_log_runs(), datetime.now(UTC))
+  if not run_ids:
+    return 0
+
+  delete_rows(tab_aoc_log, {'run_id': run_ids})
+  tab_aoc_log.get_as_delta_table().vacuum(dry_run=False)
+  return len(run_ids)
+
+
+def start_log_vacuum(retention: LogRetention) -> Thread:
+  """Periodically vacuums aoc.log from a background thread
+
+  Args:
+    retention (LogRetention): the retention policy and vacuum interval
+
+  Returns:
+    thread (Thread): the started daemon thread
+  """
+  def run() -> None:
+    while True:
+      try:
+        vacuum_logs(retention)
+      except Exception:
+        print_exc()
+      sleep(retention.interval)
+
+  thread: Thread = Thread(target=run, name='log-vacuum', daemon=True)
+  thread.start()
+  return thread
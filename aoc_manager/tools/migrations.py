@@ -0,0 +1,103 @@
+import polars as pl
+
+from deltalake import DeltaTable, Field
+from os import path, rename
+from polta.table import Table
+from shutil import rmtree
+from typing import Optional
+
+
+def add_missing_columns(table: Table) -> list[str]:
+  """Adds the columns of a table's schema that its existing Delta table predates
+
+  Delta tables created by an older version of the app keep their original
+  schema, so appends with newer columns would fail. The missing columns are
+  added as nullable columns, leaving them null in the rows already saved.
+
+  Args:
+    table (Table): the Polta table whose Delta table to migrate
+
+  Returns:
+    columns (list[str]): the names of the columns that were added
+  """
+  delta_table: DeltaTable = table.get_as_delta_table()
+  existing: set[str] = {delta_field.name for delta_field in delta_table.schema().fields}
+  missing: list[Field] = [
+    schema_field for schema_field in table.schema.deltalake.fields
+    if schema_field.name not in existing
+  ]
+  if missing:
+    delta_table.alter.add_columns(missing)
+  return [schema_field.name for schema_field in missing]
+
+
+def partition_table(table: Table, keep: Optional[pl.Expr] = None) -> bool:
+  """Rewrites a Delta table created before its partition keys were set, partitioned by them
+
+  Delta cannot change a table's partitioning in place, so the existing rows are
+  read, conformed to the current schema with nulls in new columns, and written
+  in full to a staging table beside it. Only then is the staging table swapped
+  in, so a failed rewrite leaves the original table untouched. A swap that was
+  interrupted is completed the next time this runs.
+
+  Run it once at startup in the app's own process, before anything else reads
+  or writes the table.
+
+  Args:
+    table (Table): the Polta table whose Delta table to migrate
+    keep (Optional[pl.Expr]): filters the existing rows to carry over, defaulting to all
+
+  Returns:
+    migrated (bool): whether the table was rewritten
+  """
+  staging_path: str = f'{table.table_path}.partitioned'
+  backup_path: str = f'{table.table_path}.unpartitioned'
+  _finish_swap(table.table_path, staging_path, backup_path)
+
+  delta_table: DeltaTable = table.get_as_delta_table()
+  if delta_table.metadata().partition_columns == table.partition_keys:
+    return False
+
+  schema: dict[str, pl.DataType] = table.schema.polars
+  df: pl.DataFrame = pl.scan_delta(delta_table).collect()
+  df: pl.DataFrame = df \
+    .with_columns([
+      pl.lit(None, dtype).alias(name)
+      for name, dtype in schema.items()
+      if name not in df.columns
+    ]) \
+    .select(list(schema)) \
+    .cast(schema)
+  if keep is not None:
+    df: pl.DataFrame = df.filter(keep)
+
+  rmtree(staging_path, ignore_errors=True)
+  DeltaTable.create(staging_path, table.schema.deltalake, partition_by=table.partition_keys)
+  if not df.is_empty():
+    df.write_delta(staging_path, mode='append')
+
+  rename(table.table_path, backup_path)
+  _finish_swap(table.table_path, staging_path, backup_path)
+  return True
+
+
+def _finish_swap(table_path: str, staging_path: str, backup_path: str) -> None:
+  """Completes or rolls back a partitioning swap left behind by partition_table
+
+  The backup only exists once the staging table is complete, so a staging
+  table without a backup is an unfinished rewrite and is discarded, while a
+  backup means the staging table replaces whatever is at the table path.
+
+  Args:
+    table_path (str): the path of the live Delta table
+    staging_path (str): the path of the fully written, partitioned table
+    backup_path (str): the path the original table was moved to
+  """
+  if not path.exists(backup_path):
+    rmtree(staging_path, ignore_errors=True)
+    return
+  if path.exists(staging_path):
+    # An interrupted swap may have let an empty table be created at the table path
+    rmtree(table_path, ignore_errors=True)
+    rename(staging_path, table_path)
+  rmtree(backup_path)
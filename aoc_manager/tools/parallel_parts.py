@@ -0,0 +1,189 @@
+import pickle
+import traceback
+
+from dataclasses import dataclass, field, replace
+from multiprocessing import current_process, get_context
+from multiprocessing.connection import Connection
+from multiprocessing.context import SpawnContext, SpawnProcess
+from os import _exit, getppid
+from threading import Thread
+from time import sleep
+from typing import Any, Callable, Optional
+
+try:
+  import resource
+except ImportError:
+  # CPU-time limits are only available on Unix
+  resource = None
+
+from aoc_manager.tools.phase_metrics import PhaseMetrics
+from aoc_manager.tools.problem_solver import ProblemSolver
+from aoc_manager.tools.profiler import PhaseProfile
+
+
+@dataclass
+class PartOutcome:
+  """Everything a part's process sends back to be merged into the parent's solver"""
+  part: str
+  answer: Any = field(default_factory=lambda: None)
+  processing_time: float = field(default_factory=lambda: 0.00)
+  metrics: PhaseMetrics = field(default_factory=PhaseMetrics)
+  run_id: str = field(default_factory=lambda: '')
+  profile: Optional[PhaseProfile] = field(default_factory=lambda: None)
+  log_rows: list[dict[str, Any]] = field(default_factory=lambda: [])
+  dropped_logs: int = field(default_factory=lambda: 0)
+  error: str = field(default_factory=lambda: '')
+
+
+def can_run_parts_in_parallel() -> bool:
+  """Whether parts can run in child processes of the current process
+
+  Daemonic processes, such as process pool workers, may not have children, so
+  their parts run in turn.
+
+  Returns:
+    available (bool): whether the parts can run in child processes
+  """
+  return not current_process().daemon
+
+
+def run_parts_in_parallel(solver: ProblemSolver, errors: dict[str, str],
+                          on_start: Optional[Callable[[], None]] = None) -> bool:
+  """Runs Part A and Part B of a pre-processed solver in two spawned processes
+
+  The parts are spawned rather than forked, since forking after polars and
+  deltalake have started their Rust threads can deadlock the children. The
+  pre-processed solver is pickled once and sent to both. Answers, timings,
+  metrics, profiles and logs are merged back into the solver as each part
+  finishes. Any CPU-time limit left to this process is split between the parts.
+
+  Args:
+    solver (ProblemSolver): the pre-processed solver
+    errors (dict[str, str]): the tracebacks of the phases that failed, updated in place
+    on_start (Optional[Callable[[], None]]): called once the solver is pickled, just
+      before both parts start
+
+  Returns:
+    ran (bool): whether the parts ran, False if the solver cannot be pickled
+  """
+  try:
+    data: bytes = pickle.dumps(solver, protocol=pickle.HIGHEST_PROTOCOL)
+  except Exception:
+    return False
+  if on_start is not None:
+    on_start()
+
+  context: SpawnContext = get_context('spawn')
+  cpu_time: Optional[int] = get_part_cpu_time()
+  workers: dict[str, tuple[SpawnProcess, Connection]] = {}
+  for part in ['a', 'b']:
+    receiver, sender = context.Pipe(duplex=False)
+    process: SpawnProcess = context.Process(
+      target=_run_spawned_part,
+      args=(data, part, cpu_time, sender),
+      name=f'solver-part-{part}',
+      daemon=True
+    )
+    process.start()
+    sender.close()
+    workers[part] = (process, receiver)
+  del data
+
+  for part, (process, receiver) in workers.items():
+    try:
+      outcome: PartOutcome = receiver.recv()
+    except EOFError:
+      process.join()
+      outcome: PartOutcome = PartOutcome(
+        part=part,
+        error=f'Error: the Part {part.upper()} process exited with code {process.exitcode}.'
+      )
+    finally:
+      process.join()
+      receiver.close()
+    _merge_outcome(solver, outcome, errors)
+  return True
+
+
+def get_part_cpu_time() -> Optional[int]:
+  """Splits the CPU time left under this process's limit between the two parts
+
+  Each process's CPU time is counted separately, so without the split the parts
+  could use up to twice the budget of the run.
+
+  Returns:
+    cpu_time (Optional[int]): each part's CPU-time limit in seconds, or None if unlimited
+  """
+  if resource is None:
+    return None
+  limit, _ = resource.getrlimit(resource.RLIMIT_CPU)
+  if limit == resource.RLIM_INFINITY:
+    return None
+  usage: Any = resource.getrusage(resource.RUSAGE_SELF)
+  remaining: float = limit - usage.ru_utime - usage.ru_stime
+  return max(int(remaining // 2), 1)
+
+
+def _run_spawned_part(data: bytes, part: str, cpu_time: Optional[int],
+                      sender: Connection) -> None:
+  """Entry point of a part's process, which reports back through the pipe"""
+  parent_id: int = getppid()
+  Thread(target=_exit_with_parent, args=(parent_id,), daemon=True).start()
+  if cpu_time is not None:
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu_time, cpu_time + 1))
+
+  try:
+    solver: ProblemSolver = pickle.loads(data)
+  except Exception:
+    sender.send(PartOutcome(part=part, error=traceback.format_exc()))
+    return
+  del data
+
+  log_rows: list[dict[str, Any]] = []
+  solver.log_writer = log_rows.extend
+  error: str = ''
+  try:
+    getattr(solver, f'run_{part}')()
+  except Exception:
+    error = traceback.format_exc()
+
+  outcome: PartOutcome = PartOutcome(
+    part=part,
+    answer=getattr(solver, f'answer_{part}'),
+    processing_time=getattr(solver, f'{part}_processing_time'),
+    metrics=getattr(solver, f'{part}_metrics'),
+    run_id=getattr(solver, f'run_id_{part}'),
+    profile=solver.profiles.get(part),
+    log_rows=log_rows,
+    dropped_logs=solver.dropped_logs.get(part, 0),
+    error=error
+  )
+  try:
+    sender.send(outcome)
+  except Exception:
+    sender.send(replace(outcome, answer=str(outcome.answer)))
+  sender.close()
+
+
+def _exit_with_parent(parent_id: int) -> None:
+  """Exits a part's process once its parent is gone, e.g. after being killed on timeout"""
+  while getppid() == parent_id:
+    sleep(0.5)
+  _exit(1)
+
+
+def _merge_outcome(solver: ProblemSolver, outcome: PartOutcome, errors: dict[str, str]) -> None:
+  """Merges a part's outcome back into the parent's solver"""
+  part: str = outcome.part
+  setattr(solver, f'answer_{part}', outcome.answer)
+  setattr(solver, f'{part}_processing_time', outcome.processing_time)
+  setattr(solver, f'{part}_metrics', outcome.metrics)
+  setattr(solver, f'run_id_{part}', outcome.run_id)
+  if outcome.profile is not None:
+    solver.profiles[part] = outcome.profile
+  if outcome.dropped_logs:
+    solver.dropped_logs[part] = outcome.dropped_logs
+  solver.log_writer(outcome.log_rows)
+  solver.total_processing_time = solver.get_total_processing_time()
+  if outcome.error:
+    errors[part] = outcome.error
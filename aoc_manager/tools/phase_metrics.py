@@ -0,0 +1,90 @@
+import gc
+import tracemalloc
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter_ns, process_time_ns
+from typing import Iterator
+
+
+@dataclass
+class PhaseMetrics:
+  """Resource usage of one solver phase"""
+  wall_time_ns: int = field(default_factory=lambda: 0)
+  cpu_time_ns: int = field(default_factory=lambda: 0)
+  peak_memory_bytes: int = field(default_factory=lambda: 0)
+  gc_collections: int = field(default_factory=lambda: 0)
+  gc_time_ns: int = field(default_factory=lambda: 0)
+
+  @property
+  def wall_time(self) -> float:
+    """Wall time of the phase in seconds"""
+    return self.wall_time_ns / 1e9
+
+  @property
+  def cpu_time(self) -> float:
+    """Process CPU time of the phase in seconds"""
+    return self.cpu_time_ns / 1e9
+
+  @property
+  def gc_time(self) -> float:
+    """Time spent in garbage collection during the phase in seconds"""
+    return self.gc_time_ns / 1e9
+
+
+@contextmanager
+def measure_phase(trace_memory: bool = False) -> Iterator[PhaseMetrics]:
+  """Measures the wall time, CPU time, GC activity and peak memory of a block
+
+  Memory tracing uses tracemalloc, which slows allocation-heavy code noticeably,
+  so it is only enabled on request. The metrics are filled in even if the block
+  raises.
+
+  Args:
+    trace_memory (bool): whether to trace the peak memory allocated in the block
+
+  Yields:
+    metrics (PhaseMetrics): the metrics, populated once the block exits
+  """
+  metrics: PhaseMetrics = PhaseMetrics()
+  gc_started_at: list[int] = []
+
+  def on_gc(phase: str, info: dict) -> None:
+    if phase == 'start':
+      gc_started_at.append(perf_counter_ns())
+    elif gc_started_at:
+      metrics.gc_time_ns += perf_counter_ns() - gc_started_at.pop()
+
+  started_tracing: bool = False
+  memory_baseline: int = 0
+  if trace_memory:
+    if tracemalloc.is_tracing():
+      tracemalloc.reset_peak()
+      memory_baseline = tracemalloc.get_traced_memory()[0]
+    else:
+      tracemalloc.start()
+      started_tracing = True
+
+  gc_collections_start: int = _gc_collections()
+  gc.callbacks.append(on_gc)
+  cpu_start: int = process_time_ns()
+  wall_start: int = perf_counter_ns()
+  try:
+    yield metrics
+  finally:
+    metrics.wall_time_ns = perf_counter_ns() - wall_start
+    metrics.cpu_time_ns = process_time_ns() - cpu_start
+    gc.callbacks.remove(on_gc)
+    metrics.gc_collections = _gc_collections() - gc_collections_start
+    if trace_memory:
+      metrics.peak_memory_bytes = max(
+        tracemalloc.get_traced_memory()[1] - memory_baseline,
+        0
+      )
+      if started_tracing:
+        tracemalloc.stop()
+
+
+def _gc_collections() -> int:
+  """Retrieves the total number of collections across all GC generations"""
+  return sum(stats['collections'] for stats in gc.get_stats())
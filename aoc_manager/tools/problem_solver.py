@@ -1,31 +1,101 @@
 import polars as pl
 
-from dataclasses import field, dataclass
-from time import time
-from typing import Any
+from atexit import register
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import field, fields, dataclass
+from datetime import datetime, UTC
+from functools import partial
+from typing import Any, Callable, ClassVar, Iterator, Optional
 from uuid import uuid4
 
 from aoc_manager.tables.input import \
   table as tab_aoc_input
 from aoc_manager.tables.log import \
   table as tab_aoc_log
+from aoc_manager.tables.solution import \
+  table as tab_can_solution
+from aoc_manager.tools.fingerprint import \
+  get_fingerprint, \
+  hash_preprocess_source, \
+  hash_solver_source
+from aoc_manager.tools.input_cache import input_cache
+from aoc_manager.tools.input_formats import parse_input
+from aoc_manager.tools.log import LogBuffer, LogSettings, LogSink
+from aoc_manager.tools.phase_metrics import measure_phase, PhaseMetrics
+from aoc_manager.tools.profiler import PhaseProfile, profile_phase
+from aoc_manager.tools.snapshot import snapshot_store
+
+
+# Writes debug logs to aoc.log off the solvers' critical path
+log_sink: LogSink = LogSink(tab_aoc_log.append)
+register(log_sink.flush)
+
+# Inputs that replace the day's aoc.input row, set by override_inputs()
+input_override: ContextVar[Optional[dict[str, str]]] = ContextVar('input_override', default=None)
+
+
+@contextmanager
+def override_inputs(input_test_a: str, expected_a: str = '',
+                    input_test_b: str = '', expected_b: str = '') -> Iterator[None]:
+  """Makes test solvers instantiated in the block use the given inputs instead of aoc.input
+
+  Args:
+    input_test_a (str): the Part A test input
+    expected_a (str): the expected Part A answer
+    input_test_b (str): the Part B test input, defaulting to the Part A test input
+    expected_b (str): the expected Part B answer
+  """
+  token: Token = input_override.set({
+    'input_test_a': input_test_a,
+    'expected_a': expected_a,
+    'input_test_b': input_test_b,
+    'expected_b': expected_b,
+    'full_input': ''
+  })
+  try:
+    yield
+  finally:
+    input_override.reset(token)
 
 
 @dataclass
 class ProblemSolver:
-  """Class that contains the code and metadata around an AoC solution for a day"""
+  """Class that contains the code and metadata around an AoC solution for a day
+
+  Set snapshot_preprocess = True on a solver whose pre-processing is slow to save
+  its state after _preprocess() and restore it on later runs with the same
+  __init__ and _preprocess source and the same inputs. Loading a snapshot is timed
+  as snapshot_restore_time rather than preprocessing_time, and set use_snapshots
+  = False on an instance to neither restore nor save snapshots.
+
+  Set parallel_parts = True on a solver whose parts are independent to run Part A
+  and Part B in separate processes at the same time once pre-processing is done.
+  The pre-processed solver is pickled to both processes, so its state must be
+  picklable; otherwise the parts run in turn.
+  """
+  snapshot_preprocess: ClassVar[bool] = False
+  parallel_parts: ClassVar[bool] = False
+
   year: str
   day: str
   test: bool
   debug: bool
-  input_format: type
+  input_format: Any
   mask_answers: bool = field(default_factory=lambda: False)
   processing_rounding_digits: int = field(default_factory=lambda: 8)
+  trace_memory: bool = field(default_factory=lambda: False)
+  profile_mode: Optional[str] = field(default_factory=lambda: None)
+  force: bool = field(default_factory=lambda: False)
+  use_snapshots: bool = field(default_factory=lambda: True)
+  log_settings: LogSettings = field(default_factory=LogSettings)
 
   log_level_map: dict[str, str] = field(init=False)
   
   input_a_text: str = field(init=False)
   input_b_text: str = field(init=False)
+  input_hashes: dict[str, str] = field(init=False)
+  source_hash: str = field(init=False)
   
   answer_a: Any = field(init=False)
   answer_b: Any = field(init=False)
@@ -34,14 +104,27 @@ class ProblemSolver:
   expected_b: str = field(init=False)
   
   preprocessing_time: float = field(init=False)
+  snapshot_restore_time: float = field(init=False)
   a_processing_time: float = field(init=False)
   b_processing_time: float = field(init=False)
   total_processing_time: float = field(init=False)
+
+  preprocessing_metrics: PhaseMetrics = field(init=False)
+  a_metrics: PhaseMetrics = field(init=False)
+  b_metrics: PhaseMetrics = field(init=False)
+
+  profiles: dict[str, PhaseProfile] = field(init=False)
+  cached_parts: list[str] = field(init=False)
+  snapshot_restored: bool = field(init=False)
   
+  run_id: str = field(init=False)
   run_id_a: str = field(init=False)
   run_id_b: str = field(init=False)
   
   context: str = field(init=False)
+  log_buffer: LogBuffer = field(init=False)
+  log_writer: Callable[[list[dict[str, Any]]], None] = field(init=False)
+  dropped_logs: dict[str, int] = field(init=False)
 
   def __post_init__(self) -> None:
     self.log_level_map: dict[str, str] = {
@@ -51,73 +134,245 @@ class ProblemSolver:
     }
     self.input_a_text, self.input_b_text, \
       self.expected_a, self.expected_b = self._retrieve_inputs()
+    # Hashed once, so the cache lookup and the saved rows agree even if the file changes mid-run
+    self.source_hash: str = hash_solver_source(type(self))
 
     self.answer_a: Any = None
     self.answer_b: Any = None
 
     self.preprocessing_time: float = 0.00
+    self.snapshot_restore_time: float = 0.00
     self.a_processing_time: float = 0.00
     self.b_processing_time: float = 0.00
     self.total_processing_time: float = 0.00
 
+    self.preprocessing_metrics: PhaseMetrics = PhaseMetrics()
+    self.a_metrics: PhaseMetrics = PhaseMetrics()
+    self.b_metrics: PhaseMetrics = PhaseMetrics()
+
+    self.profiles: dict[str, PhaseProfile] = {}
+    self.cached_parts: list[str] = []
+    self.snapshot_restored: bool = False
+
+    self.run_id: str = str(uuid4())
     self.run_id_a: str = ''
     self.run_id_b: str = ''
 
     self.context: str = ''
-    self.logs: list[dict] = []
+    self.log_buffer: LogBuffer = LogBuffer(self.log_settings)
+    self.log_writer: Callable[[list[dict[str, Any]]], None] = log_sink.put
+    self.dropped_logs: dict[str, int] = {}
+
+  def __getstate__(self) -> dict[str, Any]:
+    """Pickles the solver without its log writer, which belongs to this process"""
+    return {name: value for name, value in vars(self).items() if name != 'log_writer'}
+
+  def __setstate__(self, state: dict[str, Any]) -> None:
+    """Unpickles the solver, writing its logs through this process's log sink"""
+    vars(self).update(state)
+    self.log_writer: Callable[[list[dict[str, Any]]], None] = log_sink.put
 
   def preprocess_inputs(self) -> None:
     """Log and execute the _preprocess() method"""
     if len(self.input_a_text) == 0 and len(self.input_b_text) == 0:
       raise RuntimeError('Error: no input text has been provided.')
 
-    preprocessing_start_time: float = time()
     self.context: str = 'p'
-    self._preprocess()
-    self.preprocessing_time: float = max(time() - preprocessing_start_time, 0.00)
-    self.save_logs()
+    profile: Optional[PhaseProfile] = None
+    try:
+      with measure_phase(self.trace_memory) as self.preprocessing_metrics, \
+          profile_phase(self.profile_mode) as profile:
+        if not self.restore_snapshot():
+          self._preprocess()
+    finally:
+      self.save_logs()
+      if profile is not None:
+        self.profiles[self.context] = profile
+    if self.snapshot_restored:
+      # Loading a snapshot is not pre-processing, so its time is kept apart
+      self.snapshot_restore_time: float = self.preprocessing_metrics.wall_time
+      return
+    self.preprocessing_time: float = self.preprocessing_metrics.wall_time
+    if self.snapshot_preprocess and self.use_snapshots:
+      snapshot_store.save(self.get_snapshot_key(), self.get_snapshot_state())
     
   def run_a(self) -> None:
     """Log and execute the _solve_a() method"""
-    a_start_time: float = time()
     self.context: str = 'a'
     self.run_id_a: str = str(uuid4())
-    self._solve_a()
-    self.a_processing_time: float = max(time() - a_start_time, 0.00)
+    profile: Optional[PhaseProfile] = None
+    try:
+      with measure_phase(self.trace_memory) as self.a_metrics, \
+          profile_phase(self.profile_mode) as profile:
+        self._solve_a()
+    finally:
+      self.save_logs()
+      if profile is not None:
+        self.profiles[self.context] = profile
+    self.a_processing_time: float = self.a_metrics.wall_time
     self.total_processing_time: float = self.get_total_processing_time()
-    self.save_logs()
 
   def run_b(self) -> None:
     """Log and execute the _solve_b() method"""
-    b_start_time: float = time()
     self.context: str = 'b'
     self.run_id_b: str = str(uuid4())
-    self._solve_b()
-    self.b_processing_time: float = max(time() - b_start_time, 0.00)
+    profile: Optional[PhaseProfile] = None
+    try:
+      with measure_phase(self.trace_memory) as self.b_metrics, \
+          profile_phase(self.profile_mode) as profile:
+        self._solve_b()
+    finally:
+      self.save_logs()
+      if profile is not None:
+        self.profiles[self.context] = profile
+    self.b_processing_time: float = self.b_metrics.wall_time
     self.total_processing_time: float = self.get_total_processing_time()
-    self.save_logs()
 
-  def log(self, line: Any, label: str = '') -> None:
+  def get_fingerprint(self, part: str) -> str:
+    """Builds the fingerprint of a part from the solver source, its input and the test flag
+
+    Args:
+      part (str): the part of the solution, either 'a' or 'b'
+
+    Returns:
+      fingerprint (str): the fingerprint, or '' if the solver source cannot be read
+    """
+    if not self.source_hash:
+      return ''
+    return get_fingerprint(self.source_hash, self.input_hashes[part], part, self.test)
+
+  def can_use_cache(self) -> bool:
+    """Whether cached answers may stand in for running a part
+
+    Debug and profiled runs always execute, since their logs and profiles are
+    the point of running them.
+    """
+    return not (self.force or self.debug or self.profile_mode)
+
+  def load_cached_solution(self, part: str) -> bool:
+    """Loads a part's answer and timings from a previous run with the same fingerprint
+
+    Args:
+      part (str): the part of the solution, either 'a' or 'b'
+
+    Returns:
+      hit (bool): whether a cached answer was found and loaded
+    """
+    fingerprint: str = self.get_fingerprint(part)
+    if not fingerprint:
+      return False
+    df: pl.DataFrame = tab_can_solution.get(filter_conditions={'fingerprint': fingerprint})
+    if df.is_empty():
+      return False
+
+    row: dict[str, Any] = df.sort('_execution_ts', descending=True).row(0, named=True)
+    setattr(self, f'answer_{part}', row['answer'])
+    setattr(self, f'run_id_{part}', row['id'])
+    setattr(self, f'{part}_processing_time', row['processing_time'])
+    setattr(self, f'{part}_metrics', PhaseMetrics(
+      wall_time_ns=round(row['processing_time'] * 1e9),
+      cpu_time_ns=round((row['cpu_time'] or 0) * 1e9),
+      peak_memory_bytes=row['peak_memory_bytes'] or 0,
+      gc_collections=row['gc_collections'] or 0,
+      gc_time_ns=round((row['gc_time'] or 0) * 1e9)
+    ))
+    self.preprocessing_time: float = max(
+      self.preprocessing_time,
+      row['preprocessing_time'] or 0.00
+    )
+    self.total_processing_time: float = self.get_total_processing_time()
+    self.cached_parts.append(part)
+    return True
+
+  def get_snapshot_key(self) -> str:
+    """Builds the key of the pre-processing snapshot from the solver's pre-processing source and inputs
+
+    Returns:
+      key (str): the snapshot key, or '' if the solver source cannot be read
+    """
+    source_hash: str = hash_preprocess_source(type(self))
+    if not source_hash:
+      return ''
+    return get_fingerprint(
+      source_hash,
+      f'{self.input_hashes["a"]}|{self.input_hashes["b"]}',
+      'p',
+      self.test
+    )
+
+  def get_snapshot_state(self) -> dict[str, Any]:
+    """Retrieves the state built by __init__ and _preprocess, without the run's bookkeeping
+
+    Returns:
+      state (dict[str, Any]): the solver's own attributes and its inputs
+    """
+    return {
+      name: value for name, value in vars(self).items()
+      if name not in snapshot_excluded_attributes
+    }
+
+  def restore_snapshot(self) -> bool:
+    """Restores the state saved after a previous run's _preprocess(), if there is one
+
+    Returns:
+      restored (bool): whether a snapshot was restored in place of _preprocess()
+    """
+    if not self.snapshot_preprocess or not self.use_snapshots or not self.can_use_cache():
+      return False
+    key: str = self.get_snapshot_key()
+    state: Optional[dict[str, Any]] = snapshot_store.load(key) if key else None
+    if state is None:
+      return False
+    vars(self).update(state)
+    self.snapshot_restored: bool = True
+    return True
+
+  def log(self, line: Any, label: str = '', *args: Any) -> None:
     """Store a log with context
+
+    Formatting is deferred until the line passes the label filter and phase limit
+    in log_settings, so pass expensive lines as a callable or %-style arguments:
+
+      self.log('cursor at %s', 'walk', cursor)
+      self.log(lambda: grid_map.get(), 'grid')
     
     Args:
-      line (Any): the line to log
+      line (Any): the line to log, a %-style format string or a callable producing it
       label (str): Any helpful context with which to tag the line
+      args (Any): the %-style format arguments of the line
     """
     if not self.debug:
       return
-    self.logs.append({
-      'year': int(self.year),
-      'day': int(self.day),
-      'context': self.log_level_map.get(self.context, ''),
-      'data': str(line),
-      'label': label
-    })
+    self.log_buffer.add(self.context, label, line, args)
   
+  def set_log_settings(self, log_settings: LogSettings) -> None:
+    """Replaces the log settings, discarding any unsaved lines
+
+    Args:
+      log_settings (LogSettings): the new log settings
+    """
+    self.log_settings: LogSettings = log_settings
+    self.log_buffer: LogBuffer = LogBuffer(log_settings)
+
   def save_logs(self) -> None:
-    """Saves logs to Polta Table"""
-    tab_aoc_log.append(self.logs)
-    self.logs.clear()
+    """Hands logs to the log writer, by default the background writer of the Polta Table"""
+    lines: dict[str, list[tuple[str, str]]] = self.log_buffer.drain()
+    self.dropped_logs: dict[str, int] = dict(self.log_buffer.dropped)
+    logged_ts: datetime = datetime.now(UTC)
+    rows: list[dict[str, Any]] = [
+      {
+        '_logged_ts': logged_ts,
+        'run_id': self.run_id,
+        'year': int(self.year),
+        'day': int(self.day),
+        'context': self.log_level_map.get(context, ''),
+        'data': data,
+        'label': label
+      }
+      for context, context_lines in lines.items()
+      for label, data in context_lines
+    ]
+    self.log_writer(rows)
 
   def get_total_processing_time(self) -> float:
     """Retrieves the total processing time of the execution steps
@@ -130,10 +385,35 @@ class ProblemSolver:
     Returns:
       total_processing_time (float): the total processing time of the three main methods
     """
-    return max(
-      self.preprocessing_time + self.a_processing_time + self.b_processing_time,
-      0.00
-    )
+    return self.preprocessing_time + self.a_processing_time + self.b_processing_time
+
+  def get_solution_row(self, part: str) -> dict[str, Any]:
+    """Builds the aoc.solution row for a part that has been run
+
+    Args:
+      part (str): the part of the solution, either 'a' or 'b'
+
+    Returns:
+      row (dict[str, Any]): the solution row, including the phase metrics
+    """
+    metrics: PhaseMetrics = getattr(self, f'{part}_metrics')
+    return {
+      '_execution_ts': datetime.now(),
+      'id': getattr(self, f'run_id_{part}'),
+      'year': int(self.year),
+      'day': int(self.day),
+      'part': part,
+      'test_ind': self.test,
+      'answer': str(getattr(self, f'answer_{part}')),
+      'processing_time': getattr(self, f'{part}_processing_time'),
+      # A restored run did no pre-processing, so it has no time to record
+      'preprocessing_time': None if self.snapshot_restored else self.preprocessing_time,
+      'cpu_time': metrics.cpu_time,
+      'peak_memory_bytes': metrics.peak_memory_bytes,
+      'gc_collections': metrics.gc_collections,
+      'gc_time': metrics.gc_time,
+      'fingerprint': self.get_fingerprint(part)
+    }
 
   def _preprocess(self) -> None:
     """This should get overriden by a child class"""  
@@ -149,43 +429,43 @@ class ProblemSolver:
 
   def _retrieve_inputs(self) -> tuple[str, str, str, str]:
     """Retrieves the proper inputs for the day and Any test data
+
+    Also records the hash of each part's raw input text for fingerprinting.
     
     Returns:
       inputs (tuple[str, str, str, str]): input A, expected A, input B, expected B
     """
-    row: dict[str, Any] = (tab_aoc_input
-      .get(
-        filter_conditions={'year': int(self.year), 'day': int(self.day)}
-      ).with_columns(pl
-        .when(pl.col('input_test_b') != '')
-        .then(pl.col('input_test_b'))
-        .otherwise(pl.col('input_test_a'))
-        .alias('input_test_b')
-      ).to_dicts()
-      [0]
-    )
+    override: Optional[dict[str, str]] = input_override.get()
+    row: dict[str, Any] = dict(override) if override is not None else tab_aoc_input.get(
+      filter_conditions={'year': int(self.year), 'day': int(self.day)}
+    ).to_dicts()[0]
+    row['input_test_b'] = row['input_test_b'] or row['input_test_a']
 
     cols: list[str] = ['input_test_a', 'input_test_b'] if self.test else \
       ['full_input', 'full_input']
 
-    inputs: list[str] = []
-
-    for col in cols:
-      if self.input_format is str:
-        inputs.append(row[col])
-        continue
-
-      items: list[str] = list(map(lambda l: l.replace('\n', ''), row[col].splitlines()))
-
-      if self.input_format == list[str]:
-        inputs.append(items)
-      elif self.input_format == list[list[int]]:
-        inputs.append(list(map(lambda l: [int(i) for i in l], items)))
-      elif self.input_format == list[list[str]]:
-        inputs.append(list(map(lambda l: [i for i in l], items)))
-      elif self.input_format is not None:
-        inputs.append(list(map(lambda i: self.input_format(i) if i != '' else -1, items)))
-      else:
-        raise NotImplementedError
-    
+    # Hash each distinct column once; the cache parses it once and hands each part its own copy
+    text_hashes: dict[str, str] = {
+      col: input_cache.hash_text(row[col]) for col in dict.fromkeys(cols)
+    }
+    inputs: list[Any] = [
+      input_cache.get_or_parse(
+        row[col],
+        self.input_format,
+        partial(parse_input, input_format=self.input_format),
+        text_hash=text_hashes[col]
+      )
+      for col in cols
+    ]
+    self.input_hashes: dict[str, str] = {
+      part: text_hashes[col] for part, col in zip(['a', 'b'], cols)
+    }
+
     return inputs[0], inputs[1], row['expected_a'], row['expected_b']
+
+
+# Bookkeeping that belongs to a run rather than to the solver's pre-processed state
+snapshot_excluded_attributes: frozenset[str] = frozenset(
+  solver_field.name for solver_field in fields(ProblemSolver)
+  if solver_field.name not in ['input_a_text', 'input_b_text']
+)
@@ -0,0 +1,254 @@
+import contextlib
+import cProfile
+import pstats
+import sys
+
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime
+from os.path import basename
+from threading import Event, get_ident, Thread
+from time import perf_counter
+from types import FrameType
+from typing import Any, Iterator, Optional
+
+
+profile_modes: list[str] = ['cprofile', 'sampling']
+
+
+@dataclass
+class FunctionStats:
+  """Time spent in one function during a profiled phase
+
+  Sampling profiles cannot count calls, so calls is zero and the times are
+  estimated from each function's share of the samples.
+  """
+  function: str
+  calls: int
+  self_time: float
+  cumulative_time: float
+
+
+@dataclass
+class PhaseProfile:
+  """Profile of one solver phase
+
+  Stacks are collapsed into 'outer;inner' keys, the format read by flamegraph
+  tools, and weighted by sample counts. Only sampling profiles have stacks:
+  cProfile records each function's direct callers rather than whole stacks, and
+  caller;callee pairs would render as a misleading flame graph.
+  """
+  mode: str
+  functions: list[FunctionStats] = field(default_factory=lambda: [])
+  stacks: dict[str, int] = field(default_factory=lambda: {})
+
+  def get_top_functions(self, n: int = 25) -> list[FunctionStats]:
+    """Retrieves the functions with the most self time
+
+    Args:
+      n (int): the number of functions to retrieve
+
+    Returns:
+      functions (list[FunctionStats]): the hottest functions, hottest first
+    """
+    return sorted(self.functions, key=lambda stats: stats.self_time, reverse=True)[:n]
+
+  def get_collapsed_stacks(self) -> str:
+    """Exports the stacks in the collapsed format read by flamegraph tools
+
+    Returns:
+      collapsed (str): one 'outer;inner weight' line per stack, empty for cProfile
+    """
+    return '\n'.join(f'{stack} {weight}' for stack, weight in self.stacks.items())
+
+
+@contextmanager
+def profile_phase(mode: Optional[str] = None,
+                  interval: float = 0.001) -> Iterator[Optional[PhaseProfile]]:
+  """Profiles a block of code on the current thread
+
+  cProfile traces every call, so it is exact but can slow call-heavy code down
+  several times. Sampling reads the thread's stack from a background thread every
+  interval, which costs little but misses short-lived calls.
+
+  Args:
+    mode (Optional[str]): 'cprofile', 'sampling', or None to not profile
+    interval (float): the seconds between stack samples when sampling
+
+  Yields:
+    profile (Optional[PhaseProfile]): the profile, populated once the block exits
+  """
+  if mode is None:
+    yield None
+    return
+  if mode not in profile_modes:
+    raise ValueError(f'Error: unknown profile mode {mode}.')
+
+  profile: PhaseProfile = PhaseProfile(mode=mode)
+  if mode == 'cprofile':
+    profiler: cProfile.Profile = cProfile.Profile()
+    profiler.enable()
+    try:
+      yield profile
+    finally:
+      profiler.disable()
+      _read_cprofile(profile, pstats.Stats(profiler))
+    return
+
+  # Frames of the caller and everything above it are the same in every sample
+  caller: FrameType = sys._getframe(2)
+  sampler: _StackSampler = _StackSampler(
+    thread_id=get_ident(),
+    base_depth=_frame_depth(caller),
+    interval=interval
+  )
+  sampler.start()
+  try:
+    yield profile
+  finally:
+    sampler.stop()
+    _read_samples(profile, sampler)
+
+
+def get_profile_rows(run_id: str, profiles: dict[str, PhaseProfile],
+                     top: int = 100) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+  """Builds the aoc.profile and aoc.profile_stack rows of a run
+
+  Args:
+    run_id (str): the id of the run
+    profiles (dict[str, PhaseProfile]): the profile of each phase ('p', 'a', 'b')
+    top (int): the number of hottest functions to keep per phase
+
+  Returns:
+    rows (tuple[list[dict[str, Any]], list[dict[str, Any]]]): the function rows
+      and the stack rows
+  """
+  profiled_ts: datetime = datetime.now()
+  function_rows: list[dict[str, Any]] = [
+    {
+      '_profiled_ts': profiled_ts,
+      'run_id': run_id,
+      'phase': phase,
+      'mode': profile.mode,
+      'rank': rank,
+      'function': stats.function,
+      'calls': stats.calls,
+      'self_time': stats.self_time,
+      'cumulative_time': stats.cumulative_time
+    }
+    for phase, profile in profiles.items()
+    for rank, stats in enumerate(profile.get_top_functions(top), start=1)
+  ]
+  stack_rows: list[dict[str, Any]] = [
+    {
+      '_profiled_ts': profiled_ts,
+      'run_id': run_id,
+      'phase': phase,
+      'stack': stack,
+      'weight': weight
+    }
+    for phase, profile in profiles.items()
+    for stack, weight in profile.stacks.items()
+  ]
+  return function_rows, stack_rows
+
+
+class _StackSampler(Thread):
+  """Background thread that counts the collapsed stacks of another thread"""
+
+  def __init__(self, thread_id: int, base_depth: int, interval: float) -> None:
+    super().__init__(name='profile-sampler', daemon=True)
+    self.thread_id: int = thread_id
+    self.base_depth: int = base_depth
+    self.interval: float = interval
+    self.samples: int = 0
+    self.stacks: dict[tuple[str, ...], int] = {}
+    self.elapsed: float = 0.00
+    self._stopped: Event = Event()
+
+  def run(self) -> None:
+    started_at: float = perf_counter()
+    while not self._stopped.wait(self.interval):
+      frame: Optional[FrameType] = sys._current_frames().get(self.thread_id)
+      if frame is None:
+        continue
+      frames: list[FrameType] = []
+      while frame is not None:
+        frames.append(frame)
+        frame = frame.f_back
+      # Samples taken in the caller's own frame, between calls, hold no profiled frames
+      if len(frames) <= self.base_depth:
+        continue
+      # Drop the frames shared with the caller and order the stack outermost first
+      frames = frames[len(frames) - self.base_depth - 1::-1]
+      # Samples taken while the block is being entered or exited are not part of it
+      if frames and frames[0].f_code.co_filename != contextlib.__file__:
+        stack: tuple[str, ...] = tuple(
+          _label(frame.f_code.co_filename, frame.f_code.co_firstlineno, frame.f_code.co_name)
+          for frame in frames
+        )
+        self.stacks[stack] = self.stacks.get(stack, 0) + 1
+        self.samples += 1
+    self.elapsed = perf_counter() - started_at
+
+  def stop(self) -> None:
+    self._stopped.set()
+    self.join()
+
+
+def _read_samples(profile: PhaseProfile, sampler: _StackSampler) -> None:
+  """Fills in a profile from the stacks counted by a sampler"""
+  # The GIL often delays samples past the interval, so spread the elapsed time instead
+  sample_time: float = sampler.elapsed / max(sampler.samples, 1)
+  self_samples: dict[str, int] = {}
+  total_samples: dict[str, int] = {}
+  for stack, count in sampler.stacks.items():
+    profile.stacks[';'.join(stack)] = count
+    self_samples[stack[-1]] = self_samples.get(stack[-1], 0) + count
+    # Recursive functions count once per sample towards their cumulative time
+    for name in set(stack):
+      total_samples[name] = total_samples.get(name, 0) + count
+  profile.functions = [
+    FunctionStats(
+      function=name,
+      calls=0,
+      self_time=self_samples.get(name, 0) * sample_time,
+      cumulative_time=count * sample_time
+    )
+    for name, count in total_samples.items()
+  ]
+
+
+def _read_cprofile(profile: PhaseProfile, stats: pstats.Stats) -> None:
+  """Fills in a profile from cProfile statistics, leaving out the profiler's own frames"""
+  ignored_files: set[str] = {__file__, contextlib.__file__}
+  for (filename, line, name), (_, calls, self_time, cumulative_time, callers) \
+      in stats.stats.items():
+    # Skip the profiler's frames and the calls it makes when the block exits
+    if filename in ignored_files or (
+      callers and all(caller[0] in ignored_files for caller in callers)
+    ):
+      continue
+    profile.functions.append(FunctionStats(
+      function=_label(filename, line, name),
+      calls=calls,
+      self_time=self_time,
+      cumulative_time=cumulative_time
+    ))
+
+
+def _label(filename: str, line: int, name: str) -> str:
+  """Names a function by its name and location, e.g. 'solve (d01.py:12)'"""
+  if filename == '~':
+    # cProfile reports built-in functions without a file
+    return name
+  return f'{name} ({basename(filename)}:{line})'
+
+
+def _frame_depth(frame: Optional[FrameType]) -> int:
+  """Counts the frames from a frame to the bottom of its thread's stack"""
+  depth: int = 0
+  while frame is not None:
+    depth += 1
+    frame = frame.f_back
+  return depth
@@ -0,0 +1,165 @@
+from dataclasses import dataclass, field, replace
+from threading import Event, Lock
+from time import monotonic
+from typing import Optional
+from uuid import uuid4
+
+from aoc_manager.tools.run_result import phase_steps, RunResult
+
+
+@dataclass(frozen=True)
+class RunState:
+  """Snapshot of one solver run as seen by the sessions subscribed to it"""
+  run_id: str
+  year: int
+  day: int
+  test: bool
+  statuses: dict[str, str]
+  result: Optional[RunResult] = field(default_factory=lambda: None)
+  finished: bool = field(default_factory=lambda: False)
+  version: int = field(default_factory=lambda: 0)
+  updated_at: float = field(default_factory=monotonic)
+
+
+@dataclass
+class RunRegistry:
+  """Thread-safe, server-wide registry of solver runs keyed by run id
+
+  Worker threads publish progress into the registry and sessions poll the runs
+  they started, so a run only ever invalidates the session that owns it.
+  """
+  max_finished_runs: int = field(default_factory=lambda: 100)
+
+  def __post_init__(self) -> None:
+    self._runs: dict[str, RunState] = {}
+    self._cancel_events: dict[str, Event] = {}
+    self._lock: Lock = Lock()
+
+  def create(self, year: int, day: int, test: bool, selection: str) -> str:
+    """Registers a new run with every selected phase pending
+
+    Args:
+      year (int): the year of the solver
+      day (int): the day of the solver
+      test (bool): whether the run uses the test inputs
+      selection (str): the parts to run, either 'a', 'b' or 'both'
+
+    Returns:
+      run_id (str): the id of the new run
+    """
+    run_id: str = str(uuid4())
+    statuses: dict[str, str] = {
+      phase: 'pending'
+      for phase in ['p', 'a', 'b']
+      if phase == 'p' or selection in [phase, 'both']
+    }
+    with self._lock:
+      self._runs[run_id] = RunState(
+        run_id=run_id,
+        year=year,
+        day=day,
+        test=test,
+        statuses=statuses
+      )
+      self._cancel_events[run_id] = Event()
+      self._prune()
+    return run_id
+
+  def start_phase(self, run_id: str, phase: str, result: RunResult) -> None:
+    """Marks a phase as running and every earlier phase as done or failed
+
+    Args:
+      run_id (str): the id of the run
+      phase (str): the phase that is starting, 'ab' for both parts in parallel
+      result (RunResult): the run's results so far
+    """
+    with self._lock:
+      state: Optional[RunState] = self._runs.get(run_id)
+      if state is None:
+        return
+      statuses: dict[str, str] = dict(state.statuses)
+      steps: tuple[str, ...] = phase_steps[phase]
+      for earlier in statuses:
+        if earlier in steps:
+          break
+        statuses[earlier] = 'error' if earlier in result.errors else 'done'
+      statuses.update({step: 'running' for step in steps})
+      self._runs[run_id] = replace(
+        state,
+        statuses=statuses,
+        result=result,
+        version=state.version + 1,
+        updated_at=monotonic()
+      )
+
+  def finish(self, run_id: str, result: RunResult) -> None:
+    """Marks a run as finished with its final results
+
+    Args:
+      run_id (str): the id of the run
+      result (RunResult): the run's final results
+    """
+    with self._lock:
+      state: Optional[RunState] = self._runs.get(run_id)
+      if state is None:
+        return
+      self._runs[run_id] = replace(
+        state,
+        statuses={
+          phase: 'error' if phase in result.errors else 'done'
+          for phase in state.statuses
+        },
+        result=result,
+        finished=True,
+        version=state.version + 1,
+        updated_at=monotonic()
+      )
+      self._prune()
+
+  def get_cancel_event(self, run_id: str) -> Event:
+    """Retrieves the event that is set when a run is cancelled
+
+    Args:
+      run_id (str): the id of the run
+
+    Returns:
+      event (Event): the run's cancel event, or an unset event if it is not registered
+    """
+    with self._lock:
+      return self._cancel_events.get(run_id) or Event()
+
+  def cancel(self, run_id: str) -> None:
+    """Asks a run to stop, which the executor does by killing its process
+
+    Args:
+      run_id (str): the id of the run
+    """
+    with self._lock:
+      event: Optional[Event] = self._cancel_events.get(run_id)
+    if event is not None:
+      event.set()
+
+  def get(self, run_id: str) -> Optional[RunState]:
+    """Retrieves the latest state of a run
+
+    Args:
+      run_id (str): the id of the run
+
+    Returns:
+      state (Optional[RunState]): the run's state, if it is still registered
+    """
+    with self._lock:
+      return self._runs.get(run_id)
+
+  def _prune(self) -> None:
+    """Drops the oldest finished runs beyond the retention limit"""
+    finished: list[RunState] = sorted(
+      (state for state in self._runs.values() if state.finished),
+      key=lambda state: state.updated_at
+    )
+    for state in finished[:max(len(finished) - self.max_finished_runs, 0)]:
+      del self._runs[state.run_id]
+      del self._cancel_events[state.run_id]
+
+
+run_registry: RunRegistry = RunRegistry()
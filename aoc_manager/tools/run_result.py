@@ -0,0 +1,100 @@
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from aoc_manager.tools.phase_metrics import PhaseMetrics
+from aoc_manager.tools.profiler import PhaseProfile
+
+
+# The steps each reported phase covers; 'ab' is both parts running in parallel
+phase_steps: dict[str, tuple[str, ...]] = {
+  'p': ('p',),
+  'a': ('a',),
+  'b': ('b',),
+  'ab': ('a', 'b')
+}
+
+
+@dataclass(frozen=True, slots=True)
+class RunResult:
+  """Compact, immutable record of a solver run used by everything that displays it
+
+  Unlike the solver itself, it holds no inputs or solver state, so it is cheap to
+  keep in reactive values and to send between processes. An empty record means
+  nothing has run yet.
+  """
+  run_id: str = field(default_factory=lambda: '')
+  year: Optional[int] = field(default_factory=lambda: None)
+  day: Optional[int] = field(default_factory=lambda: None)
+  test: bool = field(default_factory=lambda: False)
+  debug: bool = field(default_factory=lambda: False)
+  mask_answers: bool = field(default_factory=lambda: False)
+  parts: tuple[str, ...] = field(default_factory=lambda: ())
+
+  answer_a: Any = field(default_factory=lambda: None)
+  answer_b: Any = field(default_factory=lambda: None)
+  expected_a: str = field(default_factory=lambda: '')
+  expected_b: str = field(default_factory=lambda: '')
+
+  preprocessing_time: Optional[float] = field(default_factory=lambda: None)
+  a_processing_time: Optional[float] = field(default_factory=lambda: None)
+  b_processing_time: Optional[float] = field(default_factory=lambda: None)
+  total_processing_time: Optional[float] = field(default_factory=lambda: None)
+
+  preprocessing_metrics: Optional[PhaseMetrics] = field(default_factory=lambda: None)
+  a_metrics: Optional[PhaseMetrics] = field(default_factory=lambda: None)
+  b_metrics: Optional[PhaseMetrics] = field(default_factory=lambda: None)
+
+  profiles: dict[str, PhaseProfile] = field(default_factory=lambda: {})
+
+  run_id_a: str = field(default_factory=lambda: '')
+  run_id_b: str = field(default_factory=lambda: '')
+
+  dropped_logs: dict[str, int] = field(default_factory=lambda: {})
+  cached_parts: tuple[str, ...] = field(default_factory=lambda: ())
+  snapshot_restored: bool = field(default_factory=lambda: False)
+  snapshot_restore_time: float = field(default_factory=lambda: 0.00)
+
+  rows: tuple[dict[str, Any], ...] = field(default_factory=lambda: ())
+  errors: dict[str, str] = field(default_factory=lambda: {})
+
+  def get_mismatched_parts(self) -> list[str]:
+    """Retrieves the parts of a test run that failed or differ from the expected answer
+
+    Only the parts the run covered are checked, so a Part A run never reports
+    Part B. Records that do not say which parts ran check the parts that
+    produced an answer or an error. Parts without an expected answer are not
+    checked either.
+
+    Returns:
+      parts (list[str]): the mismatched parts, either 'a' or 'b'
+    """
+    ran: tuple[str, ...] = self.parts or tuple(
+      part for part in ['a', 'b']
+      if 'p' in self.errors or part in self.errors
+      or getattr(self, f'answer_{part}') is not None
+    )
+    parts: list[str] = []
+    for part in ran:
+      expected: str = getattr(self, f'expected_{part}')
+      if not expected:
+        continue
+      if 'p' in self.errors or part in self.errors \
+          or str(getattr(self, f'answer_{part}')).strip() != str(expected).strip():
+        parts.append(part)
+    return parts
+
+  @classmethod
+  def failed(cls, year: int, day: int, test: bool, phase: str, error: str) -> 'RunResult':
+    """Builds the result of a run that failed before producing solver state
+
+    Args:
+      year (int): the year of the solver
+      day (int): the day of the solver
+      test (bool): whether the run used the test inputs
+      phase (str): the phase that failed
+      error (str): the error message or traceback
+
+    Returns:
+      result (RunResult): the failed result
+    """
+    return cls(year=year, day=day, test=test, errors={phase: error})
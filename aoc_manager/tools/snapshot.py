@@ -0,0 +1,101 @@
+import pickle
+
+from dataclasses import dataclass, field
+from glob import glob
+from os import getpid, makedirs, path, remove, replace
+from traceback import print_exc
+from typing import Any, Optional
+
+
+@dataclass
+class SnapshotStore:
+  """On-disk store of solver state captured right after pre-processing
+
+  Snapshots are pickled with the highest protocol, which writes NumPy arrays as
+  raw buffers. Only the most recently written snapshots are kept.
+  """
+  root: str = field(default_factory=lambda: path.join('.aoc_cache', 'snapshots'))
+  max_snapshots: int = field(default_factory=lambda: 32)
+
+  def get_path(self, key: str) -> str:
+    """Retrieves the file path of a snapshot
+
+    Args:
+      key (str): the snapshot key
+
+    Returns:
+      file_path (str): the path of the snapshot file
+    """
+    return path.join(self.root, f'{key}.pickle')
+
+  def load(self, key: str) -> Optional[dict[str, Any]]:
+    """Loads a snapshot, treating a missing or unreadable snapshot as a miss
+
+    Args:
+      key (str): the snapshot key
+
+    Returns:
+      state (Optional[dict[str, Any]]): the snapshotted attributes, if found
+    """
+    try:
+      with open(self.get_path(key), 'rb') as f:
+        return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ImportError):
+      return None
+
+  def save(self, key: str, state: dict[str, Any]) -> bool:
+    """Saves a snapshot, skipping state that cannot be pickled or written
+
+    The snapshot is written to a temporary file first so readers never see a
+    partially written snapshot. Write errors, such as a full disk, are printed
+    rather than raised, since the run itself succeeded.
+
+    Args:
+      key (str): the snapshot key
+      state (dict[str, Any]): the attributes to snapshot
+
+    Returns:
+      saved (bool): whether the snapshot was saved
+    """
+    try:
+      data: bytes = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+      return False
+
+    file_path: str = self.get_path(key)
+    # Processes saving the same key each write their own temporary file
+    temp_path: str = f'{file_path}.{getpid()}.tmp'
+    try:
+      makedirs(self.root, exist_ok=True)
+      with open(temp_path, 'wb') as f:
+        f.write(data)
+      replace(temp_path, file_path)
+      self._prune()
+    except OSError:
+      print_exc()
+      if path.exists(temp_path):
+        remove(temp_path)
+      return False
+    return True
+
+  def _prune(self) -> None:
+    """Removes the oldest snapshots beyond the retention limit
+
+    Other processes save and prune the same directory, so snapshots may vanish
+    between listing and removing them.
+    """
+    snapshots: list[tuple[float, str]] = []
+    for file_path in glob(path.join(self.root, '*.pickle')):
+      try:
+        snapshots.append((path.getmtime(file_path), file_path))
+      except FileNotFoundError:
+        continue
+    snapshots.sort()
+    for _, file_path in snapshots[:max(len(snapshots) - self.max_snapshots, 0)]:
+      try:
+        remove(file_path)
+      except FileNotFoundError:
+        continue
+
+
+snapshot_store: SnapshotStore = SnapshotStore()
@@ -0,0 +1,154 @@
+import traceback
+
+from functools import partial
+from typing import Callable, Optional
+
+from aoc_manager.tools.parallel_parts import can_run_parts_in_parallel, run_parts_in_parallel
+from aoc_manager.tools.problem_solver import log_sink, ProblemSolver
+from aoc_manager.tools.run_result import RunResult
+
+
+def execute_solver(solver: ProblemSolver, selection: str,
+                   on_phase: Optional[Callable[[str, dict[str, str]], None]] = None) -> dict[str, str]:
+  """Runs the pre-processor and the selected parts of a solver
+
+  A failing part does not stop the other part from running, but nothing runs
+  after a failed pre-processor. Parts with a cached answer for the same solver
+  source and input are loaded instead of run, and the pre-processor is skipped
+  when every selected part is cached. Solvers with parallel_parts set run both
+  parts at once in spawned processes, or in turn if their state cannot be
+  pickled. Queued debug logs are flushed before returning.
+
+  Args:
+    solver (ProblemSolver): the instantiated solver
+    selection (str): the parts to run, either 'a', 'b' or 'both'
+    on_phase (Optional[Callable[[str, dict[str, str]], None]]): called with each phase
+      before it starts and the errors raised so far, with 'ab' when both parts
+      start in parallel
+
+  Returns:
+    errors (dict[str, str]): the traceback of each phase ('p', 'a', 'b') that failed
+  """
+  errors: dict[str, str] = {}
+  try:
+    _execute_phases(solver, selection, errors, on_phase)
+  finally:
+    log_sink.flush()
+  return errors
+
+
+def _execute_phases(solver: ProblemSolver, selection: str, errors: dict[str, str],
+                    on_phase: Optional[Callable[[str, dict[str, str]], None]]) -> None:
+  """Runs each selected phase, recording the traceback of any that fail"""
+  parts: list[str] = [part for part in ['a', 'b'] if selection in [part, 'both']]
+  if solver.can_use_cache():
+    parts = [part for part in parts if not _load_cached_solution(solver, part)]
+    if not parts:
+      return
+
+  if on_phase is not None:
+    on_phase('p', errors)
+  try:
+    solver.preprocess_inputs()
+  except Exception:
+    errors['p'] = traceback.format_exc()
+    return
+
+  if parts == ['a', 'b'] and solver.parallel_parts and can_run_parts_in_parallel():
+    # Both parts start together, reported as the single phase 'ab'
+    on_start: Optional[Callable[[], None]] = partial(on_phase, 'ab', errors) \
+      if on_phase is not None else None
+    if run_parts_in_parallel(solver, errors, on_start=on_start):
+      return
+
+  if 'a' in parts:
+    if on_phase is not None:
+      on_phase('a', errors)
+    try:
+      solver.run_a()
+    except Exception:
+      errors['a'] = traceback.format_exc()
+  if 'b' in parts:
+    if on_phase is not None:
+      on_phase('b', errors)
+    try:
+      solver.run_b()
+    except Exception:
+      errors['b'] = traceback.format_exc()
+
+
+def _load_cached_solution(solver: ProblemSolver, part: str) -> bool:
+  """Loads a part's cached answer, treating a failure to read the cache as a miss"""
+  try:
+    return solver.load_cached_solution(part)
+  except Exception:
+    traceback.print_exc()
+    return False
+
+
+def get_solved_parts(selection: str, errors: dict[str, str]) -> list[str]:
+  """Retrieves the selected parts that produced an answer
+
+  Args:
+    selection (str): the parts that were run, either 'a', 'b' or 'both'
+    errors (dict[str, str]): the tracebacks of the phases that failed
+
+  Returns:
+    parts (list[str]): the parts that completed successfully
+  """
+  if 'p' in errors:
+    return []
+  return [
+    part for part in ['a', 'b']
+    if selection in [part, 'both'] and part not in errors
+  ]
+
+
+def get_run_result(solver: ProblemSolver, selection: str, errors: dict[str, str]) -> RunResult:
+  """Summarizes a solver's run so the solver and its state can be released
+
+  Profiled runs produce no solution rows, since the profiler's overhead would
+  skew the saved timings and their fingerprints would let later runs reuse them.
+
+  Args:
+    solver (ProblemSolver): the solver that ran
+    selection (str): the parts that were run, either 'a', 'b' or 'both'
+    errors (dict[str, str]): the tracebacks of the phases that failed
+
+  Returns:
+    result (RunResult): the answers, timings, solution rows and errors of the run
+  """
+  return RunResult(
+    run_id=solver.run_id,
+    year=int(solver.year),
+    day=int(solver.day),
+    test=solver.test,
+    debug=solver.debug,
+    mask_answers=solver.mask_answers,
+    parts=tuple(part for part in ['a', 'b'] if selection in [part, 'both']),
+    answer_a=solver.answer_a,
+    answer_b=solver.answer_b,
+    expected_a=solver.expected_a,
+    expected_b=solver.expected_b,
+    preprocessing_time=solver.preprocessing_time,
+    a_processing_time=solver.a_processing_time,
+    b_processing_time=solver.b_processing_time,
+    total_processing_time=solver.total_processing_time,
+    preprocessing_metrics=solver.preprocessing_metrics,
+    a_metrics=solver.a_metrics,
+    b_metrics=solver.b_metrics,
+    profiles=dict(solver.profiles),
+    run_id_a=solver.run_id_a,
+    run_id_b=solver.run_id_b,
+    dropped_logs=dict(solver.dropped_logs),
+    cached_parts=tuple(solver.cached_parts),
+    snapshot_restored=solver.snapshot_restored,
+    snapshot_restore_time=solver.snapshot_restore_time,
+    rows=tuple(
+      solver.get_solution_row(part)
+      for part in get_solved_parts(selection, errors)
+      if getattr(solver, f'run_id_{part}') and part not in solver.cached_parts
+      and not solver.profile_mode
+    ),
+    errors=dict(errors)
+  )
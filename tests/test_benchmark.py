@@ -0,0 +1,108 @@
+from unittest import TestCase
+
+from aoc_manager.tools.benchmark import Benchmark, PhaseStatistics
+from aoc_manager.tools.executor import run_benchmark_isolated
+from aoc_manager.tools.problem_solver import override_inputs, ProblemSolver
+from tests.testing_data.benchmark import TestingData
+
+
+class SumSolver(ProblemSolver):
+  """Counts its instantiations so the benchmark's re-instantiation can be checked"""
+  instances: int = 0
+
+  def __init__(self, year: str, test: bool = False, debug: bool = False, input_format: type = str,
+               mask_answers: bool = False) -> None:
+    super().__init__(
+      year=year,
+      day='1',
+      test=test,
+      debug=debug,
+      input_format=input_format,
+      mask_answers=mask_answers
+    )
+    SumSolver.instances += 1
+
+  def _preprocess(self) -> None:
+    self.numbers: list[int] = [int(line) for line in self.input_a_text.splitlines()]
+
+  def _solve_a(self) -> None:
+    self.answer_a: int = sum(self.numbers)
+
+  def _solve_b(self) -> None:
+    self.answer_b: int = max(self.numbers)
+
+
+class TestBenchmark(TestCase):
+  """Contains unit tests for the benchmark tools"""
+  td: TestingData = TestingData()
+
+  def test_phase_statistics(self) -> None:
+    """
+    GIVEN I have the wall times of a benchmarked phase
+    WHEN I summarize them
+    THEN it should compute the min, median, p95, standard deviation and mean
+    """
+    stats: PhaseStatistics = PhaseStatistics(phase='a', samples=self.td.samples)
+    assert stats.min_time == self.td.min_time
+    assert stats.median_time == self.td.median_time
+    self.assertAlmostEqual(stats.p95_time, self.td.p95_time)
+    self.assertAlmostEqual(stats.stddev_time, self.td.stddev_time)
+    assert stats.mean_time == self.td.mean_time
+
+  def test_phase_statistics_single_sample(self) -> None:
+    """
+    GIVEN I have a single wall time
+    WHEN I summarize it
+    THEN every statistic should be that time and the deviation zero
+    """
+    stats: PhaseStatistics = PhaseStatistics(phase='p', samples=self.td.single_sample)
+    assert stats.min_time == stats.median_time == stats.p95_time == stats.mean_time \
+      == self.td.single_sample[0]
+    assert stats.stddev_time == 0.00
+
+  def test_benchmark_requires_runs(self) -> None:
+    """
+    GIVEN I have a benchmark without timed runs
+    WHEN I create it
+    THEN it should raise a ValueError
+    """
+    with self.assertRaises(ValueError):
+      Benchmark(solver_class=SumSolver, year=2000, day=1, test=True, runs=0)
+
+  def test_benchmark_run(self) -> None:
+    """
+    GIVEN I have a solver and test inputs
+    WHEN I benchmark one part
+    THEN it should time each timed run of the benchmarked phases only
+    """
+    benchmark: Benchmark = Benchmark(
+      solver_class=SumSolver,
+      year=2000,
+      day=1,
+      test=True,
+      selection='a',
+      runs=self.td.runs,
+      warmups=self.td.warmups
+    )
+    SumSolver.instances = 0
+    with override_inputs(self.td.input_test):
+      statistics: list[PhaseStatistics] = benchmark.run()
+
+    assert SumSolver.instances == self.td.runs + self.td.warmups
+    assert [stats.phase for stats in statistics] == ['p', 'a']
+    assert all(len(stats.samples) == self.td.runs for stats in statistics)
+
+    rows: list[dict] = benchmark.get_rows()
+    assert [row['phase'] for row in rows] == ['p', 'a']
+    assert {row['benchmark_id'] for row in rows} == {benchmark.benchmark_id}
+    assert all(row['runs'] == self.td.runs and row['test_ind'] for row in rows)
+
+  def test_run_benchmark_isolated_error(self) -> None:
+    """
+    GIVEN I have a day without a solver
+    WHEN I benchmark it in a child process
+    THEN it should raise a RuntimeError with the child's traceback
+    """
+    with self.assertRaises(RuntimeError) as context:
+      run_benchmark_isolated(self.td.missing_year, 1, True, 'both', runs=1, warmups=0)
+    assert 'Traceback' in str(context.exception)
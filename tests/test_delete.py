@@ -0,0 +1,53 @@
+import polars as pl
+
+from deltalake import Field, Schema
+from polta.metastore import Metastore
+from polta.table import Table, TableQuality
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+from aoc_manager.tools.delete import build_predicate, delete_rows
+from tests.testing_data.delete import TestingData
+
+
+class TestDelete(TestCase):
+  """Contains unit tests for deleting table rows"""
+  td: TestingData = TestingData()
+
+  def test_build_predicate(self) -> None:
+    """
+    GIVEN I have conditions on numbers, booleans, strings and lists
+    WHEN I build a predicate
+    THEN each value should be formatted and quoted as a SQL literal
+    """
+    assert build_predicate(self.td.conditions) == self.td.predicate
+
+  def test_build_predicate_unsupported(self) -> None:
+    """
+    GIVEN I have a condition on a value that has no SQL literal
+    WHEN I build a predicate
+    THEN it should raise a TypeError
+    """
+    with self.assertRaises(TypeError):
+      build_predicate({'day': None})
+
+  def test_delete_rows(self) -> None:
+    """
+    GIVEN I have a table with several rows
+    WHEN I delete the rows matching some conditions, then none
+    THEN only the matching rows should be deleted
+    """
+    with TemporaryDirectory() as main_path:
+      table: Table = Table(
+        domain='aoc',
+        quality=TableQuality.STANDARD,
+        name='example_case',
+        raw_schema=Schema([Field('day', 'integer'), Field('case_id', 'string')]),
+        metastore=Metastore(main_path)
+      )
+      table.append(self.td.rows)
+      assert delete_rows(table, self.td.delete_conditions)
+      assert not delete_rows(table, self.td.delete_conditions)
+      assert not delete_rows(table, {'case_id': []})
+      df: pl.DataFrame = table.get(select=['day', 'case_id'], sort_by=['day', 'case_id'])
+      assert df.rows() == self.td.kept_rows
@@ -0,0 +1,135 @@
+import sys
+
+from contextlib import contextmanager
+from dataclasses import replace
+from glob import glob
+from os import makedirs, path
+from polta.metastore import Metastore
+from polta.table import Table
+from tempfile import TemporaryDirectory
+from typing import Iterator
+from unittest import TestCase
+from unittest.mock import patch
+
+from aoc_manager.tables.example_case import \
+  table as tab_aoc_example_case
+from aoc_manager.tables.input import \
+  table as tab_aoc_input
+from aoc_manager.tools.example_cases import \
+  CaseResult, \
+  ExampleCase, \
+  get_example_cases, \
+  run_example_case, \
+  run_example_cases
+from aoc_manager.tools.snapshot import SnapshotStore
+from tests.testing_data.example_cases import TestingData
+
+
+@contextmanager
+def solver_root(year: int, day: int, source: str) -> Iterator[str]:
+  """Makes a solver script importable, as solutions/ under the app's cwd would be"""
+  with TemporaryDirectory() as root:
+    solver_dir: str = path.join(root, 'solutions', f'Y{year}', 'solutions')
+    makedirs(solver_dir)
+    with open(path.join(solver_dir, f'd{day}.py'), 'w') as f:
+      f.write(source)
+    sys.path.insert(0, root)
+    try:
+      yield root
+    finally:
+      sys.path.remove(root)
+      for name in [name for name in sys.modules if name.startswith('solutions')]:
+        del sys.modules[name]
+
+
+class TestExampleCases(TestCase):
+  """Contains unit tests for running a day's example cases"""
+  td: TestingData = TestingData()
+
+  def test_case_result_passed(self) -> None:
+    """
+    GIVEN I have case results that match, differ, errored or have no answer
+    WHEN I check whether they passed
+    THEN only the matching result without an error should pass
+    """
+    assert CaseResult('a', 'a', expected='6\n', answer=' 6').passed
+    assert not CaseResult('a', 'a', expected='6', answer='7').passed
+    assert not CaseResult('a', 'a', expected='6', answer='6', error='Traceback').passed
+    assert not CaseResult('a', 'a', expected='6').passed
+
+  def test_get_example_cases(self) -> None:
+    """
+    GIVEN I have saved example cases and a day's inputs with expected answers
+    WHEN I get the day's example cases
+    THEN the inputs' examples should be added unless a saved case replaces them
+    """
+    with TemporaryDirectory() as main_path:
+      metastore: Metastore = Metastore(main_path)
+      case_table: Table = replace(tab_aoc_example_case, metastore=metastore)
+      input_table: Table = replace(tab_aoc_input, metastore=metastore)
+      case_table.append([
+        {'year': self.td.year, 'day': self.td.day, **row} for row in self.td.saved_cases
+      ])
+      input_table.append({'year': self.td.year, 'day': self.td.day, **self.td.input_row})
+
+      with patch('aoc_manager.tools.example_cases.tab_aoc_example_case', case_table), \
+          patch('aoc_manager.tools.example_cases.tab_aoc_input', input_table):
+        assert get_example_cases(self.td.year, self.td.day) == self.td.cases
+        assert get_example_cases(self.td.year, self.td.missing_day) == []
+
+  def test_run_example_case(self) -> None:
+    """
+    GIVEN I have a solver that snapshots its pre-processing
+    WHEN I run it on passing, failing and broken example cases
+    THEN each result should hold its answer or error, and no snapshot should be saved
+    """
+    with solver_root(self.td.year, self.td.day, self.td.solver_source), \
+        TemporaryDirectory() as snapshot_root, \
+        patch('aoc_manager.tools.problem_solver.snapshot_store', SnapshotStore(root=snapshot_root)):
+      results: list[CaseResult] = [
+        run_example_case(self.td.year, self.td.day, case) for case in self.td.run_cases
+      ]
+      assert not glob(path.join(snapshot_root, '*'))
+
+    assert [result.answer for result in results] == self.td.run_answers
+    assert [result.passed for result in results] == self.td.run_passed
+    assert 'ValueError' in results[2].error
+    assert results[0].preprocessing_time > 0
+
+  def test_run_example_case_missing_solver(self) -> None:
+    """
+    GIVEN I have a day without a solver
+    WHEN I run an example case
+    THEN the result should report the missing solver
+    """
+    result: CaseResult = run_example_case(self.td.year, self.td.missing_day, self.td.passing_case)
+    assert not result.passed
+    assert result.error.startswith('Error: no solver found')
+
+  def test_run_example_cases(self) -> None:
+    """
+    GIVEN I have a solver and several example cases
+    WHEN I run them on a process pool
+    THEN each result should be returned in the order of the cases
+    """
+    assert run_example_cases(self.td.year, self.td.day, []) == []
+    with solver_root(self.td.year, self.td.day, self.td.solver_source):
+      results: list[CaseResult] = run_example_cases(
+        self.td.year, self.td.day, self.td.run_cases, workers=2
+      )
+    assert [(result.case_id, result.part) for result in results] \
+      == [(case.case_id, case.part) for case in self.td.run_cases]
+    assert [result.passed for result in results] == self.td.run_passed
+
+  def test_run_example_cases_limits(self) -> None:
+    """
+    GIVEN I have example cases that pass, spin on the CPU or hang
+    WHEN I run them under CPU-time and wall-clock limits
+    THEN the runaway cases should be stopped and reported without failing the others
+    """
+    with solver_root(self.td.year, self.td.day, self.td.limited_source):
+      results: list[CaseResult] = run_example_cases(
+        self.td.year, self.td.day, self.td.limited_cases, limits=self.td.limits
+      )
+    assert [result.error for result in results] == self.td.limited_errors
+    assert results[0].passed
@@ -0,0 +1,87 @@
+from threading import Event
+from unittest import TestCase
+
+from aoc_manager.tools.executor import describe_exit, ExecutionLimits, run_isolated
+from aoc_manager.tools.run_result import RunResult
+from tests.test_example_cases import solver_root
+from tests.testing_data.executor import TestingData
+
+
+class TestExecutor(TestCase):
+  """Contains unit tests for the child-process executor"""
+  td: TestingData = TestingData()
+
+  def test_describe_exit_code(self) -> None:
+    """
+    GIVEN I have a child process that exited on its own
+    WHEN I describe its exit
+    THEN it should report the exit code without blaming a limit
+    """
+    assert describe_exit(self.td.exit_code, ExecutionLimits()) == self.td.exited
+
+  def test_describe_exit_cpu_limit(self) -> None:
+    """
+    GIVEN I have a child process killed by a CPU-time signal
+    WHEN I describe its exit with and without a CPU-time limit
+    THEN it should only blame the limit when one was set
+    """
+    limits: ExecutionLimits = ExecutionLimits(cpu_time=self.td.cpu_time)
+    assert describe_exit(self.td.sigxcpu, limits) == self.td.cpu_limited
+    assert describe_exit(self.td.sigkill, ExecutionLimits()) == self.td.killed
+
+  def test_describe_exit_memory_limit(self) -> None:
+    """
+    GIVEN I have a child process that crashed under a memory limit
+    WHEN I describe its exit
+    THEN it should mention the memory limit
+    """
+    limits: ExecutionLimits = ExecutionLimits(memory_bytes=self.td.memory_bytes)
+    assert describe_exit(self.td.sigsegv, limits) == self.td.memory_limited
+
+  def test_describe_exit_other_signal(self) -> None:
+    """
+    GIVEN I have a child process killed by an unrelated signal
+    WHEN I describe its exit under every limit
+    THEN it should only name the signal
+    """
+    limits: ExecutionLimits = ExecutionLimits(
+      cpu_time=self.td.cpu_time,
+      memory_bytes=self.td.memory_bytes
+    )
+    assert describe_exit(self.td.sigterm, limits) == self.td.terminated
+
+  def run_part_b_failure(self, solve_b: str) -> RunResult:
+    """Runs both parts of a solver whose Part B hangs or crashes, cancelling once Part B starts"""
+    cancel: Event = Event()
+
+    def on_update(phase: str, result: RunResult) -> None:
+      if phase == 'b' and solve_b == self.td.hanging_solve_b:
+        cancel.set()
+
+    with solver_root(self.td.year, self.td.day, self.td.solver_source.format(solve_b=solve_b)):
+      return run_isolated(
+        self.td.year, self.td.day, True, 'both', force=True,
+        on_update=on_update, cancel=cancel
+      )
+
+  def test_run_isolated_cancelled(self) -> None:
+    """
+    GIVEN I have a solver whose Part B never finishes
+    WHEN I cancel the run during Part B
+    THEN the result should keep Part A's answer and row and report the cancellation
+    """
+    result: RunResult = self.run_part_b_failure(self.td.hanging_solve_b)
+    assert result.answer_a == self.td.answer_a
+    assert result.errors == {'b': self.td.cancelled}
+    assert [row['part'] for row in result.rows] == ['a']
+
+  def test_run_isolated_crashed(self) -> None:
+    """
+    GIVEN I have a solver whose process exits during Part B
+    WHEN I run both parts
+    THEN the result should keep Part A's answer and row and report the crash
+    """
+    result: RunResult = self.run_part_b_failure(self.td.crashing_solve_b)
+    assert result.answer_a == self.td.answer_a
+    assert result.errors == {'b': self.td.crashed}
+    assert [row['part'] for row in result.rows] == ['a']
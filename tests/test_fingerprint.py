@@ -0,0 +1,42 @@
+from unittest import TestCase
+from unittest.mock import patch
+
+from aoc_manager.tools.fingerprint import get_fingerprint, hash_solver_source
+from aoc_manager.tools.input_cache import InputCache
+
+
+class TestFingerprint(TestCase):
+  """Contains unit tests for the solution fingerprints"""
+
+  def test_hash_solver_source(self) -> None:
+    """
+    GIVEN I have a class defined in a module file
+    WHEN I hash its source twice
+    THEN it should return the same hash of its module
+    """
+    source_hash: str = hash_solver_source(TestFingerprint)
+    assert source_hash == hash_solver_source(TestFingerprint)
+    assert source_hash != hash_solver_source(InputCache)
+
+  def test_hash_solver_source_unreadable(self) -> None:
+    """
+    GIVEN I have a class without a source file or whose source file cannot be read
+    WHEN I hash its source
+    THEN it should return an empty hash instead of raising
+    """
+    assert hash_solver_source(int) == ''
+    with patch('builtins.open', side_effect=PermissionError):
+      assert hash_solver_source(TestFingerprint) == ''
+
+  def test_get_fingerprint(self) -> None:
+    """
+    GIVEN I have a solver source hash and an input hash
+    WHEN I change any component of the fingerprint
+    THEN the fingerprint should change
+    """
+    fingerprint: str = get_fingerprint('source', 'input', 'a', True)
+    assert fingerprint == get_fingerprint('source', 'input', 'a', True)
+    assert fingerprint != get_fingerprint('changed', 'input', 'a', True)
+    assert fingerprint != get_fingerprint('source', 'changed', 'a', True)
+    assert fingerprint != get_fingerprint('source', 'input', 'b', True)
+    assert fingerprint != get_fingerprint('source', 'input', 'a', False)
@@ -0,0 +1,110 @@
+from unittest import TestCase
+
+from aoc_manager.tools.grid.array_map import ArrayGridMap
+from aoc_manager.tools.grid.cursor import GridCursor
+from tests.testing_data.array_map import TestingData
+
+
+class TestArrayGridMap(TestCase):
+  """Contains unit tests for the ArrayGridMap dataclass"""
+  td: TestingData = TestingData()
+
+  def test_from_text(self) -> None:
+    """
+    GIVEN I have a grid as input text
+    WHEN I build an ArrayGridMap from it
+    THEN it should hold the cells row-major in one buffer
+    """
+    grid_map: ArrayGridMap = ArrayGridMap.from_text(self.td.init_text)
+    assert grid_map.data == self.td.init_data
+    assert grid_map.max_x == self.td.init_max_x
+    assert grid_map.max_y == self.td.init_max_y
+    assert isinstance(grid_map.cursor, GridCursor)
+
+  def test_from_rows(self) -> None:
+    """
+    GIVEN I have a grid as rows of characters
+    WHEN I build an ArrayGridMap from it
+    THEN it should match the grid built from text
+    """
+    assert ArrayGridMap.from_rows(self.td.init_input).data == self.td.init_data
+
+  def test_from_text_uneven_rows(self) -> None:
+    """
+    GIVEN I have input text with rows of different widths
+    WHEN I build an ArrayGridMap from it
+    THEN it should raise a ValueError
+    """
+    for text in self.td.uneven_texts:
+      with self.assertRaises(ValueError):
+        ArrayGridMap.from_text(text)
+    with self.assertRaises(ValueError):
+      ArrayGridMap.from_rows(self.td.uneven_rows)
+
+  def test_get(self) -> None:
+    """
+    GIVEN I have an ArrayGridMap
+    WHEN I attempt to get it as a string
+    THEN it should render one line per row
+    """
+    assert ArrayGridMap.from_text(self.td.init_text).get() == self.td.init_text
+
+  def test_get_window(self) -> None:
+    """
+    GIVEN I have an ArrayGridMap
+    WHEN I attempt to get the window around its cursor
+    THEN only the cells within the radius should be rendered
+    """
+    grid_map: ArrayGridMap = ArrayGridMap.from_text(self.td.init_text, 2, 2)
+    assert grid_map.get_window(1) == self.td.get_window_center
+
+  def test_get_at_cursor(self) -> None:
+    """
+    GIVEN I have an ArrayGridMap
+    WHEN I attempt to get the cursor value
+    THEN it should be retrieved as expected
+    """
+    grid_map: ArrayGridMap = ArrayGridMap.from_text(self.td.init_text)
+    assert grid_map.get_at_cursor() == self.td.get_at_cursor
+    grid_map.cursor.move_down()
+    assert grid_map.get_at_cursor() == self.td.get_at_cursor_down
+    grid_map.cursor.move_left()
+    assert grid_map.get_at_cursor() == self.td.get_at_cursor_down_and_left
+    assert not grid_map.cursor_equals('@')
+
+  def test_set_at_cursor(self) -> None:
+    """
+    GIVEN I have an ArrayGridMap
+    WHEN I set the cell at the cursor
+    THEN the cell should hold the new value
+    """
+    grid_map: ArrayGridMap = ArrayGridMap.from_text(self.td.init_text)
+    grid_map.set_at_cursor('#')
+    assert grid_map.cursor_equals('#')
+    assert grid_map.get().startswith('#')
+
+  def test_set_value_out_of_bounds(self) -> None:
+    """
+    GIVEN I have an ArrayGridMap
+    WHEN I set a cell outside the grid
+    THEN it should raise an IndexError and leave the grid unchanged
+    """
+    grid_map: ArrayGridMap = ArrayGridMap.from_text(self.td.init_text)
+    for x, y in self.td.outside_coordinates:
+      with self.assertRaises(IndexError):
+        grid_map.set_value(x, y, '#')
+    assert grid_map.get() == self.td.init_text
+
+  def test_bulk_operations(self) -> None:
+    """
+    GIVEN I have an ArrayGridMap
+    WHEN I find, count and mask a symbol
+    THEN they should cover every cell holding it
+    """
+    grid_map: ArrayGridMap = ArrayGridMap.from_text(self.td.init_text)
+    assert grid_map.find_all('.') == self.td.find_all_dots
+    assert grid_map.count('.') == len(self.td.find_all_dots)
+    mask: bytearray = grid_map.mask('.')
+    assert len(mask) == len(grid_map.data)
+    assert mask[:grid_map.max_x] == self.td.mask_dots_row_0
+    assert sum(mask) == len(self.td.find_all_dots)
@@ -1,6 +1,8 @@
 from unittest import TestCase
 
+from aoc_manager.tools.grid.array_map import ArrayGridMap
 from aoc_manager.tools.grid.cursor import GridCursor
+from aoc_manager.tools.grid.map import GridMap
 from tests.testing_data.cursor import TestingData
 
 
@@ -156,4 +158,72 @@ class TestCursor(TestCase):
     x, y = self.td.jump_to
     cursor.jump_to(x, y)
     assert cursor.as_tuple() == self.td.jump_to
-  
\ No newline at end of file
+
+  def test_slots(self) -> None:
+    """
+    GIVEN I have a Cursor instance
+    WHEN I inspect its attributes
+    THEN they should be held in slots rather than a dict
+    """
+    cursor: GridCursor = GridCursor(0, 0, 1, 1)
+    assert not hasattr(cursor, '__dict__')
+
+  def test_turns(self) -> None:
+    """
+    GIVEN I have a Cursor instance facing up
+    WHEN I turn it right or left repeatedly
+    THEN it should cycle through the four headings
+    """
+    cursor: GridCursor = GridCursor(0, 0, 5, 5)
+    for heading in self.td.heading_right_turns:
+      cursor.turn_right()
+      assert cursor.get_heading() == heading
+    for heading in self.td.heading_left_turns:
+      cursor.turn_left()
+      assert cursor.get_heading() == heading
+    cursor.turn_around()
+    assert cursor.get_heading() == (0, 1)
+
+  def test_move(self) -> None:
+    """
+    GIVEN I have a Cursor instance
+    WHEN I move it several steps along its heading
+    THEN it should move in one update and track its bounds
+    """
+    cursor: GridCursor = GridCursor(*self.td.heading_start, 5, 5)
+    assert cursor.peek(self.td.move_steps) == self.td.move_steps_result
+    cursor.move(self.td.move_steps)
+    assert cursor.as_tuple() == self.td.move_steps_result
+    assert not cursor.outside_bound_x
+    assert cursor.outside_bound_y
+
+  def test_move_diagonal(self) -> None:
+    """
+    GIVEN I have a Cursor instance
+    WHEN I move it diagonally
+    THEN it should move along both axes
+    """
+    for direction, result in self.td.diagonal_results.items():
+      cursor: GridCursor = GridCursor(*self.td.heading_start, 5, 5)
+      getattr(cursor, f'move_{direction}')()
+      assert cursor.as_tuple() == result
+      cursor.jump_to(*self.td.heading_start)
+      cursor.face(direction)
+      cursor.move()
+      assert cursor.as_tuple() == result
+
+  def test_ray_cast(self) -> None:
+    """
+    GIVEN I have a Cursor on a GridMap and on an ArrayGridMap
+    WHEN I cast a ray along its heading
+    THEN it should return the distance to the symbol or the edge
+    """
+    grid_maps: list[GridMap | ArrayGridMap] = [
+      GridMap(self.td.ray_input, *self.td.heading_start),
+      ArrayGridMap.from_rows(self.td.ray_input, *self.td.heading_start)
+    ]
+    for grid_map in grid_maps:
+      for direction, result in self.td.ray_results.items():
+        grid_map.cursor.face(direction)
+        assert grid_map.cursor.ray_cast(grid_map, '#') == result
+
@@ -36,6 +36,47 @@ class TestGridMap(TestCase):
     """
     grid_map: GridMap = GridMap(self.td.init_input)
     assert grid_map.get() == self.td.get_output
+
+  def test_get_out_of_order(self) -> None:
+    """
+    GIVEN I have a GridMap whose grid was filled out of row-major order
+    WHEN I attempt to get it as a string
+    THEN it should still render row by row
+    """
+    grid: dict[tuple[int, int], str] = dict(reversed(self.td.init_grid_output.items()))
+    grid_map: GridMap = GridMap(self.td.init_input, grid=grid)
+    assert grid_map.get() == self.td.get_output
+
+  def test_get_window(self) -> None:
+    """
+    GIVEN I have a GridMap
+    WHEN I attempt to get the window around its cursor
+    THEN only the cells within the radius and the grid should be rendered
+    """
+    grid_map: GridMap = GridMap(self.td.init_input)
+    assert grid_map.get_window(1) == self.td.get_window_corner
+    grid_map.cursor.jump_to(2, 2)
+    assert grid_map.get_window(1) == self.td.get_window_center
+
+  def test_get_incremental(self) -> None:
+    """
+    GIVEN I have an incremental GridMap that was already rendered
+    WHEN I set a cell and render it again
+    THEN only the changed row should be re-rendered
+    """
+    grid_map: GridMap = GridMap(self.td.init_input, incremental=True)
+    assert grid_map.get() == self.td.get_output
+    grid_map.cursor.jump_to(2, 2)
+    grid_map.set_at_cursor('#')
+    assert grid_map.dirty_rows == {2}
+    assert grid_map.get() == self.td.get_after_set
+    assert not grid_map.dirty_rows
+
+    # Writes made to the grid directly only show once the row is marked dirty
+    grid_map.grid[(2, 2)] = '@'
+    assert grid_map.get() == self.td.get_after_set
+    grid_map.mark_dirty(2)
+    assert grid_map.get() == self.td.get_output
   
   def test_get_at_cursor(self) -> None:
     """
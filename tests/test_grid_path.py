@@ -0,0 +1,76 @@
+from unittest import TestCase
+
+from aoc_manager.tools.grid.array_map import ArrayGridMap
+from aoc_manager.tools.grid.map import GridMap
+from aoc_manager.tools.grid.path import a_star, bfs, bfs_01, dijkstra, PathResult
+from tests.testing_data.path import TestingData
+
+
+class TestPath(TestCase):
+  """Contains unit tests for the grid path-finding functions"""
+  td: TestingData = TestingData()
+
+  def vertical_cost(self, index: int, neighbor: int) -> int:
+    """Costs 1 per step between rows and nothing within a row"""
+    return 0 if abs(index - neighbor) == 1 else 1
+
+  def test_bfs(self) -> None:
+    """
+    GIVEN I have a maze
+    WHEN I search it breadth-first
+    THEN it should find the fewest steps to each cell and the shortest path
+    """
+    grid_map: ArrayGridMap = ArrayGridMap.from_text(self.td.maze_text)
+    result: PathResult = bfs(grid_map, self.td.maze_start)
+    assert result.get_distance(self.td.maze_target) == self.td.maze_distance
+    assert result.get_distance(self.td.maze_corner) == self.td.maze_corner_distance
+    path: list[int] = result.get_path(self.td.maze_target)
+    assert result.get_coordinates(path) == self.td.maze_path
+
+  def test_bfs_grid_map(self) -> None:
+    """
+    GIVEN I have a maze stored as a GridMap
+    WHEN I search it breadth-first
+    THEN it should match the search on an ArrayGridMap
+    """
+    grid_map: GridMap = GridMap([list(row) for row in self.td.maze_text.split()])
+    array_map: ArrayGridMap = ArrayGridMap.from_text(self.td.maze_text)
+    assert bfs(grid_map, self.td.maze_start).distances \
+      == bfs(array_map, self.td.maze_start).distances
+
+  def test_unreachable(self) -> None:
+    """
+    GIVEN I have a grid with a sealed-off cell
+    WHEN I search it from outside that cell
+    THEN the cell should be unreachable and have no path
+    """
+    grid_map: ArrayGridMap = ArrayGridMap.from_text(self.td.sealed_text)
+    for search in [bfs, dijkstra]:
+      result: PathResult = search(grid_map, self.td.sealed_start)
+      assert not result.is_reachable(self.td.sealed_cell)
+      assert result.get_path(self.td.sealed_cell) == []
+    result: PathResult = a_star(grid_map, self.td.sealed_start, self.td.sealed_cell)
+    assert result.get_path() == []
+
+  def test_weighted(self) -> None:
+    """
+    GIVEN I have a maze where only steps between rows cost anything
+    WHEN I search it with 0-1 BFS and with Dijkstra
+    THEN both should find the same cheapest costs
+    """
+    grid_map: ArrayGridMap = ArrayGridMap.from_text(self.td.maze_text)
+    zero_one: PathResult = bfs_01(grid_map, self.td.maze_start, self.vertical_cost)
+    weighted: PathResult = dijkstra(grid_map, self.td.maze_start, self.vertical_cost)
+    assert zero_one.distances == weighted.distances
+    assert weighted.get_distance(self.td.maze_target) == self.td.maze_vertical_cost
+
+  def test_a_star(self) -> None:
+    """
+    GIVEN I have a maze
+    WHEN I search it with A*
+    THEN it should find a shortest path to the target
+    """
+    grid_map: ArrayGridMap = ArrayGridMap.from_text(self.td.maze_text)
+    result: PathResult = a_star(grid_map, self.td.maze_start, self.td.maze_target)
+    assert result.get_distance(self.td.maze_target) == self.td.maze_distance
+    assert len(result.get_path()) == self.td.maze_distance + 1
@@ -0,0 +1,66 @@
+from unittest import TestCase
+
+from aoc_manager.tools.grid.array_map import ArrayGridMap
+from aoc_manager.tools.grid.map import GridMap
+from aoc_manager.tools.grid.regions import RegionLabels
+from tests.testing_data.regions import TestingData
+
+
+class TestRegions(TestCase):
+  """Contains unit tests for the grid region labeling"""
+  td: TestingData = TestingData()
+
+  def test_label_regions(self) -> None:
+    """
+    GIVEN I have a garden of plots
+    WHEN I label its regions
+    THEN each region should be labelled and measured as expected
+    """
+    region_labels: RegionLabels = ArrayGridMap.from_text(self.td.garden_text).label_regions()
+    assert region_labels.labels == self.td.garden_labels
+    assert region_labels.regions == self.td.garden_regions
+    assert region_labels.get_region(3, 3) == self.td.garden_regions[2]
+
+  def test_label_regions_grid_map(self) -> None:
+    """
+    GIVEN I have a garden stored as a GridMap
+    WHEN I label its regions
+    THEN it should match the labels of an ArrayGridMap
+    """
+    grid_map: GridMap = GridMap([list(row) for row in self.td.garden_text.split()])
+    assert grid_map.label_regions() \
+      == ArrayGridMap.from_text(self.td.garden_text).label_regions()
+
+  def test_label_regions_with_holes(self) -> None:
+    """
+    GIVEN I have a region that surrounds other regions
+    WHEN I label its regions
+    THEN the inner edges should count towards its perimeter and sides
+    """
+    region_labels: RegionLabels = ArrayGridMap.from_text(self.td.holes_text).label_regions()
+    assert len(region_labels.regions) == self.td.holes_region_count
+    assert region_labels.regions[0] == self.td.holes_outer
+
+  def test_label_regions_merged(self) -> None:
+    """
+    GIVEN I have a garden whose regions branch and rejoin
+    WHEN I label its regions
+    THEN the total prices should match
+    """
+    region_labels: RegionLabels = ArrayGridMap.from_text(self.td.large_text).label_regions()
+    assert sum(region.area * region.perimeter for region in region_labels.regions) \
+      == self.td.large_perimeter_price
+    assert sum(region.area * region.sides for region in region_labels.regions) \
+      == self.td.large_sides_price
+
+  def test_label_regions_ignore(self) -> None:
+    """
+    GIVEN I have a grid with background cells
+    WHEN I label its regions ignoring the background
+    THEN the background should have no label
+    """
+    region_labels: RegionLabels = ArrayGridMap.from_text(self.td.ignored_text) \
+      .label_regions(ignore='.')
+    assert len(region_labels.regions) == self.td.ignored_region_count
+    assert region_labels.get_label(1, 0) == -1
+    assert region_labels.get_region(1, 0) is None
@@ -0,0 +1,106 @@
+import sys
+
+from os import makedirs, path, remove, stat, utime
+from tempfile import TemporaryDirectory
+from typing import Optional
+from unittest import TestCase
+from unittest.mock import patch
+
+from aoc_manager.tools.import_solver import discover_solvers, SolverIndex
+from tests.testing_data.import_solver import TestingData
+
+
+class TestSolverIndex(TestCase):
+  """Contains unit tests for discovering and indexing solver scripts"""
+  td: TestingData = TestingData()
+
+  def setUp(self) -> None:
+    self.root_dir: TemporaryDirectory = TemporaryDirectory()
+    self.root: str = self.root_dir.name
+    makedirs(path.join(self.root, 'solutions', f'Y{self.td.year}', 'solutions'))
+    sys.path.insert(0, self.root)
+
+  def tearDown(self) -> None:
+    sys.path.remove(self.root)
+    for name in [name for name in sys.modules if name.startswith('solutions')]:
+      del sys.modules[name]
+    self.root_dir.cleanup()
+
+  def write_solver(self, file_name: str, source: str) -> str:
+    """Writes a script to the year's solutions directory, moving its mtime past any earlier write"""
+    file_path: str = path.join(self.root, 'solutions', f'Y{self.td.year}', 'solutions', file_name)
+    modified_ns: Optional[int] = stat(file_path).st_mtime_ns if path.exists(file_path) else None
+    with open(file_path, 'w') as f:
+      f.write(source)
+    if modified_ns is not None:
+      # Cached bytecode only notices edits whose mtime differs in whole seconds
+      utime(file_path, ns=(modified_ns + 2_000_000_000, modified_ns + 2_000_000_000))
+    return file_path
+
+  def test_discover_solvers(self) -> None:
+    """
+    GIVEN I have solver scripts and other files under solutions/
+    WHEN I discover the solvers
+    THEN only the dN.py scripts should be found, sorted by year and day
+    """
+    for day in reversed(self.td.discovered_days):
+      self.write_solver(f'd{day}.py', self.td.solver_source.format(day=day, version=1))
+    for file_name in self.td.junk_files:
+      self.write_solver(file_name, '')
+    assert discover_solvers(self.root) == [(self.td.year, day) for day in self.td.discovered_days]
+
+  def test_get_solver_reload(self) -> None:
+    """
+    GIVEN I have an indexed solver
+    WHEN I look it up again before and after editing its script
+    THEN it should reuse the module until the mtime changes, then reload it
+    """
+    index: SolverIndex = SolverIndex(root=self.root)
+    self.write_solver('d1.py', self.td.solver_source.format(day=1, version=1))
+    first: type = index.get_solver(self.td.year, 1)
+    assert first.version == 1
+    assert index.get_solver(self.td.year, 1) is first
+
+    self.write_solver('d1.py', self.td.solver_source.format(day=1, version=2))
+    assert index.get_solver(self.td.year, 1).version == 2
+
+  def test_solver_created_after_startup(self) -> None:
+    """
+    GIVEN I have an index that has already scanned an empty solutions/
+    WHEN a solver script is created afterwards
+    THEN the next lookup and scan should find it
+    """
+    index: SolverIndex = SolverIndex(root=self.root)
+    assert index.scan() == []
+    assert index.get_solver(self.td.year, 3) is None
+
+    self.write_solver('d3.py', self.td.solver_source.format(day=3, version=1))
+    assert index.get_solver(self.td.year, 3).version == 1
+    assert index.scan() == [(self.td.year, 3)]
+
+  def test_scan_skips_broken_solver(self) -> None:
+    """
+    GIVEN I have a valid solver script and one that fails to import
+    WHEN I scan the index
+    THEN the broken solver should be reported and skipped while the valid one is indexed
+    """
+    self.write_solver('d1.py', self.td.solver_source.format(day=1, version=1))
+    self.write_solver('d2.py', self.td.broken_source.format(day=2))
+    index: SolverIndex = SolverIndex(root=self.root)
+    with patch('aoc_manager.tools.import_solver.print_exc') as print_exc:
+      assert index.scan() == [(self.td.year, 1), (self.td.year, 2)]
+    print_exc.assert_called_once()
+    assert list(index.modules) == [(self.td.year, 1)]
+
+  def test_get_solver_deleted(self) -> None:
+    """
+    GIVEN I have an indexed solver
+    WHEN its script is deleted
+    THEN the lookup should return None and drop it from the index
+    """
+    index: SolverIndex = SolverIndex(root=self.root)
+    file_path: str = self.write_solver('d1.py', self.td.solver_source.format(day=1, version=1))
+    assert index.get_solver(self.td.year, 1) is not None
+    remove(file_path)
+    assert index.get_solver(self.td.year, 1) is None
+    assert index.modules == {}
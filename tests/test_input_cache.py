@@ -0,0 +1,116 @@
+from unittest import TestCase
+
+from aoc_manager.tools.input_cache import input_cache, InputCache
+from aoc_manager.tools.problem_solver import override_inputs, ProblemSolver
+from tests.testing_data.input_cache import TestingData
+
+
+class GridSolver(ProblemSolver):
+  def __init__(self, year: str, test: bool = False, debug: bool = False,
+               input_format: type = list[list[int]], mask_answers: bool = False) -> None:
+    super().__init__(
+      year=year,
+      day='1',
+      test=test,
+      debug=debug,
+      input_format=input_format,
+      mask_answers=mask_answers
+    )
+
+
+class TestInputCache(TestCase):
+  """Contains unit tests for the InputCache dataclass"""
+  td: TestingData = TestingData()
+
+  def _parse(self, text: str) -> list[list[int]]:
+    return [[int(c) for c in line] for line in text.splitlines()]
+
+  def test_get_or_parse(self) -> None:
+    """
+    GIVEN I have an InputCache
+    WHEN I parse the same text in the same format twice
+    THEN it should parse once and hand each caller its own copy
+    """
+    cache: InputCache = InputCache()
+    first = cache.get_or_parse(self.td.text_a, self.td.input_format, self._parse)
+    second = cache.get_or_parse(self.td.text_a, self.td.input_format, self._parse)
+    assert first == self.td.parsed_a
+    assert first == second
+    assert first is not second
+    assert first[0] is not second[0]
+    assert cache.hits == 1
+    assert cache.misses == 1
+    assert cache.current_bytes > 0
+
+  def test_format_is_part_of_key(self) -> None:
+    """
+    GIVEN I have an InputCache
+    WHEN I parse the same text in two formats
+    THEN it should cache both separately
+    """
+    cache: InputCache = InputCache()
+    cache.get_or_parse(self.td.text_a, self.td.input_format, self._parse)
+    cache.get_or_parse(self.td.text_a, self.td.other_format, str.splitlines)
+    assert cache.misses == 2
+    assert len(cache.entries) == 2
+
+  def test_lru_eviction(self) -> None:
+    """
+    GIVEN I have an InputCache with a single entry allowed
+    WHEN I parse two different texts
+    THEN it should evict the least recently used one
+    """
+    cache: InputCache = InputCache(max_entries=self.td.max_entries)
+    cache.get_or_parse(self.td.text_a, self.td.other_format, str.splitlines)
+    cache.get_or_parse(self.td.text_b, self.td.other_format, str.splitlines)
+    assert len(cache.entries) == 1
+    assert (cache.hash_text(self.td.text_b), self.td.other_format) in cache.entries
+
+  def test_byte_budget(self) -> None:
+    """
+    GIVEN I have an InputCache with a tiny byte budget
+    WHEN I parse a text larger than the budget
+    THEN it should return the parsed input without caching it
+    """
+    cache: InputCache = InputCache(max_bytes=self.td.small_max_bytes)
+    parsed = cache.get_or_parse(self.td.text_a, self.td.input_format, self._parse)
+    assert parsed == self.td.parsed_a
+    assert len(cache.entries) == 0
+    assert cache.current_bytes == 0
+
+  def test_clear(self) -> None:
+    """
+    GIVEN I have a populated InputCache
+    WHEN I clear it
+    THEN it should be empty
+    """
+    cache: InputCache = InputCache()
+    cache.get_or_parse(self.td.text_a, self.td.input_format, self._parse)
+    cache.clear()
+    assert len(cache.entries) == 0
+    assert cache.current_bytes == 0
+
+  def test_precomputed_hash(self) -> None:
+    """
+    GIVEN I have an InputCache
+    WHEN I pass the text hash I already computed
+    THEN it should key the entry on that hash
+    """
+    cache: InputCache = InputCache()
+    text_hash: str = cache.hash_text(self.td.text_a)
+    cache.get_or_parse(self.td.text_a, self.td.other_format, str.splitlines, text_hash=text_hash)
+    assert (text_hash, self.td.other_format) in cache.entries
+
+  def test_mutated_input_is_not_shared(self) -> None:
+    """
+    GIVEN I have a solver whose parts read the same test input
+    WHEN Part A mutates its parsed input in place
+    THEN Part B and the next solver instance should still see the original input
+    """
+    input_cache.clear()
+    with override_inputs(self.td.text_a):
+      solver: GridSolver = GridSolver(year='2000', test=True)
+      solver.input_a_text[0][0] = self.td.mutated_value
+      assert solver.input_b_text == self.td.parsed_a
+      assert GridSolver(year='2000', test=True).input_a_text == self.td.parsed_a
+    assert solver.input_hashes['a'] == input_cache.hash_text(self.td.text_a)
@@ -0,0 +1,113 @@
+import polars as pl
+
+from importlib.util import find_spec
+from unittest import skipUnless, TestCase
+
+from aoc_manager.tools.input_formats import \
+  input_parsers, \
+  InputFormat, \
+  parse_input, \
+  register_input_format
+from tests.testing_data.input_formats import TestingData
+
+
+has_numpy: bool = find_spec('numpy') is not None
+
+
+class TestInputFormats(TestCase):
+  """Contains unit tests for the input format registry"""
+  td: TestingData = TestingData()
+
+  def test_parse_text_formats(self) -> None:
+    """
+    GIVEN I have raw input text
+    WHEN I parse it with each built-in list format
+    THEN it should be split into lines, characters or digits
+    """
+    assert parse_input(self.td.lines_text, str) == self.td.lines_text
+    assert parse_input(self.td.lines_text, list[str]) == self.td.lines
+    assert parse_input(self.td.lines_text, list[list[str]]) == self.td.char_lists
+    assert parse_input(self.td.digits_text, list[list[int]]) == self.td.digit_lists
+
+  def test_parse_callable(self) -> None:
+    """
+    GIVEN I have a format that is not registered but is callable
+    WHEN I parse input text with it
+    THEN it should be applied per line, with empty lines parsed as -1
+    """
+    assert parse_input(self.td.callable_text, int) == self.td.callable_output
+
+  def test_parse_unknown(self) -> None:
+    """
+    GIVEN I have a format that is neither registered nor callable
+    WHEN I parse input text with it
+    THEN it should raise a NotImplementedError
+    """
+    with self.assertRaises(NotImplementedError):
+      parse_input(self.td.lines_text, 'unknown')
+
+  def test_register_input_format(self) -> None:
+    """
+    GIVEN I have registered a custom input format
+    WHEN I parse input text with it
+    THEN the custom parser should be used
+    """
+    @register_input_format('reversed_lines')
+    def parse_reversed_lines(text: str) -> list[str]:
+      return text.splitlines()[::-1]
+
+    try:
+      assert parse_input(self.td.lines_text, 'reversed_lines') == self.td.lines[::-1]
+    finally:
+      del input_parsers['reversed_lines']
+
+  @skipUnless(has_numpy, 'numpy is not installed')
+  def test_parse_grids(self) -> None:
+    """
+    GIVEN I have rectangular grid text
+    WHEN I parse it as a digit grid or a character grid
+    THEN it should be a 2D array of digits or character codes
+    """
+    assert parse_input(self.td.digits_text, InputFormat.DIGIT_GRID).tolist() \
+      == self.td.digit_lists
+    char_grid = parse_input(self.td.grid_text, InputFormat.CHAR_GRID)
+    assert char_grid.tolist() == self.td.char_grid
+    assert not char_grid.flags.writeable
+
+  @skipUnless(has_numpy, 'numpy is not installed')
+  def test_parse_uneven_grid(self) -> None:
+    """
+    GIVEN I have grid text with rows of different widths
+    WHEN I parse it as a character grid
+    THEN it should raise a ValueError
+    """
+    with self.assertRaises(ValueError):
+      parse_input(self.td.uneven_grid_text, InputFormat.CHAR_GRID)
+
+  @skipUnless(has_numpy, 'numpy is not installed')
+  def test_parse_integers(self) -> None:
+    """
+    GIVEN I have text with integers scattered through it
+    WHEN I parse it as integers
+    THEN every signed integer should be extracted in order
+    """
+    assert parse_input(self.td.integers_text, InputFormat.INTEGERS).tolist() \
+      == self.td.integers
+
+  def test_parse_dataframe(self) -> None:
+    """
+    GIVEN I have whitespace-separated columns
+    WHEN I parse them as a DataFrame
+    THEN each token should be a column, with missing tokens as nulls
+    """
+    df: pl.DataFrame = parse_input(self.td.dataframe_text, InputFormat.DATAFRAME)
+    assert df.to_dicts() == self.td.dataframe_rows
+
+  def test_parse_empty_dataframe(self) -> None:
+    """
+    GIVEN I have empty input text
+    WHEN I parse it as a DataFrame
+    THEN it should return an empty DataFrame
+    """
+    df: pl.DataFrame = parse_input('', InputFormat.DATAFRAME)
+    assert df.is_empty()
@@ -0,0 +1,127 @@
+from contextlib import redirect_stderr
+from io import StringIO
+from unittest import TestCase
+
+from aoc_manager.tools.log import LogBuffer, LogSettings, LogSink
+from tests.testing_data.log import TestingData
+
+
+class TestLogBuffer(TestCase):
+  """Contains unit tests for the LogBuffer dataclass"""
+  td: TestingData = TestingData()
+
+  def _fill(self, buffer: LogBuffer) -> None:
+    for i in range(self.td.lines):
+      buffer.add(self.td.context, '', i)
+
+  def test_head(self) -> None:
+    """
+    GIVEN I have a LogBuffer in head mode
+    WHEN I log more lines than the limit
+    THEN it should keep the first lines and count the rest as dropped
+    """
+    buffer: LogBuffer = LogBuffer(LogSettings(limit=self.td.limit, mode='head'))
+    self._fill(buffer)
+    assert buffer.dropped[self.td.context] == self.td.dropped
+    assert buffer.drain()[self.td.context] == self.td.head_lines
+
+  def test_ring(self) -> None:
+    """
+    GIVEN I have a LogBuffer in ring mode
+    WHEN I log more lines than the limit
+    THEN it should keep the last lines and count the rest as dropped
+    """
+    buffer: LogBuffer = LogBuffer(LogSettings(limit=self.td.limit, mode='ring'))
+    self._fill(buffer)
+    assert buffer.dropped[self.td.context] == self.td.dropped
+    assert buffer.drain()[self.td.context] == self.td.ring_lines
+
+  def test_sample(self) -> None:
+    """
+    GIVEN I have a LogBuffer in sample mode
+    WHEN I log more lines than the limit
+    THEN it should keep a limited sample in logged order
+    """
+    buffer: LogBuffer = LogBuffer(LogSettings(limit=self.td.limit, mode='sample'))
+    self._fill(buffer)
+    lines: list[tuple[str, str]] = buffer.drain()[self.td.context]
+    assert len(lines) == self.td.limit
+    assert lines == sorted(lines, key=lambda line: int(line[1]))
+    assert buffer.dropped[self.td.context] == self.td.dropped
+
+  def test_labels(self) -> None:
+    """
+    GIVEN I have a LogBuffer with a label filter
+    WHEN I log lines with different labels
+    THEN it should keep only the matching labels without formatting the others
+    """
+    buffer: LogBuffer = LogBuffer(LogSettings(labels=self.td.labels))
+    buffer.add(self.td.context, 'keep', 'kept')
+    buffer.add(self.td.context, 'skip', lambda: 1 / 0)
+    assert buffer.drain()[self.td.context] == self.td.filtered_lines
+
+  def test_lazy_formatting(self) -> None:
+    """
+    GIVEN I have a LogBuffer that has reached its head limit
+    WHEN I log a callable line
+    THEN it should not be called
+    """
+    buffer: LogBuffer = LogBuffer(LogSettings(limit=1))
+    buffer.add(self.td.context, '', self.td.format_string, self.td.format_args)
+    buffer.add(self.td.context, '', lambda: 1 / 0)
+    assert buffer.drain()[self.td.context] == [('', self.td.formatted)]
+
+  def test_invalid_settings(self) -> None:
+    """
+    GIVEN I have LogSettings
+    WHEN I give it an unknown mode
+    THEN it should raise a ValueError
+    """
+    with self.assertRaises(ValueError):
+      LogSettings(mode='unknown')
+
+
+class TestLogSink(TestCase):
+  """Contains unit tests for the LogSink dataclass"""
+
+  def test_flush(self) -> None:
+    """
+    GIVEN I have a LogSink with a long flush interval
+    WHEN I queue rows and flush
+    THEN it should write them in one batch without waiting out the interval
+    """
+    batches: list[list[dict]] = []
+    sink: LogSink = LogSink(batches.append, flush_interval=60.0)
+    sink.put([{'data': '1'}])
+    sink.put([{'data': '2'}])
+    sink.flush()
+    assert sum(batches, []) == [{'data': '1'}, {'data': '2'}]
+
+  def test_batch_size(self) -> None:
+    """
+    GIVEN I have a LogSink with a small batch size
+    WHEN I queue more rows than the batch size
+    THEN it should split the writes into batches
+    """
+    batches: list[list[dict]] = []
+    sink: LogSink = LogSink(batches.append, batch_size=2, flush_interval=60.0)
+    for i in range(4):
+      sink.put([{'data': str(i)}])
+    sink.flush()
+    assert len(sum(batches, [])) == 4
+    assert all(len(batch) <= 2 for batch in batches)
+
+  def test_failed_write(self) -> None:
+    """
+    GIVEN I have a LogSink whose writer fails
+    WHEN I queue rows and flush
+    THEN it should count the failed batch without raising
+    """
+    def write(rows: list[dict]) -> None:
+      raise OSError
+
+    sink: LogSink = LogSink(write)
+    with redirect_stderr(StringIO()):
+      sink.put([{'data': '1'}])
+      sink.flush()
+    assert sink.failed_batches == 1
@@ -0,0 +1,63 @@
+import polars as pl
+
+from deltalake import Field, Schema
+from polta.metastore import Metastore
+from polta.table import Table, TableQuality
+from tempfile import TemporaryDirectory
+from time import sleep
+from unittest import TestCase
+from unittest.mock import patch
+
+from aoc_manager.tools.log_retention import get_log_runs, LogRetention, vacuum_logs
+from tests.testing_data.log_retention import TestingData
+
+
+class TestLogRetention(TestCase):
+  """Contains unit tests for the aoc.log retention policy"""
+  td: TestingData = TestingData()
+
+  def test_get_expired_run_ids(self) -> None:
+    """
+    GIVEN I have runs logged over the last 40 days
+    WHEN I find the expired runs with the default policy
+    THEN only the run older than 30 days should expire
+    """
+    retention: LogRetention = LogRetention()
+    assert retention.get_expired_run_ids(self.td.runs, self.td.now) == self.td.expired_run_ids
+
+  def test_get_expired_run_ids_naive_now(self) -> None:
+    """
+    GIVEN I have runs with UTC log timestamps
+    WHEN I find the expired runs with a naive local time
+    THEN it should compare the times instead of raising
+    """
+    retention: LogRetention = LogRetention(max_runs=self.td.max_runs)
+    assert retention.get_expired_run_ids(self.td.runs, self.td.naive_now) \
+      == self.td.ranked_run_ids
+
+  def test_vacuum_logs(self) -> None:
+    """
+    GIVEN I have an aoc.log partitioned by run with more runs than the policy keeps
+    WHEN I vacuum the logs
+    THEN the oldest run's partition should be dropped
+    """
+    with TemporaryDirectory() as main_path:
+      table: Table = Table(
+        domain='aoc',
+        quality=TableQuality.STANDARD,
+        name='log',
+        raw_schema=Schema([Field('run_id', 'string'), Field('data', 'string')]),
+        partition_keys=['run_id'],
+        metastore=Metastore(main_path)
+      )
+      for run_id in self.td.log_run_ids:
+        table.append({'run_id': run_id, 'data': 'line'})
+        # File modification times have millisecond resolution
+        sleep(0.01)
+
+      with patch('aoc_manager.tools.log_retention.tab_aoc_log', table):
+        assert sorted(get_log_runs().get_column('run_id')) == self.td.log_run_ids
+        assert vacuum_logs(LogRetention(max_runs=len(self.td.kept_run_ids))) == 1
+        assert sorted(get_log_runs().get_column('run_id')) == self.td.kept_run_ids
+      df: pl.DataFrame = table.get(sort_by=['run_id'])
+      assert df.get_column('run_id').to_list() == self.td.kept_run_ids
@@ -0,0 +1,149 @@
+import polars as pl
+
+from dataclasses import replace
+from deltalake import Field, Schema
+from os import path
+from polta.metastore import Metastore
+from polta.table import Table, TableQuality
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from aoc_manager.tools.migrations import add_missing_columns, partition_table
+
+
+class TestMigrations(TestCase):
+  """Contains unit tests for the Delta table migrations"""
+
+  def test_add_missing_columns(self) -> None:
+    """
+    GIVEN I have a Delta table created with an older schema
+    WHEN I add the columns missing from the current schema
+    THEN rows with the new columns should append, with nulls in the old rows
+    """
+    with TemporaryDirectory() as main_path:
+      metastore: Metastore = Metastore(main_path)
+      old_table: Table = Table(
+        domain='aoc',
+        quality=TableQuality.STANDARD,
+        name='solution',
+        raw_schema=Schema([Field('id', 'string'), Field('answer', 'string')]),
+        metastore=metastore
+      )
+      old_table.append({'id': 'old', 'answer': '1'})
+
+      table: Table = Table(
+        domain='aoc',
+        quality=TableQuality.STANDARD,
+        name='solution',
+        raw_schema=Schema([
+          Field('id', 'string'),
+          Field('answer', 'string'),
+          Field('cpu_time', 'float'),
+          Field('fingerprint', 'string')
+        ]),
+        metastore=metastore
+      )
+      assert add_missing_columns(table) == ['cpu_time', 'fingerprint']
+      assert add_missing_columns(table) == []
+
+      table.append({'id': 'new', 'answer': '2', 'cpu_time': 0.5, 'fingerprint': 'abc'})
+      df: pl.DataFrame = table.get(select=['id', 'fingerprint'], sort_by=['id'])
+      assert df.rows() == [('new', 'abc'), ('old', None)]
+
+  def test_partition_table(self) -> None:
+    """
+    GIVEN I have an unpartitioned Delta table created with an older schema
+    WHEN I partition it, keeping only rows with a run id
+    THEN it should be partitioned with the kept rows and nulls in the new columns
+    """
+    with TemporaryDirectory() as main_path:
+      metastore: Metastore = Metastore(main_path)
+      old_table: Table = Table(
+        domain='aoc',
+        quality=TableQuality.STANDARD,
+        name='log',
+        raw_schema=Schema([Field('run_id', 'string'), Field('data', 'string')]),
+        metastore=metastore
+      )
+      old_table.append([{'run_id': 'run', 'data': 'kept'}, {'run_id': None, 'data': 'dropped'}])
+
+      table: Table = Table(
+        domain='aoc',
+        quality=TableQuality.STANDARD,
+        name='log',
+        raw_schema=Schema([
+          Field('run_id', 'string'),
+          Field('data', 'string'),
+          Field('label', 'string')
+        ]),
+        partition_keys=['run_id'],
+        metastore=metastore
+      )
+      assert partition_table(table, keep=pl.col('run_id').is_not_null())
+      assert not partition_table(table)
+      assert table.get_as_delta_table().metadata().partition_columns == ['run_id']
+
+      table.append({'run_id': 'next', 'data': 'appended', 'label': 'new'})
+      df: pl.DataFrame = table.get(select=['run_id', 'data', 'label'], sort_by=['run_id'])
+      assert df.rows() == [('next', 'appended', 'new'), ('run', 'kept', None)]
+
+  def make_log_tables(self, metastore: Metastore) -> tuple[Table, Table]:
+    """Builds an unpartitioned log table with rows and its partitioned successor"""
+    old_table: Table = Table(
+      domain='aoc',
+      quality=TableQuality.STANDARD,
+      name='log',
+      raw_schema=Schema([Field('run_id', 'string'), Field('data', 'string')]),
+      metastore=metastore
+    )
+    old_table.append([{'run_id': 'run', 'data': 'kept'}, {'run_id': 'other', 'data': 'kept'}])
+    table: Table = Table(
+      domain='aoc',
+      quality=TableQuality.STANDARD,
+      name='log',
+      raw_schema=Schema([Field('run_id', 'string'), Field('data', 'string')]),
+      partition_keys=['run_id'],
+      metastore=metastore
+    )
+    return old_table, table
+
+  def test_partition_table_failed_rewrite(self) -> None:
+    """
+    GIVEN I have an unpartitioned Delta table
+    WHEN writing the partitioned rows fails
+    THEN the original table should be untouched and the next attempt should migrate it
+    """
+    with TemporaryDirectory() as main_path:
+      old_table, table = self.make_log_tables(Metastore(main_path))
+      with patch.object(pl.DataFrame, 'write_delta', side_effect=OSError):
+        with self.assertRaises(OSError):
+          partition_table(table)
+      assert table.get_as_delta_table().metadata().partition_columns == []
+      assert old_table.get().height == 2
+
+      assert partition_table(table)
+      assert table.get_as_delta_table().metadata().partition_columns == ['run_id']
+      assert table.get().height == 2
+      assert not path.exists(f'{table.table_path}.partitioned')
+
+  def test_partition_table_interrupted_swap(self) -> None:
+    """
+    GIVEN I have an unpartitioned Delta table
+    WHEN the swap is interrupted after the original table was moved aside
+    THEN the next attempt should swap in the partitioned rows and remove the backup
+    """
+    with TemporaryDirectory() as main_path:
+      metastore: Metastore = Metastore(main_path)
+      _, table = self.make_log_tables(metastore)
+      with patch('aoc_manager.tools.migrations._finish_swap', side_effect=[None, RuntimeError]):
+        with self.assertRaises(RuntimeError):
+          partition_table(table)
+      assert path.exists(f'{table.table_path}.unpartitioned')
+
+      # Restarting the app creates an empty table where the original used to be
+      restarted: Table = replace(table, metastore=metastore)
+      assert not partition_table(restarted)
+      assert restarted.get_as_delta_table().metadata().partition_columns == ['run_id']
+      assert restarted.get().height == 2
+      assert not path.exists(f'{table.table_path}.unpartitioned')
@@ -0,0 +1,117 @@
+from os import getpid
+from typing import Any, ClassVar
+from unittest import TestCase
+from unittest.mock import patch
+
+from aoc_manager.tools.parallel_parts import get_part_cpu_time, run_parts_in_parallel
+from aoc_manager.tools.problem_solver import override_inputs, ProblemSolver
+from aoc_manager.tools.solver_runner import execute_solver
+from tests.testing_data.parallel_parts import TestingData
+
+
+class ParallelSolver(ProblemSolver):
+  """Records the process each part ran in"""
+  parallel_parts: ClassVar[bool] = True
+
+  def __init__(self, year: str, test: bool = False, debug: bool = False, input_format: type = str,
+               mask_answers: bool = False) -> None:
+    super().__init__(
+      year=year,
+      day='1',
+      test=test,
+      debug=debug,
+      input_format=input_format,
+      mask_answers=mask_answers
+    )
+
+  def _preprocess(self) -> None:
+    self.numbers: list[int] = [int(line) for line in self.input_a_text.splitlines()]
+
+  def _solve_a(self) -> None:
+    self.log('solving in %s', '', getpid())
+    self.answer_a: tuple[int, int] = (sum(self.numbers), getpid())
+
+  def _solve_b(self) -> None:
+    self.log('solving in %s', '', getpid())
+    self.answer_b: tuple[int, int] = (max(self.numbers), getpid())
+
+
+class UnpicklableSolver(ParallelSolver):
+  def _preprocess(self) -> None:
+    super()._preprocess()
+    self.key: Any = lambda number: -number
+
+
+class TestParallelParts(TestCase):
+  """Contains unit tests for running parts in parallel processes"""
+  td: TestingData = TestingData()
+
+  def get_solver(self, solver_class: type[ParallelSolver]) -> ParallelSolver:
+    """Builds a pre-processed solver whose logs are collected in its log_rows attribute"""
+    with override_inputs(self.td.input_test):
+      solver: ParallelSolver = solver_class(year='2000', test=True, debug=True)
+    solver.log_rows = []
+    solver.log_writer = solver.log_rows.extend
+    solver.preprocess_inputs()
+    return solver
+
+  def test_run_parts_in_parallel(self) -> None:
+    """
+    GIVEN I have a pre-processed solver with parallel parts
+    WHEN I run its parts in parallel
+    THEN each part should run in its own process and both outcomes be merged
+    """
+    solver: ParallelSolver = self.get_solver(ParallelSolver)
+    errors: dict[str, str] = {}
+    assert run_parts_in_parallel(solver, errors)
+
+    assert not errors
+    (answer_a, pid_a), (answer_b, pid_b) = solver.answer_a, solver.answer_b
+    assert (answer_a, answer_b) == (self.td.answer_a, self.td.answer_b)
+    assert len({pid_a, pid_b, getpid()}) == 3
+    assert solver.run_id_a and solver.run_id_b
+    assert solver.a_processing_time > 0 and solver.b_processing_time > 0
+    assert solver.total_processing_time == solver.get_total_processing_time()
+    assert sorted(row['context'] for row in solver.log_rows) == self.td.logged_parts
+
+  def test_run_parts_in_parallel_unpicklable(self) -> None:
+    """
+    GIVEN I have a pre-processed solver whose state cannot be pickled
+    WHEN I run its parts in parallel
+    THEN it should decline so the parts can run in turn
+    """
+    solver: ParallelSolver = self.get_solver(UnpicklableSolver)
+    assert not run_parts_in_parallel(solver, {})
+    assert solver.answer_a is None and solver.answer_b is None
+
+  def test_execute_solver_phases(self) -> None:
+    """
+    GIVEN I have solvers with parallel parts, one of which cannot be pickled
+    WHEN I run both of their parts
+    THEN the parts should be reported as one parallel phase, or in turn if they ran in turn
+    """
+    for solver_class, expected_phases in [
+      (ParallelSolver, self.td.parallel_phases),
+      (UnpicklableSolver, self.td.sequential_phases)
+    ]:
+      with override_inputs(self.td.input_test):
+        solver: ParallelSolver = solver_class(year='2000', test=True)
+      solver.force = True
+      phases: list[str] = []
+      errors: dict[str, str] = execute_solver(
+        solver, 'both', on_phase=lambda phase, errors: phases.append(phase)
+      )
+      assert not errors
+      assert phases == expected_phases
+
+  def test_get_part_cpu_time(self) -> None:
+    """
+    GIVEN I have a process with a CPU-time limit that has used part of it
+    WHEN I split the remaining CPU time between the parts
+    THEN each part should get half of what is left
+    """
+    with patch('resource.getrlimit', return_value=(self.td.cpu_limit, self.td.cpu_limit + 1)), \
+        patch('resource.getrusage') as getrusage:
+      getrusage.return_value.ru_utime = self.td.cpu_used
+      getrusage.return_value.ru_stime = 0.0
+      assert get_part_cpu_time() == self.td.part_cpu_time
@@ -0,0 +1,48 @@
+import gc
+
+from unittest import TestCase
+
+from aoc_manager.tools.phase_metrics import measure_phase, PhaseMetrics
+
+
+class TestPhaseMetrics(TestCase):
+  """Contains unit tests for the phase instrumentation"""
+
+  def test_measure_phase(self) -> None:
+    """
+    GIVEN I have a block of work
+    WHEN I measure it
+    THEN it should record wall time, CPU time and GC collections
+    """
+    with measure_phase() as metrics:
+      sum(range(10_000))
+      gc.collect()
+    assert isinstance(metrics, PhaseMetrics)
+    assert metrics.wall_time_ns > 0
+    assert metrics.cpu_time_ns >= 0
+    assert metrics.gc_collections >= 1
+    assert metrics.peak_memory_bytes == 0
+
+  def test_measure_phase_trace_memory(self) -> None:
+    """
+    GIVEN I have a block of work that allocates memory
+    WHEN I measure it with memory tracing
+    THEN it should record the peak memory allocated
+    """
+    with measure_phase(trace_memory=True) as metrics:
+      data: list[int] = list(range(100_000))
+      del data
+    assert metrics.peak_memory_bytes > 100_000
+
+  def test_measure_phase_on_error(self) -> None:
+    """
+    GIVEN I have a block of work that raises
+    WHEN I measure it
+    THEN it should still record the metrics
+    """
+    try:
+      with measure_phase() as metrics:
+        raise ValueError
+    except ValueError:
+      pass
+    assert metrics.wall_time_ns > 0
@@ -0,0 +1,92 @@
+from time import perf_counter
+from unittest import TestCase
+
+from aoc_manager.tools.profiler import \
+  FunctionStats, \
+  get_profile_rows, \
+  PhaseProfile, \
+  profile_phase
+
+
+def fibonacci(n: int) -> int:
+  return n if n < 2 else fibonacci(n - 1) + fibonacci(n - 2)
+
+
+class TestProfiler(TestCase):
+  """Contains unit tests for the phase profiler"""
+
+  def test_profile_phase_off(self) -> None:
+    """
+    GIVEN I have a block of work
+    WHEN I profile it without a mode
+    THEN it should not produce a profile
+    """
+    with profile_phase() as profile:
+      fibonacci(10)
+    assert profile is None
+
+  def test_profile_phase_cprofile(self) -> None:
+    """
+    GIVEN I have a recursive block of work
+    WHEN I profile it with cProfile
+    THEN it should count every call but record no stacks to export
+    """
+    with profile_phase('cprofile') as profile:
+      fibonacci(15)
+    top: str = profile.get_top_functions(1)[0].function
+    assert top.startswith('fibonacci (test_profiler.py:')
+    assert profile.get_top_functions(1)[0].calls == 1973
+    assert all('contextlib' not in stats.function for stats in profile.functions)
+    assert profile.stacks == {}
+    assert profile.get_collapsed_stacks() == ''
+
+  def test_profile_phase_sampling(self) -> None:
+    """
+    GIVEN I have a block of work that runs for a while
+    WHEN I profile it by sampling
+    THEN its stacks should start at the profiled block
+    """
+    with profile_phase('sampling', interval=0.0005) as profile:
+      # Outlast several GIL switch intervals so the sampler is sure to get samples
+      started_at: float = perf_counter()
+      while perf_counter() - started_at < 0.1:
+        fibonacci(15)
+    assert profile.stacks
+    for stack in profile.stacks:
+      assert stack.split(';')[0].startswith('fibonacci (test_profiler.py:')
+    assert profile.get_top_functions(1)[0].self_time > 0
+
+  def test_profile_phase_unknown_mode(self) -> None:
+    """
+    GIVEN I have a block of work
+    WHEN I profile it with an unknown mode
+    THEN it should raise a ValueError
+    """
+    with self.assertRaises(ValueError):
+      with profile_phase('tracing'):
+        pass
+
+  def test_get_collapsed_stacks(self) -> None:
+    """
+    GIVEN I have a profile
+    WHEN I export its collapsed stacks
+    THEN each stack should be on its own line with its weight
+    """
+    profile: PhaseProfile = PhaseProfile(mode='sampling', stacks={'a;b': 3, 'a': 1})
+    assert profile.get_collapsed_stacks() == 'a;b 3\na 1'
+
+  def test_get_profile_rows(self) -> None:
+    """
+    GIVEN I have the profiles of a run
+    WHEN I build their rows
+    THEN there should be one ranked row per function and one row per stack
+    """
+    profile: PhaseProfile = PhaseProfile(
+      mode='sampling',
+      functions=[FunctionStats('a', 0, 0.1, 0.2), FunctionStats('b', 0, 0.2, 0.2)],
+      stacks={'a;b': 2, 'a': 1}
+    )
+    function_rows, stack_rows = get_profile_rows('run', {'a': profile}, top=1)
+    assert len(function_rows) == 1
+    assert (function_rows[0]['rank'], function_rows[0]['function']) == (1, 'b')
+    assert len(stack_rows) == len(profile.stacks)
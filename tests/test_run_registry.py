@@ -0,0 +1,109 @@
+from unittest import TestCase
+
+from aoc_manager.tools.run_registry import RunRegistry, RunState
+from aoc_manager.tools.run_result import RunResult
+from tests.testing_data.run_registry import TestingData
+
+
+class TestRunRegistry(TestCase):
+  """Contains unit tests for the RunRegistry class"""
+  td: TestingData = TestingData()
+
+  def test_create(self) -> None:
+    """
+    GIVEN I have a RunRegistry
+    WHEN I create a run
+    THEN it should be registered with its selected phases pending
+    """
+    registry: RunRegistry = RunRegistry()
+    run_id: str = registry.create(self.td.year, self.td.day, True, 'a')
+    state: RunState = registry.get(run_id)
+    assert state.statuses == self.td.created_statuses
+    assert not state.finished
+    assert state.version == 0
+
+  def test_start_phase(self) -> None:
+    """
+    GIVEN I have a registered run
+    WHEN a later phase starts
+    THEN earlier phases should be marked done or failed
+    """
+    registry: RunRegistry = RunRegistry()
+    run_id: str = registry.create(self.td.year, self.td.day, True, 'both')
+    registry.start_phase(run_id, 'p', RunResult())
+    registry.start_phase(run_id, 'b', self.td.result_with_a_error)
+    state: RunState = registry.get(run_id)
+    assert state.statuses == self.td.started_statuses
+    assert state.version == 2
+
+  def test_start_parallel_phase(self) -> None:
+    """
+    GIVEN I have a registered run of both parts
+    WHEN both parts start in parallel
+    THEN the pre-processor should be done and both parts running
+    """
+    registry: RunRegistry = RunRegistry()
+    run_id: str = registry.create(self.td.year, self.td.day, True, 'both')
+    registry.start_phase(run_id, 'p', RunResult())
+    registry.start_phase(run_id, 'ab', RunResult())
+    assert registry.get(run_id).statuses == self.td.parallel_statuses
+
+  def test_finish(self) -> None:
+    """
+    GIVEN I have a registered run
+    WHEN it finishes
+    THEN every phase should be marked and the run finished
+    """
+    registry: RunRegistry = RunRegistry()
+    run_id: str = registry.create(self.td.year, self.td.day, False, 'both')
+    registry.finish(run_id, self.td.result_with_a_error)
+    state: RunState = registry.get(run_id)
+    assert state.finished
+    assert state.statuses == self.td.finished_statuses
+    assert state.result == self.td.result_with_a_error
+
+  def test_prune(self) -> None:
+    """
+    GIVEN I have a RunRegistry with a finished-run limit
+    WHEN more runs finish than the limit
+    THEN the oldest finished runs should be dropped
+    """
+    registry: RunRegistry = RunRegistry(max_finished_runs=1)
+    first: str = registry.create(self.td.year, self.td.day, True, 'a')
+    registry.finish(first, RunResult())
+    second: str = registry.create(self.td.year, self.td.day, True, 'a')
+    registry.finish(second, RunResult())
+    assert registry.get(first) is None
+    assert registry.get(second) is not None
+
+  def test_cancel(self) -> None:
+    """
+    GIVEN I have a registered run
+    WHEN I cancel it
+    THEN its cancel event should be set
+    """
+    registry: RunRegistry = RunRegistry()
+    run_id: str = registry.create(self.td.year, self.td.day, False, 'both')
+    assert not registry.get_cancel_event(run_id).is_set()
+    registry.cancel(run_id)
+    assert registry.get_cancel_event(run_id).is_set()
+    assert not registry.get_cancel_event('unknown').is_set()
+
+  def test_get_mismatched_parts(self) -> None:
+    """
+    GIVEN I have test results with expected answers
+    WHEN I check them for mismatches
+    THEN only parts with a differing answer should mismatch
+    """
+    assert self.td.matching_result.get_mismatched_parts() == []
+    assert self.td.mismatched_result.get_mismatched_parts() == ['a']
+
+  def test_get_mismatched_parts_single_part(self) -> None:
+    """
+    GIVEN I have a test result of a Part A run with an expected Part B answer
+    WHEN I check it for mismatches
+    THEN Part B should only mismatch if it was part of the run
+    """
+    assert self.td.part_a_only_result.get_mismatched_parts() == []
+    assert self.td.part_a_selected_result.get_mismatched_parts() == []
+    assert self.td.part_b_missing_result.get_mismatched_parts() == ['b']
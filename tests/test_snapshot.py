@@ -0,0 +1,123 @@
+from glob import glob
+from os import path
+from tempfile import TemporaryDirectory
+from typing import ClassVar
+from unittest import TestCase
+from unittest.mock import patch
+
+from aoc_manager.tools.problem_solver import override_inputs, ProblemSolver
+from aoc_manager.tools.snapshot import SnapshotStore
+
+
+class SnapshotSolver(ProblemSolver):
+  snapshot_preprocess: ClassVar[bool] = True
+
+  def __init__(self, year: str, test: bool = False, debug: bool = False, input_format: type = str,
+               mask_answers: bool = False) -> None:
+    super().__init__(
+      year=year,
+      day='1',
+      test=test,
+      debug=debug,
+      input_format=input_format,
+      mask_answers=mask_answers
+    )
+
+  def _preprocess(self) -> None:
+    self.numbers: list[int] = [int(line) for line in self.input_a_text.splitlines()]
+
+
+class TestSnapshotStore(TestCase):
+  """Contains unit tests for the SnapshotStore dataclass"""
+
+  def test_save_and_load(self) -> None:
+    """
+    GIVEN I have a SnapshotStore
+    WHEN I save a snapshot and load it back
+    THEN it should return an equal copy of the state
+    """
+    with TemporaryDirectory() as root:
+      store: SnapshotStore = SnapshotStore(root=root)
+      state: dict = {'grid': [[1, 2], [3, 4]], 'start': (0, 0)}
+      assert store.save('key', state)
+      assert store.load('key') == state
+      assert store.load('missing') is None
+
+  def test_save_unpicklable(self) -> None:
+    """
+    GIVEN I have state that cannot be pickled
+    WHEN I save it
+    THEN it should skip the snapshot instead of raising
+    """
+    with TemporaryDirectory() as root:
+      store: SnapshotStore = SnapshotStore(root=root)
+      assert not store.save('key', {'step': lambda x: x + 1})
+      assert not path.exists(store.get_path('key'))
+
+  def test_prune(self) -> None:
+    """
+    GIVEN I have a SnapshotStore with a retention limit
+    WHEN I save more snapshots than the limit
+    THEN it should keep only the most recent ones
+    """
+    with TemporaryDirectory() as root:
+      store: SnapshotStore = SnapshotStore(root=root, max_snapshots=2)
+      for key in ['a', 'b', 'c']:
+        store.save(key, {'key': key})
+      kept: list[bool] = [path.exists(store.get_path(key)) for key in ['a', 'b', 'c']]
+      assert sum(kept) == 2
+      assert kept[2]
+
+  def test_save_write_error(self) -> None:
+    """
+    GIVEN I have a SnapshotStore whose root cannot be created
+    WHEN I save a snapshot
+    THEN it should skip the snapshot instead of raising
+    """
+    with TemporaryDirectory() as root:
+      blocked_root: str = path.join(root, 'file')
+      open(blocked_root, 'w').close()
+      store: SnapshotStore = SnapshotStore(root=path.join(blocked_root, 'snapshots'))
+      with patch('aoc_manager.tools.snapshot.print_exc'):
+        assert not store.save('key', {'start': (0, 0)})
+
+  def test_prune_vanished(self) -> None:
+    """
+    GIVEN I have a SnapshotStore whose snapshots are pruned by another process
+    WHEN a listed snapshot vanishes before it is pruned
+    THEN it should prune the remaining snapshots without raising
+    """
+    with TemporaryDirectory() as root:
+      store: SnapshotStore = SnapshotStore(root=root, max_snapshots=1)
+      vanished: str = store.get_path('vanished')
+      with patch(
+        'aoc_manager.tools.snapshot.glob',
+        side_effect=lambda pattern: [vanished, *glob(pattern)]
+      ):
+        for key in ['a', 'b']:
+          assert store.save(key, {'key': key})
+      assert not path.exists(store.get_path('a'))
+      assert path.exists(store.get_path('b'))
+
+  def test_restore_timing(self) -> None:
+    """
+    GIVEN I have a solver that snapshots its pre-processing
+    WHEN a second instance restores the snapshot and a third opts out of snapshots
+    THEN the restore should be timed apart from pre-processing, and the opt-out should pre-process
+    """
+    with TemporaryDirectory() as root, \
+        patch('aoc_manager.tools.problem_solver.snapshot_store', SnapshotStore(root=root)), \
+        override_inputs('1\n2'):
+      first: SnapshotSolver = SnapshotSolver(year='2000', test=True)
+      first.preprocess_inputs()
+      restored: SnapshotSolver = SnapshotSolver(year='2000', test=True)
+      restored.preprocess_inputs()
+      opted_out: SnapshotSolver = SnapshotSolver(year='2000', test=True)
+      opted_out.use_snapshots = False
+      opted_out.preprocess_inputs()
+
+    assert not first.snapshot_restored
+    assert restored.snapshot_restored and restored.numbers == [1, 2]
+    assert restored.preprocessing_time == 0.00
+    assert restored.snapshot_restore_time > 0.00
+    assert not opted_out.snapshot_restored and opted_out.preprocessing_time > 0.00
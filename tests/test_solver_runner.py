@@ -0,0 +1,129 @@
+from typing import Optional
+from unittest import TestCase
+from unittest.mock import patch
+
+from aoc_manager.tools.fingerprint import hash_solver_source
+from aoc_manager.tools.problem_solver import override_inputs, ProblemSolver
+from aoc_manager.tools.run_result import RunResult
+from aoc_manager.tools.solver_runner import execute_solver, get_run_result
+from tests.testing_data.solver_runner import TestingData
+
+
+class SumSolver(ProblemSolver):
+  def __init__(self, year: str, test: bool = False, debug: bool = False, input_format: type = str,
+               mask_answers: bool = False) -> None:
+    super().__init__(
+      year=year,
+      day='1',
+      test=test,
+      debug=debug,
+      input_format=input_format,
+      mask_answers=mask_answers
+    )
+
+  def _preprocess(self) -> None:
+    self.numbers: list[int] = [int(line) for line in self.input_a_text.splitlines()]
+
+  def _solve_a(self) -> None:
+    self.answer_a: int = sum(self.numbers)
+
+  def _solve_b(self) -> None:
+    self.answer_b: int = max(self.numbers)
+
+
+class BrokenCacheSolver(SumSolver):
+  def load_cached_solution(self, part: str) -> bool:
+    raise OSError('Error: the solution table cannot be read.')
+
+
+class TestSolverRunner(TestCase):
+  """Contains unit tests for the solver runner"""
+  td: TestingData = TestingData()
+
+  def run_solver(self, profile_mode: Optional[str]) -> RunResult:
+    """Runs both parts of the test solver on the test inputs, bypassing the answer cache"""
+    with override_inputs(self.td.input_test):
+      solver: SumSolver = SumSolver(year='2000', test=True)
+    solver.force = True
+    solver.profile_mode = profile_mode
+    errors: dict[str, str] = execute_solver(solver, 'both')
+    return get_run_result(solver, 'both', errors)
+
+  def test_get_run_result(self) -> None:
+    """
+    GIVEN I have a solver
+    WHEN I run both parts
+    THEN the result should hold both answers and a solution row per part
+    """
+    result: RunResult = self.run_solver(None)
+    assert not result.errors
+    assert (result.answer_a, result.answer_b) == (self.td.answer_a, self.td.answer_b)
+    assert [row['part'] for row in result.rows] == self.td.parts
+
+  def test_get_run_result_profiled(self) -> None:
+    """
+    GIVEN I have a solver
+    WHEN I run both parts while profiling
+    THEN the result should hold the answers and profiles but no solution rows
+    """
+    result: RunResult = self.run_solver('cprofile')
+    assert (result.answer_a, result.answer_b) == (self.td.answer_a, self.td.answer_b)
+    assert sorted(result.profiles) == ['a', 'b', 'p']
+    assert result.rows == ()
+
+  def test_get_run_result_single_part(self) -> None:
+    """
+    GIVEN I have a solver with expected answers for both parts
+    WHEN I run only Part A
+    THEN the result should record the part and not report Part B as mismatched
+    """
+    with override_inputs(self.td.input_test, str(self.td.answer_a), expected_b=self.td.wrong_b):
+      solver: SumSolver = SumSolver(year='2000', test=True)
+    solver.force = True
+    result: RunResult = get_run_result(solver, 'a', execute_solver(solver, 'a'))
+    assert result.parts == ('a',)
+    assert result.get_mismatched_parts() == []
+
+  def test_execute_solver_cache_error(self) -> None:
+    """
+    GIVEN I have a solver whose answer cache cannot be read
+    WHEN I run both parts with the cache enabled
+    THEN the lookup should count as a miss and both parts should run
+    """
+    with override_inputs(self.td.input_test):
+      solver: BrokenCacheSolver = BrokenCacheSolver(year='2000', test=True)
+    with patch('traceback.print_exc'):
+      errors: dict[str, str] = execute_solver(solver, 'both')
+    assert not errors
+    assert (solver.answer_a, solver.answer_b) == (self.td.answer_a, self.td.answer_b)
+    assert solver.cached_parts == []
+
+  def test_unreadable_source(self) -> None:
+    """
+    GIVEN I have a solver whose source file cannot be read
+    WHEN I look up and build its cached answers
+    THEN it should neither reuse nor fingerprint an answer
+    """
+    with override_inputs(self.td.input_test), \
+        patch('aoc_manager.tools.fingerprint.getsourcefile', side_effect=TypeError):
+      solver: SumSolver = SumSolver(year='2000', test=True)
+    assert solver.source_hash == ''
+    with patch('aoc_manager.tools.problem_solver.tab_can_solution') as table:
+      assert not solver.load_cached_solution('a')
+    table.get.assert_not_called()
+    execute_solver(solver, 'both')
+    assert [row['fingerprint'] for row in get_run_result(solver, 'both', {}).rows] == ['', '']
+
+  def test_source_hash(self) -> None:
+    """
+    GIVEN I have an instantiated solver
+    WHEN I build the fingerprints of its parts
+    THEN they should use the source hash taken at instantiation without hashing again
+    """
+    with override_inputs(self.td.input_test):
+      solver: SumSolver = SumSolver(year='2000', test=True)
+    assert solver.source_hash == hash_solver_source(SumSolver)
+    with patch('aoc_manager.tools.problem_solver.hash_solver_source') as hash_source:
+      fingerprints: list[str] = [solver.get_fingerprint(part) for part in self.td.parts]
+    hash_source.assert_not_called()
+    assert all(fingerprints)
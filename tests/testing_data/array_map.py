@@ -0,0 +1,24 @@
+class TestingData:
+  init_text: str = '..@@.\n@@@.@\n@@@@@\n@.@@@\n@@.@@\n'
+  # Includes rows whose total length is a multiple of the first row's width
+  uneven_texts: list[str] = ['...\n..\n', 'abc\nab\nabcd', 'ab\nabc\na\n']
+  uneven_rows: list[list[str]] = [['a', 'b'], ['a']]
+  outside_coordinates: list[tuple[int, int]] = [(5, 0), (-1, 1), (0, 5), (0, -1)]
+  init_input: list[list[str]] = [
+    ['.', '.', '@', '@', '.'],
+    ['@', '@', '@', '.', '@'],
+    ['@', '@', '@', '@', '@'],
+    ['@', '.', '@', '@', '@'],
+    ['@', '@', '.', '@', '@']
+  ]
+  init_data: bytearray = bytearray(b'..@@.@@@.@@@@@@@.@@@@@.@@')
+  init_max_x: int = 5
+  init_max_y: int = 5
+
+  get_window_center: str = '@@.\n@@@\n.@@\n'
+  get_at_cursor: str = '.'
+  get_at_cursor_down: str = '@'
+  get_at_cursor_down_and_left: None = None
+
+  find_all_dots: list[tuple[int, int]] = [(0, 0), (1, 0), (4, 0), (3, 1), (1, 3), (2, 4)]
+  mask_dots_row_0: bytearray = bytearray([1, 1, 0, 0, 1])
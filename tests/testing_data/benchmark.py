@@ -0,0 +1,14 @@
+class TestingData:
+  samples: list[float] = [3.0, 1.0, 10.0, 2.0, 4.0]
+  min_time: float = 1.0
+  median_time: float = 3.0
+  p95_time: float = 8.8
+  stddev_time: float = 3.5355339
+  mean_time: float = 4.0
+
+  single_sample: list[float] = [2.5]
+
+  input_test: str = '1\n2\n3'
+  runs: int = 3
+  warmups: int = 2
+  missing_year: int = 1900
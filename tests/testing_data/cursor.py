@@ -15,4 +15,31 @@ class TestingData:
   right_result: tuple[int, int] = (1, 6)
   down_result: tuple[int, int] = (0, 7)
 
-  jump_to: tuple[int, int] = (4, 3)
\ No newline at end of file
+  jump_to: tuple[int, int] = (4, 3)
+  heading_start: tuple[int, int] = (2, 2)
+  heading_right_turns: list[tuple[int, int]] = [(1, 0), (0, 1), (-1, 0), (0, -1)]
+  heading_left_turns: list[tuple[int, int]] = [(-1, 0), (0, 1), (1, 0), (0, -1)]
+  move_steps: int = 3
+  move_steps_result: tuple[int, int] = (2, -1)
+  diagonal_results: dict[str, tuple[int, int]] = {
+    'up_left': (1, 1),
+    'up_right': (3, 1),
+    'down_left': (1, 3),
+    'down_right': (3, 3)
+  }
+
+  ray_input: list[list[str]] = [
+    ['.', '.', '#', '.', '#'],
+    ['.', '.', '.', '.', '#'],
+    ['.', '.', '.', '.', '.'],
+    ['#', '.', '.', '.', '.'],
+    ['.', '.', '.', '.', '.']
+  ]
+  ray_results: dict[str, tuple[int, bool]] = {
+    'up': (1, True),
+    'right': (2, False),
+    'down': (2, False),
+    'left': (2, False),
+    'up_right': (1, True),
+    'down_left': (2, False)
+  }
@@ -0,0 +1,11 @@
+class TestingData:
+  conditions: dict = {'year': 2024, 'test_ind': True, 'part': ['a', 'b'], 'case_id': "it's"}
+  predicate: str = "year = 2024 AND test_ind = true AND part IN ('a', 'b') AND case_id = 'it''s'"
+
+  rows: list[dict] = [
+    {'day': 1, 'case_id': "it's"},
+    {'day': 1, 'case_id': 'other'},
+    {'day': 2, 'case_id': "it's"}
+  ]
+  delete_conditions: dict = {'day': 1, 'case_id': "it's"}
+  kept_rows: list[tuple] = [(1, 'other'), (2, "it's")]
@@ -0,0 +1,85 @@
+from typing import Optional
+
+from aoc_manager.tools.example_cases import ExampleCase
+from aoc_manager.tools.executor import ExecutionLimits
+
+
+class TestingData:
+  year: int = 1901
+  day: int = 1
+  missing_day: int = 2
+
+  solver_source: str = '''from typing import ClassVar
+
+from aoc_manager.tools.problem_solver import ProblemSolver
+
+
+class D1Solver(ProblemSolver):
+  snapshot_preprocess: ClassVar[bool] = True
+
+  def __init__(self, year: str, test: bool = False, debug: bool = False, input_format: type = str,
+               mask_answers: bool = False) -> None:
+    super().__init__(
+      year=year,
+      day='1',
+      test=test,
+      debug=debug,
+      input_format=input_format,
+      mask_answers=mask_answers
+    )
+
+  def _preprocess(self) -> None:
+    self.numbers: list[int] = [int(line) for line in self.input_a_text.splitlines()]
+
+  def _solve_a(self) -> None:
+    self.answer_a: int = sum(self.numbers)
+
+  def _solve_b(self) -> None:
+    self.answer_b: int = max(self.numbers)
+'''
+
+  saved_cases: list[dict] = [
+    {'part': 'b', 'case_id': 'small', 'input': '1\n5', 'expected': '5'},
+    {'part': 'a', 'case_id': 'example', 'input': '2\n2', 'expected': '4'}
+  ]
+  input_row: dict = {
+    'input_test_a': '1\n2\n3',
+    'expected_a': '6',
+    'input_test_b': '',
+    'expected_b': '3',
+    'full_input': ''
+  }
+  cases: list[ExampleCase] = [
+    ExampleCase('example', 'a', '2\n2', '4'),
+    ExampleCase('example', 'b', '1\n2\n3', '3'),
+    ExampleCase('small', 'b', '1\n5', '5')
+  ]
+
+  passing_case: ExampleCase = ExampleCase('sum', 'a', '1\n2\n3', '6')
+  failing_case: ExampleCase = ExampleCase('max', 'b', '1\n2\n3', '2')
+  broken_case: ExampleCase = ExampleCase('text', 'a', 'one', '1')
+  run_cases: list[ExampleCase] = [passing_case, failing_case, broken_case]
+  run_answers: list[Optional[str]] = ['6', '3', None]
+  run_passed: list[bool] = [True, False, False]
+
+  limited_source: str = solver_source.replace('''  def _solve_a(self) -> None:
+    self.answer_a: int = sum(self.numbers)
+''', '''  def _solve_a(self) -> None:
+    if self.numbers[0] < 0:
+      while True:
+        pass
+    if self.numbers[0] == 0:
+      sleep(60)
+    self.answer_a: int = sum(self.numbers)
+''').replace('from typing import ClassVar\n', 'from time import sleep\nfrom typing import ClassVar\n')
+  limits: ExecutionLimits = ExecutionLimits(timeout=4.0, cpu_time=2)
+  limited_cases: list[ExampleCase] = [
+    passing_case,
+    ExampleCase('spin', 'a', '-1', '-1'),
+    ExampleCase('hang', 'a', '0', '0')
+  ]
+  limited_errors: list[str] = [
+    '',
+    'Error: the case process was killed by SIGXCPU, likely after exceeding its 2s CPU-time limit.',
+    'Error: the case exceeded the 4.0s timeout.'
+  ]
@@ -0,0 +1,55 @@
+from signal import SIGKILL, SIGSEGV, SIGTERM, SIGXCPU
+
+
+class TestingData:
+  exit_code: int = 3
+  exited: str = 'exited with code 3 without reporting a result'
+
+  cpu_time: int = 5
+  sigxcpu: int = -SIGXCPU
+  sigkill: int = -SIGKILL
+  cpu_limited: str = 'was killed by SIGXCPU, likely after exceeding its 5s CPU-time limit'
+  killed: str = 'was killed by SIGKILL'
+
+  memory_bytes: int = 1024
+  sigsegv: int = -SIGSEGV
+  memory_limited: str = 'was killed by SIGSEGV, possibly after exceeding its 1,024 byte memory limit'
+
+  sigterm: int = -SIGTERM
+  terminated: str = 'was killed by SIGTERM'
+
+  year: int = 1902
+  day: int = 1
+  solver_source: str = '''from os import _exit
+from time import sleep
+
+from aoc_manager.tools.problem_solver import override_inputs, ProblemSolver
+
+
+class D1Solver(ProblemSolver):
+  def __init__(self, year: str, test: bool = False, debug: bool = False, input_format: type = str,
+               mask_answers: bool = False) -> None:
+    with override_inputs('1\\n2\\n3', '6'):
+      super().__init__(
+        year=year,
+        day='1',
+        test=test,
+        debug=debug,
+        input_format=input_format,
+        mask_answers=mask_answers
+      )
+
+  def _preprocess(self) -> None:
+    self.numbers: list[int] = [int(line) for line in self.input_a_text.splitlines()]
+
+  def _solve_a(self) -> None:
+    self.answer_a: int = sum(self.numbers)
+
+  def _solve_b(self) -> None:
+    {solve_b}
+'''
+  hanging_solve_b: str = 'sleep(60)'
+  crashing_solve_b: str = '_exit(3)'
+  answer_a: int = 6
+  cancelled: str = 'Error: the run was cancelled during Part B.'
+  crashed: str = 'Error: the solver process exited with code 3 without reporting a result during Part B.'
@@ -0,0 +1,13 @@
+class TestingData:
+  year: int = 1902
+
+  solver_source: str = '''from aoc_manager.tools.problem_solver import ProblemSolver
+
+
+class D{day}Solver(ProblemSolver):
+  version: int = {version}
+'''
+  broken_source: str = 'class D{day}Solver(:\n'
+  junk_files: list[str] = ['helpers.py', 'dx.py']
+
+  discovered_days: list[int] = [1, 12]
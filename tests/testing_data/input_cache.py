@@ -0,0 +1,10 @@
+class TestingData:
+  text_a: str = '123\n456\n789'
+  text_b: str = 'abc\ndef'
+  parsed_a: list[list[int]] = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
+  input_format: type = list[list[int]]
+  other_format: type = list[str]
+
+  small_max_bytes: int = 1
+  max_entries: int = 1
+  mutated_value: int = 0
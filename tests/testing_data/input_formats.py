@@ -0,0 +1,23 @@
+class TestingData:
+  lines_text: str = 'abc\ndef\n'
+  lines: list[str] = ['abc', 'def']
+  char_lists: list[list[str]] = [['a', 'b', 'c'], ['d', 'e', 'f']]
+
+  digits_text: str = '123\n456\n'
+  digit_lists: list[list[int]] = [[1, 2, 3], [4, 5, 6]]
+
+  grid_text: str = '#.#\r\n.#.\n'
+  char_grid: list[list[int]] = [[35, 46, 35], [46, 35, 46]]
+  uneven_grid_text: str = 'abc\nab\nabcd\n'
+
+  integers_text: str = 'x=3, y=-12\nz=40'
+  integers: list[int] = [3, -12, 40]
+
+  callable_text: str = '1\n\n3\n'
+  callable_output: list[int] = [1, -1, 3]
+
+  dataframe_text: str = 'a 1 x\nb 2\n'
+  dataframe_rows: list[dict[str, str | None]] = [
+    {'column_0': 'a', 'column_1': '1', 'column_2': 'x'},
+    {'column_0': 'b', 'column_1': '2', 'column_2': None}
+  ]
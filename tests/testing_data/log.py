@@ -0,0 +1,14 @@
+class TestingData:
+  context: str = 'a'
+  limit: int = 3
+  lines: int = 10
+  head_lines: list[tuple[str, str]] = [('', '0'), ('', '1'), ('', '2')]
+  ring_lines: list[tuple[str, str]] = [('', '7'), ('', '8'), ('', '9')]
+  dropped: int = 7
+
+  labels: frozenset[str] = frozenset({'keep'})
+  filtered_lines: list[tuple[str, str]] = [('keep', 'kept')]
+
+  format_string: str = 'x=%s y=%s'
+  format_args: tuple[int, int] = (1, 2)
+  formatted: str = 'x=1 y=2'
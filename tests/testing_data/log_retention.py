@@ -0,0 +1,24 @@
+from datetime import datetime, timedelta, UTC
+
+import polars as pl
+
+
+class TestingData:
+  now: datetime = datetime(2024, 12, 31, 12, tzinfo=UTC)
+  # Naive local time, as returned by datetime.now()
+  naive_now: datetime = now.astimezone().replace(tzinfo=None)
+  runs: pl.DataFrame = pl.DataFrame({
+    'run_id': ['new', 'recent', 'old', 'stale'],
+    '_logged_ts': [
+      now - timedelta(hours=1),
+      now - timedelta(days=1),
+      now - timedelta(days=2),
+      now - timedelta(days=40)
+    ]
+  }, schema={'run_id': pl.String, '_logged_ts': pl.Datetime('us', 'UTC')})
+  max_runs: int = 2
+  expired_run_ids: list[str] = ['stale']
+  ranked_run_ids: list[str] = ['old', 'stale']
+
+  log_run_ids: list[str] = ['first', 'second', 'third']
+  kept_run_ids: list[str] = ['second', 'third']
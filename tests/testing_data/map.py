@@ -38,6 +38,9 @@ class TestingData:
   init_max_y: int = 5
 
   get_output: str = '..@@.\n@@@.@\n@@@@@\n@.@@@\n@@.@@\n'
+  get_window_center: str = '@@.\n@@@\n.@@\n'
+  get_window_corner: str = '..\n@@\n'
+  get_after_set: str = '..@@.\n@@@.@\n@@#@@\n@.@@@\n@@.@@\n'
   get_at_cursor: str = '.'
   get_at_cursor_down: str = '@'
   get_at_cursor_down_and_left: None = None
@@ -0,0 +1,11 @@
+class TestingData:
+  input_test: str = '3\n1\n2'
+  answer_a: int = 6
+  answer_b: int = 3
+  logged_parts: list[str] = ['Part A', 'Part B']
+  parallel_phases: list[str] = ['p', 'ab']
+  sequential_phases: list[str] = ['p', 'a', 'b']
+
+  cpu_limit: int = 100
+  cpu_used: float = 20.0
+  part_cpu_time: int = 40
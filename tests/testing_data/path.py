@@ -0,0 +1,15 @@
+class TestingData:
+  maze_text: str = '..#..\n.#..#\n...#.\n#....\n'
+  maze_start: int = 0
+  maze_target: int = 19
+  maze_distance: int = 7
+  maze_path: list[tuple[int, int]] = [
+    (0, 0), (0, 1), (0, 2), (1, 2), (2, 2), (2, 3), (3, 3), (4, 3)
+  ]
+  maze_corner: int = 4
+  maze_corner_distance: int = 8
+  maze_vertical_cost: int = 3
+
+  sealed_text: str = '.#.\n##.\n...\n'
+  sealed_start: int = 8
+  sealed_cell: int = 0
@@ -0,0 +1,29 @@
+from aoc_manager.tools.grid.regions import Region
+
+
+class TestingData:
+  garden_text: str = 'AAAA\nBBCD\nBBCC\nEEEC\n'
+  garden_labels: list[int] = [0, 0, 0, 0, 1, 1, 2, 3, 1, 1, 2, 2, 4, 4, 4, 2]
+  garden_regions: list[Region] = [
+    Region(label=0, symbol='A', area=4, perimeter=10, sides=4, bounding_box=(0, 0, 3, 0)),
+    Region(label=1, symbol='B', area=4, perimeter=8, sides=4, bounding_box=(0, 1, 1, 2)),
+    Region(label=2, symbol='C', area=4, perimeter=10, sides=8, bounding_box=(2, 1, 3, 3)),
+    Region(label=3, symbol='D', area=1, perimeter=4, sides=4, bounding_box=(3, 1, 3, 1)),
+    Region(label=4, symbol='E', area=3, perimeter=8, sides=4, bounding_box=(0, 3, 2, 3))
+  ]
+
+  holes_text: str = 'OOOOO\nOXOXO\nOOOOO\nOXOXO\nOOOOO\n'
+  holes_outer: Region = Region(
+    label=0, symbol='O', area=21, perimeter=36, sides=20, bounding_box=(0, 0, 4, 4)
+  )
+  holes_region_count: int = 5
+
+  large_text: str = (
+    'RRRRIICCFF\nRRRRIICCCF\nVVRRRCCFFF\nVVRCCCJFFF\nVVVVCJJCFE\n'
+    'VVIVCCJJEE\nVVIIICJJEE\nMIIIIIJJEE\nMIIISIJEEE\nMMMISSJEEE\n'
+  )
+  large_perimeter_price: int = 1930
+  large_sides_price: int = 1206
+
+  ignored_text: str = 'A.A\n.A.\nA.A\n'
+  ignored_region_count: int = 5
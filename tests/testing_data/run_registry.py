@@ -0,0 +1,28 @@
+from aoc_manager.tools.run_result import RunResult
+
+
+class TestingData:
+  year: int = 2024
+  day: int = 6
+
+  created_statuses: dict[str, str] = {'p': 'pending', 'a': 'pending'}
+  result_with_a_error: RunResult = RunResult(errors={'a': 'Traceback'})
+  started_statuses: dict[str, str] = {'p': 'done', 'a': 'error', 'b': 'running'}
+  finished_statuses: dict[str, str] = {'p': 'done', 'a': 'error', 'b': 'done'}
+  parallel_statuses: dict[str, str] = {'p': 'done', 'a': 'running', 'b': 'running'}
+
+  matching_result: RunResult = RunResult(
+    answer_a=41, answer_b='6', expected_a='41', expected_b='6'
+  )
+  mismatched_result: RunResult = RunResult(
+    answer_a=40, answer_b=None, expected_a='41', expected_b='', errors={'b': 'Traceback'}
+  )
+  part_a_only_result: RunResult = RunResult(
+    test=True, answer_a='41', answer_b=None, expected_a='41', expected_b='6'
+  )
+  part_a_selected_result: RunResult = RunResult(
+    test=True, parts=('a',), answer_a='41', answer_b=None, expected_a='41', expected_b='6'
+  )
+  part_b_missing_result: RunResult = RunResult(
+    test=True, parts=('a', 'b'), answer_a='41', answer_b=None, expected_a='41', expected_b='6'
+  )
@@ -0,0 +1,6 @@
+class TestingData:
+  input_test: str = '4\n5\n6'
+  answer_a: int = 15
+  answer_b: int = 6
+  wrong_b: str = '7'
+  parts: list[str] = ['a', 'b']